@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
 from enum import Enum
+from typing import Any, Iterable, Iterator
 
 from .utils import update_dataclass_from_dict
+from .ResourceStore import ResourceStore
 from .top_level import (
     ServerConfig,
     LoggingConfig,
@@ -10,10 +12,12 @@ from .top_level import (
     ResourceConfigTemplate,
 )
 from ..utils.helper_functions import datetime_to_string
+from ..utils.yaml_io import iter_dict_config_sections
 from .top_level.utils import InlineList
 from .top_level.providers import ProviderTemplate
 from .top_level.providers.records import ProviderTypes
-from .top_level.ResourceConfigTemplate import ResourceTypesEnum
+
+TOP_LEVEL_SECTIONS = ("server", "logging", "metadata")
 
 
 @dataclass(kw_only=True)
@@ -26,97 +30,47 @@ class ConfigData:
     server: ServerConfig = field(default_factory=lambda: ServerConfig())
     logging: LoggingConfig = field(default_factory=lambda: LoggingConfig())
     metadata: MetadataConfig = field(default_factory=lambda: MetadataConfig())
-    resources: dict[str, ResourceConfigTemplate | dict] = field(
-        default_factory=lambda: {}
-    )
+    resources: ResourceStore = field(default_factory=lambda: ResourceStore())
 
     def set_data_from_yaml(self, dict_content: dict):
         """Parse YAML file content and overwride .config_data properties where available."""
+        self.set_data_from_yaml_sections(iter_dict_config_sections(dict_content))
+
+    def set_data_from_yaml_sections(
+        self, sections: Iterable[tuple[str, str | None, Any]]
+    ):
+        """Overwride .config_data properties from YAML sections, as they are parsed (see 'iter_yaml_config_sections').
+        Resources are only stored as they arrive, and converted to ResourceConfigTemplate when first accessed.
+        """
 
         # Read the content of the YAML file for each of the top level properties
-        server_config = dict_content.get("server", {})
-        logging_config = dict_content.get("logging", {})
-        metadata_config = dict_content.get("metadata", {})
-        resources_config = dict_content.get("resources", {})
-        resources_dict_list = [{k: v} for k, v in resources_config.items()]
+        top_level_sections = {section: {} for section in TOP_LEVEL_SECTIONS}
+
+        self.resources = ResourceStore()
+        for section_name, resource_name, data in sections:
+            if section_name in top_level_sections:
+                top_level_sections[section_name] = data
+            elif section_name == "resources" and resource_name is not None:
+                self.resources.add_from_yaml(resource_name, data)
 
         # Update the dataclass properties with the new values
         # keep track of missing values of wrong types (replaced with defaults)
         default_fields = []
         wrong_types = []
         all_missing_props = []
-
-        defaults_server, wrong_types_server, all_missing_props_server = (
-            update_dataclass_from_dict(self.server, server_config, "server")
-        )
-
-        defaults_logging, wrong_types_logging, all_missing_props_logging = (
-            update_dataclass_from_dict(self.logging, logging_config, "logging")
-        )
-
-        defaults_metadata, wrong_types_metadata, all_missing_props_metadata = (
-            update_dataclass_from_dict(self.metadata, metadata_config, "metadata")
-        )
-
-        default_fields.extend(defaults_server)
-        default_fields.extend(defaults_logging)
-        default_fields.extend(defaults_metadata)
-        wrong_types.extend(wrong_types_server)
-        wrong_types.extend(wrong_types_logging)
-        wrong_types.extend(wrong_types_metadata)
-        all_missing_props.extend(all_missing_props_server)
-        all_missing_props.extend(all_missing_props_logging)
-        all_missing_props.extend(all_missing_props_metadata)
-
-        self.resources = {}
-        for res_config in resources_dict_list:
-            if isinstance(res_config, dict):
-                resource_instance_name = next(iter(res_config))
-                resource_data = res_config[resource_instance_name]
-
-                # only cast to ResourceConfigTemplate, if it's supported Resource type (e.g. 'collection, stac-collection')
-                if resource_data.get("type") in [e.value for e in ResourceTypesEnum]:
-
-                    # Create a new ResourceConfigTemplate instance and update with available values
-                    new_resource_item = ResourceConfigTemplate.init_with_name(
-                        instance_name=resource_instance_name
-                    )
-                    (
-                        defaults_resource,
-                        wrong_types_resource,
-                        all_missing_props_resource,
-                    ) = update_dataclass_from_dict(
-                        new_resource_item,
-                        resource_data,
-                        f"resources.{resource_instance_name}",
-                    )
-                    default_fields.extend(defaults_resource)
-                    wrong_types.extend(wrong_types_resource)
-                    all_missing_props.extend(all_missing_props_resource)
-
-                    # Exceptional check: verify that all list items of BBox are integers, and len(list)=4 or 6
-                    if not new_resource_item.validate_reassign_bbox():
-                        wrong_types.append(
-                            f"resources.{resource_instance_name}.extents.spatial.bbox"
-                        )
-
-                    # reorder providers to move read-only to the end of the list
-                    # this is needed to not accidentally match read-only providers when deleting a provider
-                    new_resource_item.providers.sort(key=lambda x: isinstance(x, dict))
-                else:
-                    # keep as dict if unsopported resource type (e.g. 'process')
-                    new_resource_item = resource_data
-
-                self.resources[resource_instance_name] = new_resource_item
-
-            else:
-                wrong_types.append(
-                    [f"Skipping invalid resource entry: {str(res_config)[:40]}"]
+        for section_name, section_data in top_level_sections.items():
+            defaults_section, wrong_types_section, all_missing_props_section = (
+                update_dataclass_from_dict(
+                    getattr(self, section_name), section_data, section_name
                 )
-                all_missing_props.append(str(res_config)[:40])
+            )
+            default_fields.extend(defaults_section)
+            wrong_types.extend(wrong_types_section)
+            all_missing_props.extend(all_missing_props_section)
 
         # add dynamic property, so that it is not included in asdict()
         # ideally, we should overwrite the __init__ method, but it is not so important property
+        # resources messages are added on access, see ResourceStore.get_messages()
         self._defaults_used = default_fields
         self._wrong_types = wrong_types
         self._all_missing_props = all_missing_props
@@ -125,23 +79,70 @@ class ConfigData:
     def defaults_message(self):
         # taking precaution here because the property was not explicitly defined in the __init__ method
         if hasattr(self, "_defaults_used"):
-            return self._defaults_used
+            return self._defaults_used + self.resources.get_messages()[0]
         return []
 
     @property
     def error_message(self):
         # taking precaution here because the property was not explicitly defined in the __init__ method
         if hasattr(self, "_wrong_types"):
-            return self._wrong_types
+            return self._wrong_types + self.resources.get_messages()[1]
         return []
 
     @property
     def all_missing_props(self):
         # taking precaution here because the property was not explicitly defined in the __init__ method
         if hasattr(self, "_all_missing_props"):
-            return self._all_missing_props
+            return self._all_missing_props + self.resources.get_messages()[2]
         return []
 
+    def get_loaded_messages(self) -> tuple[list, list, list]:
+        """Get (defaults used, wrong types, all missing props) of top-level sections and the resources hydrated so far,
+        without hydrating other resources."""
+        if not hasattr(self, "_all_missing_props"):
+            return [], [], []
+
+        defaults_resources, wrong_types_resources, all_missing_props_resources = (
+            self.resources.get_hydrated_messages()
+        )
+        return (
+            self._defaults_used + defaults_resources,
+            self._wrong_types + wrong_types_resources,
+            self._all_missing_props + all_missing_props_resources,
+        )
+
+    def iter_resources_plain_data(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over (name, plain resource data), without hydrating resources (see ResourceStore.get_plain)."""
+        for name in self.resources:
+            yield name, self.get_resource_plain_data(name)
+
+    def get_resource_plain_data(self, name: str):
+        return self.resources.get_plain(name, self._asdict_variants)
+
+    def get_changed_sections(self, previous: "ConfigData | None") -> set[str]:
+        """Get the sections that differ from the 'previous' config data: 'server', 'logging', 'metadata',
+        'resources' (if the list of resource names changed) and 'resources.<name>' for each changed resource.
+        All sections are changed if there is no previous data."""
+        if previous is None:
+            return {*TOP_LEVEL_SECTIONS, "resources"} | {
+                f"resources.{name}" for name in self.resources
+            }
+
+        changed_sections = {
+            section
+            for section in TOP_LEVEL_SECTIONS
+            if getattr(self, section) != getattr(previous, section)
+        }
+        if list(self.resources) != list(previous.resources):
+            changed_sections.add("resources")
+        changed_sections.update(
+            f"resources.{name}"
+            for name in self.resources.get_changed_names(
+                previous.resources, self._asdict_variants
+            )
+        )
+        return changed_sections
+
     def asdict_enum_safe(self, obj, datetime_to_str=False):
         """Overwriting dataclass 'asdict' fuction to replace Enums with strings."""
         if is_dataclass(obj):
@@ -159,6 +160,11 @@ class ConfigData:
             return obj.value
         elif isinstance(obj, InlineList):
             return obj
+        elif isinstance(obj, ResourceStore):
+            # hydrates the resources that were not accessed yet
+            return {
+                k: self.asdict_enum_safe(v, datetime_to_str) for k, v in obj.items()
+            }
         elif isinstance(obj, list):
             return [self.asdict_enum_safe(v, datetime_to_str) for v in obj]
         elif isinstance(obj, dict):
@@ -174,6 +180,79 @@ class ConfigData:
             else:
                 return obj
 
+    def asdict_enum_safe_variants(self) -> tuple[dict, dict]:
+        """Serialize ConfigData with 'asdict_enum_safe' in a single walk, returning both
+        the datetime_to_str=True and datetime_to_str=False dictionaries.
+        Resources are serialized once and reused from cache until modified (see ResourceStore.mark_dirty),
+        so the returned dictionaries must not be modified."""
+        str_data = {}
+        native_data = {}
+        for f in fields(self):
+            if f.name == "resources":
+                str_data[f.name] = {}
+                native_data[f.name] = {}
+                for res_name in self.resources:
+                    str_data[f.name][res_name], native_data[f.name][res_name] = (
+                        self.resources.get_serialized(res_name, self._asdict_variants)
+                    )
+            else:
+                value = getattr(self, f.name)
+                if value is not None:
+                    str_data[f.name], native_data[f.name] = self._asdict_variants(value)
+
+        return str_data, native_data
+
+    def _asdict_variants(self, obj) -> tuple[Any, Any]:
+        """Return (asdict_enum_safe(obj, True), asdict_enum_safe(obj, False)) from one walk.
+        Subtrees without datetime values are shared by both results."""
+        if is_dataclass(obj):
+            items = []
+            for f in fields(obj):
+                value = getattr(obj, f.name)
+
+                key = f.name
+                if key == "linked__data":
+                    key = "linked-data"
+                if value is not None:
+                    items.append((key, value))
+            return self._dict_variants(items)
+        elif isinstance(obj, Enum):
+            return obj.value, obj.value
+        elif isinstance(obj, InlineList):
+            # copy, so that the cached output is not changed together with the resource
+            inline_list = InlineList(obj)
+            return inline_list, inline_list
+        elif isinstance(obj, list):
+            str_list = []
+            native_list = []
+            for v in obj:
+                str_value, native_value = self._asdict_variants(v)
+                str_list.append(str_value)
+                native_list.append(native_value)
+            if all(s is n for s, n in zip(str_list, native_list)):
+                return str_list, str_list
+            return str_list, native_list
+        elif isinstance(obj, dict):
+            return self._dict_variants(obj.items())
+        elif isinstance(obj, datetime):
+            return datetime_to_string(obj), obj
+        else:
+            return obj, obj
+
+    def _dict_variants(self, items: Iterable[tuple[Any, Any]]) -> tuple[dict, dict]:
+        str_dict = {}
+        native_dict = {}
+        shared = True
+        for k, v in items:
+            str_key, native_key = self._asdict_variants(k)
+            str_value, native_value = self._asdict_variants(v)
+            str_dict[str_key] = str_value
+            native_dict[native_key] = native_value
+            shared = shared and str_key is native_key and str_value is native_value
+        if shared:
+            return str_dict, str_dict
+        return str_dict, native_dict
+
     def add_new_resource(self) -> str:
         """Add a placeholder resource."""
         new_name = "new_resource"
@@ -184,7 +263,7 @@ class ConfigData:
 
     def delete_resource(self, dialog):
         if dialog.current_res_name in self.resources:
-            self.resources.pop(dialog.current_res_name)
+            del self.resources[dialog.current_res_name]
 
     def set_validate_new_provider_data(
         self,
@@ -196,12 +275,15 @@ class ConfigData:
         """Adds a provider data to the resource. Called on Save click from New Providere window."""
 
         # initialize provider; assign ui_dict data to the provider instance
-        new_provider = ProviderTemplate.init_provider_from_type(provider_type)
+        new_provider = ProviderTemplate.init_provider_from_type(
+            provider_type, values.get("name")
+        )
         new_provider.assign_ui_dict_to_provider_data_on_save(values)
 
         # if incomplete data, remove Provider from ConfigData and show Warning
         invalid_props = new_provider.get_invalid_properties()
         if len(invalid_props) == 0:
+            self.resources.mark_dirty(res_name)
             if provider_index is None:
                 self.resources[res_name].providers.append(new_provider)
             else:
@@ -0,0 +1,316 @@
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Callable, Iterator
+
+from .utils import update_dataclass_from_dict
+from .top_level import ResourceConfigTemplate
+from .top_level.ResourceConfigTemplate import ResourceTypesEnum
+from .top_level.utils import InlineList, bbox_from_list
+
+# placeholder for resources that are still kept as raw YAML data
+_NOT_HYDRATED = object()
+
+SUPPORTED_RESOURCE_TYPES = [e.value for e in ResourceTypesEnum]
+
+
+@dataclass(kw_only=True)
+class ResourceSummary:
+    """Basic resource info for the preview, available without converting the resource to ResourceConfigTemplate."""
+
+    type: str | None
+    title: str | dict
+    description: str | dict
+    bbox: InlineList
+    supported: bool
+
+
+class ResourceStore(MutableMapping):
+    """Ordered mapping of resource names to ResourceConfigTemplate (or dict, for unsupported resource types).
+
+    Resources read from YAML are kept as raw dictionaries until they are accessed (for editing, validation
+    or serialization), and only then converted to ResourceConfigTemplate ('hydrated').
+    Deserialization messages of each resource are produced on hydration.
+
+    Resource data is stored by a stable entry key instead of the name, so a resource is renamed in place
+    (see 'rename'), keeping its position and cached data, without touching the other resources.
+    """
+
+    def __init__(self, resources: dict | None = None):
+        # entry keys of the names, and names of the entry keys (in the order of the YAML file)
+        self._keys: dict[str, int] = {}
+        self._names: dict[int, str] = {}
+        self._next_key = count()
+
+        # by entry key, in the order of the resources
+        self._resources: dict[int, Any] = {}
+        self._raw: dict[int, dict] = {}
+        # (defaults used, wrong types, all missing props) per resource, in the order of the YAML file
+        self._messages: dict[int, tuple[list, list, list] | None] = {}
+        # (datetimes as strings, datetimes as objects) serialized dictionaries of unmodified resources
+        self._serialized: dict[int, tuple[Any, Any]] = {}
+
+        # called with (old name, new name) after a resource is renamed, see 'add_rename_listener'
+        self._rename_listeners: list[Callable[[str, str], None]] = []
+
+        if resources:
+            self.update(resources)
+
+    def _key(self, name: str) -> int:
+        """Entry key of the name, added if the name is new."""
+        key = self._keys.get(name)
+        if key is None:
+            key = self._keys[name] = next(self._next_key)
+            self._names[key] = name
+        return key
+
+    def _resource_key(self, name: str) -> int:
+        """Entry key of the resource, KeyError if there is no such resource."""
+        key = self._keys.get(name)
+        if key is None or key not in self._resources:
+            raise KeyError(name)
+        return key
+
+    def add_from_yaml(self, name: str, resource_data):
+        """Add a resource from YAML data, without converting it to ResourceConfigTemplate yet."""
+
+        key = self._key(name)
+        if not isinstance(resource_data, dict):
+            self._messages[key] = (
+                [],
+                [[f"Skipping invalid resource entry: {str(resource_data)[:40]}"]],
+                [str(resource_data)[:40]],
+            )
+            return
+
+        # keep as dict if unsopported resource type (e.g. 'process')
+        if resource_data.get("type") not in SUPPORTED_RESOURCE_TYPES:
+            self._resources[key] = resource_data
+            self._messages[key] = ([], [], [])
+            return
+
+        self._resources[key] = _NOT_HYDRATED
+        self._raw[key] = resource_data
+        self._messages[key] = None
+
+    def is_hydrated(self, name: str) -> bool:
+        return self._resources[self._resource_key(name)] is not _NOT_HYDRATED
+
+    def summary(self, name: str) -> ResourceSummary:
+        """Get the resource type, title, description and bbox, without hydrating the resource."""
+        key = self._resource_key(name)
+        resource = self._resources[key]
+
+        if resource is _NOT_HYDRATED:
+            raw = self._raw[key]
+            spatial = (raw.get("extents") or {}).get("spatial") or {}
+            try:
+                bbox = bbox_from_list(spatial.get("bbox"))
+            except (TypeError, ValueError):
+                bbox = InlineList([-180, -90, 180, 90])
+
+            return ResourceSummary(
+                type=raw.get("type"),
+                title=_str_or_dict(raw.get("title")),
+                description=_str_or_dict(raw.get("description")),
+                bbox=bbox,
+                supported=True,
+            )
+
+        if isinstance(resource, dict):
+            return ResourceSummary(
+                type=resource.get("type"),
+                title="",
+                description="",
+                bbox=InlineList([-180, -90, 180, 90]),
+                supported=False,
+            )
+
+        return ResourceSummary(
+            type=resource.type.value,
+            title=resource.title,
+            description=resource.description,
+            bbox=resource.extents.spatial.bbox,
+            supported=True,
+        )
+
+    def get_messages(self, names: list[str] | None = None) -> tuple[list, list, list]:
+        """Get the deserialization messages (defaults used, wrong types, all missing props) of the given resources
+        (all resources by default), in the order of the YAML file. Resources are hydrated if needed.
+        """
+
+        if names is None:
+            keys = list(self._messages)
+        else:
+            keys = [self._keys[name] for name in names if name in self._keys]
+        return self._get_messages(keys)
+
+    def get_hydrated_messages(self) -> tuple[list, list, list]:
+        """Get the deserialization messages of the resources hydrated so far."""
+        return self._get_messages(
+            [key for key, messages in self._messages.items() if messages is not None]
+        )
+
+    def _get_messages(self, keys: list[int]) -> tuple[list, list, list]:
+        default_fields = []
+        wrong_types = []
+        all_missing_props = []
+        for key in keys:
+            if self._messages.get(key) is None and key in self._raw:
+                self._hydrate(key)
+
+            defaults_resource, wrong_types_resource, all_missing_props_resource = (
+                self._messages.get(key) or ([], [], [])
+            )
+            default_fields.extend(defaults_resource)
+            wrong_types.extend(wrong_types_resource)
+            all_missing_props.extend(all_missing_props_resource)
+
+        return default_fields, wrong_types, all_missing_props
+
+    def mark_dirty(self, name: str):
+        """Drop the cached serialization of the resource. Call whenever the resource is modified."""
+        self._serialized.pop(self._keys.get(name), None)
+
+    def get_serialized(
+        self, name: str, serializer: Callable[[Any], tuple[Any, Any]]
+    ) -> tuple[Any, Any]:
+        """Get the serialized resource from cache, or serialize it (hydrating if needed) and cache the result.
+        Returned dictionaries are shared with the cache and must not be modified."""
+        key = self._resource_key(name)
+        serialized = self._serialized.get(key)
+        if serialized is None:
+            serialized = self._serialized[key] = serializer(self[name])
+        return serialized
+
+    def get_plain(self, name: str, serializer: Callable[[Any], tuple[Any, Any]]):
+        """Get the resource as plain data without hydrating it: the raw YAML data, or the (cached) serialization.
+        Returned data must not be modified."""
+        raw = self._raw.get(self._resource_key(name))
+        if raw is not None:
+            return raw
+        return self.get_serialized(name, serializer)[1]
+
+    def get_changed_names(
+        self,
+        previous: "ResourceStore",
+        serializer: Callable[[Any], tuple[Any, Any]],
+    ) -> set[str]:
+        """Get the names of resources added, removed or changed compared to the 'previous' store.
+        Resources that are still raw in both stores are compared as raw YAML data, without hydration,
+        others by their (cached) serialization."""
+        names = set(self)
+        previous_names = set(previous)
+        changed = names ^ previous_names
+        for name in names & previous_names:
+            raw = self._raw.get(self._keys[name])
+            previous_raw = previous._raw.get(previous._keys[name])
+            if raw is not None and previous_raw is not None:
+                same = raw == previous_raw
+            else:
+                same = (
+                    self.get_serialized(name, serializer)[1]
+                    == previous.get_serialized(name, serializer)[1]
+                )
+            if not same:
+                changed.add(name)
+        return changed
+
+    def add_rename_listener(self, listener: Callable[[str, str], None]):
+        """Call 'listener' with (old name, new name) after each rename (e.g. to update a list model)."""
+        self._rename_listeners.append(listener)
+
+    def rename(self, old_name: str, new_name: str):
+        """Change the resource key to a new alias, preserving the order. Only the name of the resource entry
+        changes: its data, cached serialization and messages are kept, and other resources are not touched.
+        Raises ValueError if another resource already has the new name."""
+        if old_name == new_name:
+            return
+
+        key = self._resource_key(old_name)
+        if new_name in self:
+            raise ValueError(f"Resource '{new_name}' already exists")
+        # the new name may still refer to the messages of an invalid YAML entry (not a resource)
+        self._keys.pop(new_name, None)
+
+        del self._keys[old_name]
+        self._keys[new_name] = key
+        self._names[key] = new_name
+
+        for listener in self._rename_listeners:
+            listener(old_name, new_name)
+
+    def _hydrate(self, key: int) -> ResourceConfigTemplate:
+        """Convert the raw YAML data of the resource entry to ResourceConfigTemplate, record messages."""
+        name = self._names[key]
+        resource_data = self._raw.pop(key)
+
+        # Create a new ResourceConfigTemplate instance and update with available values
+        new_resource_item = ResourceConfigTemplate.init_with_name(instance_name=name)
+        (
+            defaults_resource,
+            wrong_types_resource,
+            all_missing_props_resource,
+        ) = update_dataclass_from_dict(
+            new_resource_item,
+            resource_data,
+            f"resources.{name}",
+        )
+
+        # Exceptional check: verify that all list items of BBox are integers, and len(list)=4 or 6
+        if not new_resource_item.validate_reassign_bbox():
+            wrong_types_resource.append(f"resources.{name}.extents.spatial.bbox")
+
+        # reorder providers to move read-only to the end of the list
+        # this is needed to not accidentally match read-only providers when deleting a provider
+        new_resource_item.providers.sort(key=lambda x: isinstance(x, dict))
+
+        self._resources[key] = new_resource_item
+        self._messages[key] = (
+            defaults_resource,
+            wrong_types_resource,
+            all_missing_props_resource,
+        )
+        return new_resource_item
+
+    def __getitem__(self, name: str):
+        key = self._resource_key(name)
+        resource = self._resources[key]
+        if resource is _NOT_HYDRATED:
+            resource = self._hydrate(key)
+        return resource
+
+    def __setitem__(self, name: str, resource):
+        key = self._key(name)
+        self._resources[key] = resource
+        self._serialized.pop(key, None)
+        self._raw.pop(key, None)
+        if self._messages.get(key) is None:
+            self._messages[key] = ([], [], [])
+
+    def __delitem__(self, name: str):
+        key = self._resource_key(name)
+        del self._resources[key]
+        self._serialized.pop(key, None)
+        self._raw.pop(key, None)
+        # a resource added later with the same name gets a new entry, without the messages of the deleted one
+        self._messages.pop(key, None)
+        del self._keys[name]
+        del self._names[key]
+
+    def __iter__(self) -> Iterator[str]:
+        names = self._names
+        return (names[key] for key in self._resources)
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def __contains__(self, name) -> bool:
+        return self._keys.get(name) in self._resources
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)})"
+
+
+def _str_or_dict(value) -> str | dict:
+    return value if isinstance(value, (str, dict)) else ""
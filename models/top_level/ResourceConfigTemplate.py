@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
-from .providers import ProviderPostgresql, ProviderMvtProxy, ProviderWmsFacade
+from .providers import ProviderTemplate
 from .utils import (
     InlineList,
     bbox_from_list,
@@ -104,10 +104,9 @@ class ResourceConfigTemplate:
     extents: ResourceExtentsConfig = field(
         default_factory=lambda: ResourceExtentsConfig()
     )
-    # for providers, the types have to be explicitly listed so they are picked up on deserialization
-    providers: list[
-        ProviderPostgresql | ProviderMvtProxy | ProviderWmsFacade | dict
-    ] = field(default_factory=lambda: [])
+    # providers are cast to the class registered for their type and name (see providers.registry),
+    # unsupported providers are kept as dict
+    providers: list[ProviderTemplate | dict] = field(default_factory=lambda: [])
 
     # optional
     links: list[ResourceLinkTemplate] | None = None
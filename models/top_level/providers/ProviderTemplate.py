@@ -1,8 +1,56 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, MISSING
+import json
 from types import UnionType
-from typing import Any, Type, get_type_hints, get_args
+from typing import Any, Callable, ClassVar, Type, get_type_hints, get_args
 from .records import ProviderTypes
+from .registry import get_provider_class
+from ..utils import is_valid_string
+
+
+@dataclass(frozen=True)
+class ProviderField:
+    """Precomputed metadata of a provider property edited in the provider UI (see ProviderTemplate.get_fields)."""
+
+    path: str
+    type: Any
+    default: Any
+    mandatory: bool
+    # special widget type: 'QComboBox', 'disabled' or None
+    widget: str | None
+    # row of 'ui_elements_grid': label, data_type, default, special_widget_type, placeholder
+    ui_spec: tuple
+    # attribute names along the path, and the dataclasses created when a parent along the path is None
+    attrs: tuple[str, ...]
+    parent_classes: tuple[type, ...]
+    # converts the text of the UI list entry to the property value
+    from_text: Callable[[str], Any]
+
+    def get_value(self, provider):
+        """Value of the property, None if a parent along the path is None."""
+        value = provider
+        for attr in self.attrs:
+            value = getattr(value, attr)
+            if value is None:
+                return None
+        return value
+
+    def set_value(self, provider, value):
+        """Assign the value, creating the missing parents along the path (unless the value is None)."""
+        parent = provider
+        for attr, parent_class in zip(self.attrs[:-1], self.parent_classes):
+            child = getattr(parent, attr)
+            if child is None:
+                if value is None:
+                    return
+                child = parent_class()
+                setattr(parent, attr, child)
+            parent = child
+        setattr(parent, self.attrs[-1], value)
+
+
+# fields of each provider class, computed once from 'ui_elements_grid'
+_PROVIDER_FIELDS: dict[type, tuple[ProviderField, ...]] = {}
 
 
 # this class doesn't need to be initialized on its own, only the subclasses
@@ -19,6 +67,9 @@ class ProviderTemplate(ABC):
     # optional, but with assumed default value:
     crs: list | None = None
 
+    # values assigned on read for empty UI values, by field path (None for all other fields)
+    empty_ui_values: ClassVar[dict[str, Callable[[], Any]]] = {}
+
     @abstractmethod
     def ui_elements_grid(cls):
         """Return specifications for the UI dialog for the given Resource Provider.
@@ -62,20 +113,26 @@ class ProviderTemplate(ABC):
 
         return field_path, field_type, default
 
-    @staticmethod
-    def init_provider_from_type(provider_type: ProviderTypes):
-        """Return empty instance of the subclass, based on the requested type.
-        Imports are inside the method to avoid circular imports from subclasses."""
-        from . import ProviderPostgresql, ProviderWmsFacade, ProviderMvtProxy
-
-        if provider_type == ProviderTypes.FEATURE:
-            return ProviderPostgresql()
+    @classmethod
+    def get_fields(cls) -> tuple[ProviderField, ...]:
+        """Fields of the provider UI, in the order of 'ui_elements_grid', computed once per class.
+        Shared by the UI specs, data packing, assigning and validation."""
+        provider_fields = _PROVIDER_FIELDS.get(cls)
+        if provider_fields is None:
+            provider_fields = _PROVIDER_FIELDS[cls] = tuple(
+                _compile_field(cls, ui_spec) for ui_spec in cls.ui_elements_grid()
+            )
+        return provider_fields
 
-        elif provider_type == ProviderTypes.MAP:
-            return ProviderWmsFacade()
-
-        elif provider_type == ProviderTypes.TILE:
-            return ProviderMvtProxy()
+    @staticmethod
+    def init_provider_from_type(provider_type: ProviderTypes, name: str | None = None):
+        """Return empty instance of the subclass registered for the type and name (see registry),
+        or of the default subclass of the type if the name is not given or not registered.
+        """
+        provider_class = get_provider_class(provider_type, name) or get_provider_class(
+            provider_type
+        )
+        return provider_class()
 
     @abstractmethod
     def assign_ui_dict_to_provider_data_on_save(
@@ -85,13 +142,91 @@ class ProviderTemplate(ABC):
         Used on Save click from New Provider window."""
         pass
 
-    @abstractmethod
-    def assign_value_list_to_provider_data_on_read(self):
-        """Takes a list of values specific to provider type, and assigns them to the class instance.
-        Used on opening/editing provider data."""
-        pass
+    def assign_value_list_to_provider_data_on_read(self, values: list):
+        """Takes a list of values specific to provider type (type first, then the fields, see 'get_fields'),
+        and assigns them to the class instance. Used on opening/editing provider data.
+        """
+        provider_fields = self.get_fields()
+        if len(values) != len(provider_fields) + 1:
+            raise ValueError(
+                f"Unexpected number of value to unpack: {len(values)}. Expected: {len(provider_fields) + 1}"
+            )
+
+        for provider_field, value in zip(provider_fields, values[1:]):
+            provider_field.set_value(self, provider_field.from_text(value))
 
-    @abstractmethod
     def pack_data_to_list(self) -> list:
-        """Returns a list with all instance properties in a specific order."""
-        pass
+        """Returns a list with the provider type and all field values, in the order of 'get_fields'."""
+        return [self.type.value] + [
+            provider_field.get_value(self) for provider_field in self.get_fields()
+        ]
+
+    def get_invalid_properties(self):
+        """Checks the values of mandatory fields."""
+        all_invalid_fields = []
+
+        if not isinstance(self.type, ProviderTypes):
+            all_invalid_fields.append("type")
+        for provider_field in self.get_fields():
+            if provider_field.mandatory and not is_valid_string(
+                provider_field.get_value(self)
+            ):
+                all_invalid_fields.append(provider_field.path)
+
+        return all_invalid_fields
+
+
+def _compile_field(cls: type, ui_spec: tuple) -> ProviderField:
+    label, data_type, default, special_widget_type, _ = ui_spec
+    path = label.replace("*", "")
+    attrs = tuple(path.split("."))
+
+    # dataclasses of the parents along the path (the non-None type of optional parents)
+    parent_classes = []
+    current_cls = cls
+    for attr in attrs[:-1]:
+        field_type = current_cls.__dataclass_fields__[attr].type
+        if type(field_type) is UnionType:
+            field_type = next(t for t in get_args(field_type) if t is not type(None))
+        parent_classes.append(field_type)
+        current_cls = field_type
+
+    return ProviderField(
+        path=path,
+        type=data_type,
+        default=default,
+        mandatory=label.endswith("*"),
+        widget=special_widget_type,
+        ui_spec=ui_spec,
+        attrs=attrs,
+        parent_classes=tuple(parent_classes),
+        from_text=_compile_from_text(data_type, cls.empty_ui_values.get(path)),
+    )
+
+
+def _compile_from_text(data_type, empty_value: Callable[[], Any] | None):
+    """Converter of the UI text to the field type: text as is for mandatory strings, None (or 'empty_value')
+    for empty optional values, split lists, parsed integers and JSON dictionaries."""
+    args = get_args(data_type) if type(data_type) is UnionType else (data_type,)
+    if args == (str,):
+        return lambda text: text
+
+    def empty():
+        return empty_value() if empty_value is not None else None
+
+    if list in args:
+        return lambda text: text.split(",") if is_valid_string(text) else empty()
+    if dict in args:
+        return lambda text: json.loads(text) if is_valid_string(text) else empty()
+    if int in args:
+        accepts_str = str in args
+
+        def from_text(text):
+            try:
+                return int(text)
+            except ValueError:
+                return text if accepts_str and is_valid_string(text) else empty()
+
+        return from_text
+
+    return lambda text: text if is_valid_string(text) else empty()
@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
 
 from .records import ProviderTypes
+from .registry import register_provider
 from ..providers import ProviderTemplate
-from ..utils import is_valid_string
 from ...utils import update_dataclass_from_dict
 
 
@@ -21,6 +21,7 @@ class WmsFacadeFormat:
 
 # All Provider subclasses need to have default values even for mandatory fields,
 # so that the empty instance can be created and filled with values later
+@register_provider
 @dataclass(kw_only=True)
 class ProviderWmsFacade(ProviderTemplate):
 
@@ -66,60 +67,3 @@ class ProviderWmsFacade(ProviderTemplate):
             (*cls.get_field_info(cls, "format.name"), None, ""),
             (*cls.get_field_info(cls, "format.mimetype"), None, ""),
         ]
-
-    def pack_data_to_list(self):
-        return [
-            self.type.value,
-            self.name,
-            self.data,
-            self.options.layer,
-            # non-mandatory
-            self.crs,
-            self.options.style,
-            self.options.version,
-            self.format.name if self.format else None,
-            self.format.mimetype if self.format else None,
-        ]
-
-    def assign_value_list_to_provider_data_on_read(self, values: list):
-        if len(values) != 9:
-            raise ValueError(
-                f"Unexpected number of value to unpack: {len(values)}. Expected: 9"
-            )
-
-        self.name: str = values[1]
-        self.data: str = values[2]
-        self.options.layer: str = values[3]
-
-        # non-mandatory
-        self.crs: list | None = (
-            values[4].split(",") if is_valid_string(values[4]) else None
-        )
-        self.options.style: str | None = (
-            values[5] if is_valid_string(values[5]) else None
-        )
-        self.options.version: str | None = (
-            values[6] if is_valid_string(values[6]) else None
-        )
-
-        format_name: str | None = values[7] if is_valid_string(values[7]) else None
-        format_mimetype: str | None = values[8] if is_valid_string(values[8]) else None
-        if format_name or format_mimetype:
-            self.format = WmsFacadeFormat()
-            self.format.name = format_name
-            self.format.mimetype = format_mimetype
-
-    def get_invalid_properties(self):
-        """Checks the values of mandatory fields."""
-        all_invalid_fields = []
-
-        if not isinstance(self.type, ProviderTypes):
-            all_invalid_fields.append("type")
-        if not is_valid_string(self.name):
-            all_invalid_fields.append("name")
-        if not is_valid_string(self.data):
-            all_invalid_fields.append("data")
-        if not is_valid_string(self.options.layer):
-            all_invalid_fields.append("options.layer")
-
-        return all_invalid_fields
@@ -0,0 +1,65 @@
+from typing import Any
+
+from .records import ProviderTypes
+
+# supported provider classes by (type, name), filled by 'register_provider'
+PROVIDER_CLASSES: dict[tuple[ProviderTypes, str], type] = {}
+
+# provider class used for new providers of each type: the first one registered for the type
+_DEFAULT_PROVIDER_CLASSES: dict[ProviderTypes, type] = {}
+
+# UI specs of each provider class (see 'ui_elements_grid'), built once on first use
+_UI_ELEMENTS_GRIDS: dict[type, tuple[tuple, ...]] = {}
+
+
+def register_provider(cls: type) -> type:
+    """Class decorator adding a provider dataclass to the supported providers, by the default values
+    of its 'type' and 'name' fields. Applied on top of the @dataclass decorator."""
+    fields = cls.__dataclass_fields__
+    key = (fields["type"].default, fields["name"].default)
+    if key in PROVIDER_CLASSES:
+        raise ValueError(f"Provider already registered: {key}")
+
+    PROVIDER_CLASSES[key] = cls
+    _DEFAULT_PROVIDER_CLASSES.setdefault(key[0], cls)
+    return cls
+
+
+def get_provider_key(cls: type) -> tuple[ProviderTypes, str] | None:
+    """Registry key of the provider class, None if the class is not registered."""
+    fields = getattr(cls, "__dataclass_fields__", None)
+    if fields is None or "type" not in fields or "name" not in fields:
+        return None
+    key = (fields["type"].default, fields["name"].default)
+    return key if PROVIDER_CLASSES.get(key) is cls else None
+
+
+def get_provider_class(
+    provider_type: ProviderTypes, name: str | None = None
+) -> type | None:
+    """Provider class for the type and name; the default class of the type if no name is given."""
+    if name is None:
+        return _DEFAULT_PROVIDER_CLASSES.get(provider_type)
+    return PROVIDER_CLASSES.get((provider_type, name))
+
+
+def get_provider_class_for_data(data: Any) -> type | None:
+    """Provider class matching the 'type' and 'name' of provider data (e.g. from YAML), None if not supported."""
+    if not isinstance(data, dict):
+        return None
+    try:
+        # enum lookup by value, without iterating the members
+        provider_type = ProviderTypes._value2member_map_.get(data.get("type"))
+        return PROVIDER_CLASSES.get((provider_type, data.get("name")))
+    except TypeError:  # unhashable values, e.g. lists
+        return None
+
+
+def get_ui_elements_grid(cls: type) -> tuple[tuple, ...]:
+    """Cached UI specs of the provider class, from its precomputed fields (see ProviderTemplate.get_fields)."""
+    grid = _UI_ELEMENTS_GRIDS.get(cls)
+    if grid is None:
+        grid = _UI_ELEMENTS_GRIDS[cls] = tuple(
+            provider_field.ui_spec for provider_field in cls.get_fields()
+        )
+    return grid
@@ -1,8 +1,8 @@
-from dataclasses import is_dataclass, fields, MISSING
+from dataclasses import dataclass, is_dataclass, fields, MISSING
 from datetime import datetime
 from enum import Enum
 from types import UnionType
-from typing import Any, get_origin, get_args, Union, get_type_hints
+from typing import Any, Callable, get_origin, get_args, Union, get_type_hints
 
 from .top_level.utils import (
     InlineList,
@@ -11,117 +11,180 @@ from .top_level.utils import (
 from ..utils.helper_functions import datetime_from_string
 
 
+@dataclass(frozen=True)
+class _FieldPlan:
+    """Precomputed deserialization steps for a single dataclass field."""
+
+    name: str
+    alias: str | None
+    optional: bool
+    has_default: bool
+    expected_type: Any
+    # dataclass to instantiate when the current value is None (e.g. 'ResourceTemporalConfig | None')
+    optional_dataclass: type | None
+    validate: Callable[[Any], bool]
+    coerce: Callable[[Any, str], tuple[Any, list]]
+
+
+# compiled plans, built once per dataclass on first use
+_DATACLASS_PLANS: dict[type, tuple[_FieldPlan, ...]] = {}
+
+# YAML keys that are not valid Python identifiers
+_FIELD_ALIASES = {"linked__data": "linked-data"}
+
+
+def get_dataclass_plan(cls: type) -> tuple[_FieldPlan, ...]:
+    """Return the cached list of field plans for the dataclass, compiling it on first use."""
+    plan = _DATACLASS_PLANS.get(cls)
+    if plan is None:
+        plan = _compile_dataclass_plan(cls)
+        _DATACLASS_PLANS[cls] = plan
+    return plan
+
+
+def _compile_dataclass_plan(cls: type) -> tuple[_FieldPlan, ...]:
+    hints = get_type_hints(cls)
+    plan = []
+    for fld in fields(cls):
+        expected_type = hints[fld.name]
+
+        optional_dataclass = None
+        if type(expected_type) is UnionType:
+            valid_type = next(
+                (t for t in get_args(expected_type) if t is not type(None)), None
+            )
+            if is_dataclass(valid_type):
+                optional_dataclass = valid_type
+
+        plan.append(
+            _FieldPlan(
+                name=fld.name,
+                alias=_FIELD_ALIASES.get(fld.name),
+                # for optional fields, 'default' is explicitly set to 'None'
+                optional=fld.default is not MISSING and fld.default is None,
+                has_default=fld.default is not MISSING,
+                expected_type=expected_type,
+                optional_dataclass=optional_dataclass,
+                validate=_get_type_validator(expected_type),
+                coerce=_compile_coercion(expected_type),
+            )
+        )
+    return tuple(plan)
+
+
+def _compile_coercion(expected_type) -> Callable[[Any, str], tuple[Any, list]]:
+    """Resolve the type checks once, and return a function remapping an already validated value
+    to the internally used type (InlineList, datetime, Enum, list of dataclasses)."""
+    args = get_args(expected_type)
+    is_union = type(expected_type) is UnionType
+    is_inline_list = expected_type is InlineList
+    expects_datetime = datetime in args or expected_type is datetime
+    enum_type = (
+        expected_type
+        if isinstance(expected_type, type) and issubclass(expected_type, Enum)
+        else None
+    )
+    subtype = next((t for t in args if t is not type(None)), None) if is_union else None
+    subtype_enum = (
+        subtype if isinstance(subtype, type) and issubclass(subtype, Enum) else None
+    )
+
+    def coerce(new_value, prop_name: str) -> tuple[Any, list]:
+        wrong_types = []
+
+        # Exception: remap list to internally used InlineList (needed later for YAML formatting)
+        if is_inline_list:
+            if isinstance(new_value, str):
+                new_value = new_value.split(",")
+            new_value = InlineList(new_value)
+
+        # Exception: try remap to datetime
+        if expects_datetime and isinstance(new_value, str):
+            new_value = datetime_from_string(new_value)
+
+        # Exception: remap str to Enum
+        elif enum_type is not None:
+            new_value = get_enum_value_from_string(enum_type, new_value)
+
+        # Exception: remap str to Enum (when one of possible classes is Enum)
+        elif is_union:
+            # check for list type, run cast for every element
+            if isinstance(new_value, list):
+                new_value, wrong_types = cast_list_elements_to_expected_types(
+                    new_value, subtype, prop_name
+                )
+            elif subtype_enum is not None:
+                new_value = get_enum_value_from_string(subtype_enum, new_value)
+
+        # Exception with 'expected_type' 'list[some dataclass]'
+        # In this case, 'current_value' will be a 'default'=None (for optional fields) or 'default_factory'=[] (for mandatory fields)
+        # We need to cast every element in the list to the correct class before assigning
+        # if we just assign new_value as is, it will be a 'list[dict]'
+        elif isinstance(new_value, list):
+            new_value, wrong_types = cast_list_elements_to_expected_types(
+                new_value, expected_type, prop_name
+            )
+
+        return new_value, wrong_types
+
+    return coerce
+
+
 def update_dataclass_from_dict(
     instance, new_dict, prop_name: str = ""
 ) -> tuple[list, list, list]:
-    hints = get_type_hints(type(instance))
     missing_fields = []
     wrong_types = []
     all_missing_props = []
 
     # loop through the instance properties
-    for fld in fields(instance):
+    for fld in get_dataclass_plan(type(instance)):
         field_name = fld.name
 
         # handle exception for resource 'linked-data'
-        if field_name == "linked__data":
-            if "linked-data" in new_dict:
-                new_dict["linked__data"] = new_dict["linked-data"]
+        if fld.alias is not None and fld.alias in new_dict:
+            new_dict[field_name] = new_dict[fld.alias]
 
         # try overwrite instance property with new dictionary value
         if field_name in new_dict:
             new_value = new_dict[field_name]
             current_value = getattr(instance, field_name)
-            expected_type = hints[field_name]
-
-            args = get_args(expected_type)
+            field_path = f"{prop_name}.{field_name}"
 
             # If field is a dataclass and new_value is a dict, recurse
             # This behavior works when 'current_value' is an already instantiated dataclass
             # with all set properties - we just need to overwrite the values
 
             # case where default value in None, but another class might be expected
-            if current_value is None and type(expected_type) is UnionType:
-
-                valid_type = next((t for t in args if t is not type(None)), None)
-                if is_dataclass(valid_type) and isinstance(new_value, dict):
-                    current_value = valid_type()
-                    setattr(instance, field_name, current_value)
+            if (
+                current_value is None
+                and fld.optional_dataclass is not None
+                and isinstance(new_value, dict)
+            ):
+                current_value = fld.optional_dataclass()
+                setattr(instance, field_name, current_value)
 
             if is_dataclass(current_value) and isinstance(new_value, dict):
                 new_missing_fields, new_wrong_types, new_missing_props = (
-                    update_dataclass_from_dict(
-                        current_value, new_value, f"{prop_name}.{field_name}"
-                    )
+                    update_dataclass_from_dict(current_value, new_value, field_path)
                 )
                 missing_fields.extend(new_missing_fields)
                 wrong_types.extend(new_wrong_types)
                 all_missing_props.extend(new_missing_props)
+
+            elif fld.validate(new_value):
+                new_value, more_wrong_types = fld.coerce(new_value, field_path)
+                wrong_types.extend(more_wrong_types)
+                setattr(instance, field_name, new_value)
             else:
-                if _is_instance_of_type(new_value, expected_type):
-
-                    # Exception: remap list to internally used InlineList (needed later for YAML formatting)
-                    if expected_type is InlineList:
-                        if isinstance(new_value, str):
-                            new_value = new_value.split(",")
-
-                        new_value = InlineList(new_value)
-
-                    # Exception: try remap to datetime
-                    if (datetime in args or expected_type is datetime) and isinstance(
-                        new_value, str
-                    ):
-                        new_value = datetime_from_string(new_value)
-
-                    # Exception: remap str to Enum
-                    elif isinstance(expected_type, type) and issubclass(
-                        expected_type, Enum
-                    ):
-                        new_value = get_enum_value_from_string(expected_type, new_value)
-
-                    # Exception: remap str to Enum (when one of possible classes is Enum)
-                    elif type(expected_type) is UnionType:
-
-                        subtype = next((t for t in args if t is not type(None)), None)
-                        # check for list type, run cast for every element
-                        if isinstance(new_value, list):
-                            new_value, more_wrong_types = (
-                                cast_list_elements_to_expected_types(
-                                    new_value, subtype, f"{prop_name}.{field_name}"
-                                )
-                            )
-                            wrong_types.extend(more_wrong_types)
-
-                        elif isinstance(subtype, type) and issubclass(subtype, Enum):
-                            new_value = get_enum_value_from_string(subtype, new_value)
-
-                    # Exception with 'expected_type' 'list[some dataclass]'
-                    # In this case, 'current_value' will be a 'default'=None (for optional fields) or 'default_factory'=[] (for mandatory fields)
-                    # We need to cast every element in the list to the correct class before assigning
-                    # if we just assign new_value as is, it will be a 'list[dict]'
-
-                    elif isinstance(new_value, list):
-                        new_value, more_wrong_types = (
-                            cast_list_elements_to_expected_types(
-                                new_value, expected_type, f"{prop_name}.{field_name}"
-                            )
-                        )
-                        wrong_types.extend(more_wrong_types)
-
-                    setattr(instance, field_name, new_value)
-                else:
-                    wrong_types.append(f"{prop_name}.{field_name}")
-                    all_missing_props.append(f"{prop_name}.{field_name}")
-        else:  # field is missing from the object
-
-            # don't report optional fields as missing
-            # for optional fields, 'default' is explicitly set to 'None'
-            if fld.default is not MISSING and fld.default is None:
-                pass
-                # print(f"MISSING: {prop_name}.{field_name}")
-            else:
-                missing_fields.append(f"{prop_name}.{field_name}")
-                all_missing_props.append(f"{prop_name}.{field_name}")
+                wrong_types.append(field_path)
+                all_missing_props.append(field_path)
+
+        # field is missing from the object
+        # don't report optional fields as missing
+        elif not fld.optional:
+            missing_fields.append(f"{prop_name}.{field_name}")
+            all_missing_props.append(f"{prop_name}.{field_name}")
 
     return missing_fields, wrong_types, all_missing_props
 
@@ -131,40 +194,19 @@ def cast_element_to_type(value: Any, expected_type, prop_name: str):
 
     # if there are alternative options for the expected type: recurse
     if type(expected_type) is UnionType:
-        args = get_args(expected_type)
-        for inner_type in args:
-
-            if inner_type.__name__.startswith("Provider"):
-                # don't cast anything except supported providers
-                if value.get("name") not in ["PostgreSQL", "MVT-proxy", "WMSFacade"]:
-                    continue
-
-                # don't cast to wrong provider, even if properties match
-                if (
-                    (
-                        value.get("name") == "PostgreSQL"
-                        and not inner_type.__name__.endswith("ProviderPostgresql")
-                    )
-                    or (
-                        value.get("name") == "MVT-proxy"
-                        and not inner_type.__name__.endswith("ProviderMvtProxy")
-                    )
-                    or (
-                        value.get("name") == "WMSFacade"
-                        and not inner_type.__name__.endswith("ProviderWmsFacade")
-                    )
-                ):
-                    continue
+        # only the arms that can hold the value: providers are picked by their 'type' and 'name' in the registry,
+        # so a dict is never cast to an unsupported or wrong provider, even if properties match
+        for inner_type in _get_union_arms_for_value(expected_type, value):
 
             # handle the case when manual casting is required
-            elif type(value) is str and inner_type is int:
+            if type(value) is str and inner_type is int:
                 try:
                     return int(value)
                 except ValueError:
                     pass
 
             # if the loop hasn't returned yet, check directly by type
-            if _is_instance_of_type(value, inner_type):
+            if _get_type_validator(inner_type)(value):
                 return cast_element_to_type(value, inner_type, prop_name)
 
     elif is_dataclass(expected_type):
@@ -177,7 +219,7 @@ def cast_element_to_type(value: Any, expected_type, prop_name: str):
         return class_instance
 
     else:
-        if _is_instance_of_type(value, expected_type):
+        if _get_type_validator(expected_type)(value):
             return value
 
     raise ValueError(
@@ -193,19 +235,19 @@ def cast_list_elements_to_expected_types(
     wrong_types = []
 
     # check for the expected inner arguments types
-    args = get_args(expected_type)
+    args = _get_type_args(expected_type)
 
     if type(expected_type) is UnionType and args:
         # e.g. 'list | dict'
         for possible_type in args:
-            if _is_instance_of_type(new_value, possible_type):
+            if _get_type_validator(possible_type)(new_value):
                 casted_values, more_wrong_types = cast_list_elements_to_expected_types(
                     new_value, possible_type, prop_name
                 )
                 wrong_types.extend(more_wrong_types)
 
     elif type(expected_type) is not UnionType and args and len(new_value) > 0:
-        # e.g. '<ListTemplate>' or (ProviderPostgresql | ProviderMvtProxy | ProviderWmsFacade,)
+        # e.g. '<ListTemplate>' or (ProviderTemplate | dict,)
 
         for val in new_value:
 
@@ -232,93 +274,170 @@ def cast_list_elements_to_expected_types(
     return casted_values, wrong_types
 
 
+# compiled validators and type arguments, built once per type on first use
+_TYPE_VALIDATORS: dict[Any, Callable[[Any], bool]] = {}
+_TYPE_ARGS: dict[Any, tuple] = {}
+_UNION_ARMS: dict[Any, tuple[tuple, tuple]] = {}
+_PROVIDER_UNION_ARMS: dict[tuple[Any, type], tuple] = {}
+
+
+def _get_type_args(expected_type) -> tuple:
+    args = _TYPE_ARGS.get(expected_type)
+    if args is None:
+        args = get_args(expected_type)
+        _TYPE_ARGS[expected_type] = args
+    return args
+
+
+def _get_union_arms_for_value(expected_type, value) -> tuple:
+    """Return the union arms (in declared order) that are candidates for the value.
+    Provider data is only cast to the provider class registered for its 'type' and 'name' (see
+    providers.registry), if the union accepts that class.
+    """
+    arms = _UNION_ARMS.get(expected_type)
+    if arms is None:
+        arms = _compile_union_arms(expected_type)
+        _UNION_ARMS[expected_type] = arms
+
+    provider_arms, other_arms = arms
+    if not provider_arms or not isinstance(value, dict):
+        return other_arms
+
+    # imported here: the providers import this module
+    from .top_level.providers.registry import get_provider_class_for_data
+
+    provider_class = get_provider_class_for_data(value)
+    if provider_class is None:
+        return other_arms
+
+    candidate_arms = _PROVIDER_UNION_ARMS.get((expected_type, provider_class))
+    if candidate_arms is None:
+        accepted = any(issubclass(provider_class, arm) for arm in provider_arms)
+        candidate_arms = ((provider_class,) if accepted else ()) + other_arms
+        _PROVIDER_UNION_ARMS[(expected_type, provider_class)] = candidate_arms
+    return candidate_arms
+
+
+def _compile_union_arms(expected_type) -> tuple[tuple, tuple]:
+    """Split the union arms into provider classes (registered classes and their bases) and other arms."""
+    from .top_level.providers.registry import PROVIDER_CLASSES
+
+    provider_arms = []
+    other_arms = []
+    for inner_type in get_args(expected_type):
+        if isinstance(inner_type, type) and any(
+            issubclass(provider_class, inner_type)
+            for provider_class in PROVIDER_CLASSES.values()
+        ):
+            provider_arms.append(inner_type)
+        else:
+            other_arms.append(inner_type)
+
+    return tuple(provider_arms), tuple(other_arms)
+
+
 def _is_instance_of_type(value, expected_type) -> bool:
     """Basic type checker supporting Optional (Union[..., NoneType]) and direct types."""
+    return _get_type_validator(expected_type)(value)
+
+
+def _get_type_validator(expected_type) -> Callable[[Any], bool]:
+    """Return the cached validator function for the type, compiling it on first use."""
+    validator = _TYPE_VALIDATORS.get(expected_type)
+    if validator is None:
+        validator = _compile_type_validator(expected_type)
+        _TYPE_VALIDATORS[expected_type] = validator
+    return validator
+
+
+def _compile_type_validator(expected_type) -> Callable[[Any], bool]:
     origin = get_origin(expected_type)
     args = get_args(expected_type)
 
     # Handle Union (including Optional, str | dict, etc.)
     if origin is Union or type(expected_type) is UnionType:
-        # Recursively check each allowed type in the union
-        return any(_is_instance_of_type(value, arg) for arg in args)
-
-    # Generic containers like list[X], dict[K, V]
-    if origin in (list, tuple, set):
-        if not isinstance(value, origin):
+        # check plain types first: e.g. in 'ProviderTemplate | dict', any dict already matches 'dict'
+        # without validating it against each dataclass
+        ordered_args = sorted(args, key=lambda arg: is_dataclass(arg))
+        arm_validators = tuple(_get_type_validator(arg) for arg in ordered_args)
+
+        def validate_union(value) -> bool:
+            for arm_validator in arm_validators:
+                if arm_validator(value):
+                    return True
             return False
 
-        # check for the inner arguments types
-        if args and len(value) > 0:
-            for val in value:
+        return validate_union
 
-                value_matched = False
-                for inner_type in args:
-                    if _is_instance_of_type(val, inner_type):
-                        value_matched = True
-                        continue
-                if not value_matched:
-                    return False
-
-            # if loop successfully ended and all values matched expected types
+    # Generic containers like list[X], dict[K, V]
+    if origin in (list, tuple, set):
+        inner_validator = None
+        if len(args) > 1:
+            inner_validator = _get_type_validator(Union[args])
+        elif args:
+            inner_validator = _get_type_validator(args[0])
+
+        def validate_container(value) -> bool:
+            if not isinstance(value, origin):
+                return False
+
+            # check for the inner arguments types
+            if inner_validator is not None:
+                for val in value:
+                    if not inner_validator(val):
+                        return False
             return True
 
-        return True
+        return validate_container
 
     if origin is dict:
-        if not isinstance(value, dict):
-            return False
         if args and len(args) == 2:
-            key_type, val_type = args
-            return all(
-                _is_instance_of_type(k, key_type) and _is_instance_of_type(v, val_type)
-                for k, v in value.items()
+            key_validator = _get_type_validator(args[0])
+            val_validator = _get_type_validator(args[1])
+            return lambda value: isinstance(value, dict) and all(
+                key_validator(k) and val_validator(v) for k, v in value.items()
             )
-        return True
+        return lambda value: isinstance(value, dict)
+
+    if expected_type is Any:
+        return lambda value: True
 
     # Exception for InlineList: just check if the value is a list
     if expected_type is InlineList:
-        if isinstance(value, list):
-            return True
-        return False
+        return lambda value: isinstance(value, list)
 
     # Exception for Records (Enums): check if value is a member of the Enum
     if issubclass(expected_type, Enum):
-        if value in [member.value for member in expected_type]:
-            return True
-        return False
+        member_values = [member.value for member in expected_type]
+        return lambda value: value in member_values
 
     # Exception for when 'expected_type' is a custom dataclass and 'value' is dict
-    if isinstance(value, dict) and is_dataclass(expected_type):
-        return can_cast_to_dataclass(value, expected_type)
+    if is_dataclass(expected_type):
+        return lambda value: (
+            can_cast_to_dataclass(value, expected_type)
+            if isinstance(value, dict)
+            else isinstance(value, expected_type)
+        )
 
     # Exception: try cast str to datetime manually
     if expected_type is datetime:
-        if datetime_from_string(value) is not None:
-            return True
-        else:
-            return False
+        return lambda value: datetime_from_string(value) is not None
 
     # Fallback for normal types
-    return isinstance(value, expected_type)
+    return lambda value: isinstance(value, expected_type)
 
 
 def can_cast_to_dataclass(data: dict, cls: type) -> bool:
 
-    type_hints = get_type_hints(cls)
-    for field in fields(cls):
-        field_name = field.name
-        field_type = type_hints.get(field_name)
-
-        if field_name not in data:
-            if field.default is not MISSING:  # field has default
+    for fld in get_dataclass_plan(cls):
+        if fld.name not in data:
+            if fld.has_default:  # field has default
                 continue  # field is ok, go to next
 
             return False  # field and defaults are missing
 
-        value = data[field_name]
-
         # Check type
-        if not _is_instance_of_type(value, field_type):
+        if not fld.validate(data[fld.name]):
             return False
 
     return True
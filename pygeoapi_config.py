@@ -25,11 +25,14 @@ from PyQt5.QtCore import QSettings, QTranslator, QCoreApplication
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QAction
 
-# Initialize Qt resources from file resources.py
-from .resources import *
+# make imports optional for pytests
+try:
+    from qgis.core import QgsMessageLog
+except:
+    pass # nosec
 
-# Import the code for the dialog
-from .pygeoapi_config_dialog import PygeoapiConfigDialog
+# Qt resources (resources.py) and the dialog, with the models and the network stack, are imported on the first run(),
+# not when QGIS loads the plugin (see tests/benchmark_import_time.py)
 
 import os.path
 
@@ -158,7 +161,8 @@ class PygeoapiConfig:
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
 
-        icon_path = ":/plugins/pygeoapi_config/icon.png"
+        # icon file instead of the Qt resource, which is registered on the first run()
+        icon_path = os.path.join(self.plugin_dir, "icon.png")
         self.add_action(
             icon_path,
             text=self.tr("Configure pygeoapi"),
@@ -175,6 +179,12 @@ class PygeoapiConfig:
             self.iface.removePluginMenu(self.tr("&pygeoapi configurator"), action)
             self.iface.removeToolBarIcon(action)
 
+    def log_startup_time(self, seconds: float):
+        """Report the time from the dialog construction to its first paint."""
+        QgsMessageLog.logMessage(
+            f"Dialog displayed in {seconds * 1000:.0f} ms", "pygeoapi configurator"
+        )
+
     def run(self):
         """Run method that performs all the real work"""
 
@@ -182,7 +192,15 @@ class PygeoapiConfig:
         # Only create GUI ONCE in callback, so that it will only load when the plugin is started
         if self.first_start:
             self.first_start = False
+
+            # Initialize Qt resources from file resources.py
+            from . import resources
+
+            # Import the code for the dialog
+            from .pygeoapi_config_dialog import PygeoapiConfigDialog
+
             self.dlg = PygeoapiConfigDialog()
+            self.dlg.first_painted.connect(self.log_startup_time)
 
         # show the dialog
         self.dlg.show()
@@ -22,32 +22,50 @@
  ***************************************************************************/
 """
 
+from concurrent.futures import Future
 from copy import deepcopy
-from datetime import datetime
 import os
-from wsgiref import headers
-import requests
-import yaml
+from time import perf_counter
 
-from .utils.helper_functions import datetime_to_string
+from .utils.admin_api import (
+    AdminApiRequest,
+    AdminApiResponse,
+    plan_config_push,
+    start_admin_api_requests,
+)
+from .utils.crs_validation import (
+    collect_crs_references,
+    validate_crs_references_async,
+)
 from .utils.data_diff import diff_yaml_dict
+from .utils.resource_search import ResourceSearchIndex
+from .utils.yaml_io import (
+    YAML_BACKEND,
+    ConfigDumper,
+    dump_yaml,
+    iter_yaml_config_sections,
+    load_yaml,
+)
 
-from .ui_widgets.utils import get_url_status
+from .ui_widgets.utils import (
+    call_when_done,
+    get_item_object,
+    get_url_status,
+    load_ui_form_class,
+)
 
 from .server_config_dialog import Ui_serverDialog
 
+from .models.top_level.providers import ProviderTemplate
 from .models.top_level.providers.records import ProviderTypes
 from .ui_widgets.providers.NewProviderWindow import NewProviderWindow
 from .ui_widgets.WarningDialog import ReadOnlyTextDialog
+from .ui_widgets.ResourceListModel import ResourceFilterProxyModel, ResourceListModel
 from .ui_widgets import DataSetterFromUi, UiSetter
 from .models.ConfigData import ConfigData
-from .models.top_level.utils import (
-    InlineList,
-    get_enum_value_from_string,
-)
-from .models.top_level.utils import STRING_SEPARATOR
+from .models.top_level.utils import get_enum_value_from_string
 
-from PyQt5 import QtWidgets, uic
+from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import (
     QMainWindow,
     QFileDialog,
@@ -55,13 +73,14 @@ from PyQt5.QtWidgets import (
     QDialogButtonBox,
     QDialog,
     QApplication,
+    QProgressDialog,
 )  # or PyQt6.QtWidgets
 
 from PyQt5.QtCore import (
     Qt,
     QModelIndex,
-    QStringListModel,
-    QSortFilterProxyModel,
+    QTimer,
+    pyqtSignal,
 )  # Not strictly needed, can use Python file API instead
 
 # make imports optional for pytests
@@ -76,7 +95,8 @@ try:
 except:
     pass # nosec
 
-headers = {"accept": "*/*", "Content-Type": "application/json; charset=utf-8"}
+# delay after the last keystroke before the resources are searched
+RESOURCES_FILTER_DELAY_MS = 150
 
 
 class ServerConfigDialog(QDialog, Ui_serverDialog):
@@ -103,20 +123,24 @@ class ServerConfigDialog(QDialog, Ui_serverDialog):
         return f"{protocol}://{host}:{port}/admin/config"
 
 
-# This loads your .ui file so that PyQt can populate your plugin with the elements from Qt Designer
-FORM_CLASS, _ = uic.loadUiType(
-    os.path.join(os.path.dirname(__file__), "pygeoapi_config_dialog_base.ui")
+# This loads your .ui file so that PyQt can populate your plugin with the elements from Qt Designer,
+# from the module precompiled from the .ui file (see 'compile' in Makefile), unless the .ui file is newer
+FORM_CLASS = load_ui_form_class(
+    os.path.join(os.path.dirname(__file__), "pygeoapi_config_dialog_base.ui"),
+    __package__,
 )
 
 
 class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
 
     config_data: ConfigData
-    yaml_original_data: dict
     ui_setter: UiSetter
     data_from_ui_setter: DataSetterFromUi
     current_res_name = ""
 
+    # seconds from the start of the dialog construction to its first paint (startup timing hook)
+    first_painted = pyqtSignal(float)
+
     # these need to be class properties, otherwise, without constant reference, they are not displayed in a widget
     provider_window: QMainWindow
     bbox_map_canvas: "QgsMapCanvas"
@@ -125,6 +149,7 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
 
     def __init__(self, parent=None):
         """Constructor."""
+        self._startup_time = perf_counter()
         super(PygeoapiConfigDialog, self).__init__(parent)
         # Set up the user interface from Designer through FORM_CLASS.
         # After self.setupUi() you can access any designer object by doing
@@ -133,39 +158,59 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         # #widgets-and-dialogs-with-auto-connect
         self.setupUi(self)
         self.config_data = ConfigData()
-        self.yaml_original_data = None
+        self.config_data.resources.add_rename_listener(self._on_resource_renamed)
+        self.set_yaml_original_data(None)
         self.ui_setter = UiSetter(self)
         self.data_from_ui_setter = DataSetterFromUi(self)
 
-        class CustomDumper(yaml.SafeDumper):
-            pass
+        # Admin API request running in a worker thread (see 'push_to_server', 'pull_from_server')
+        self._server_request_thread = None
+        self._server_request_worker = None
+        self._server_request_progress = None
+        self._server_request_action = ""
+        self._pulled_url = None
+        self._pull_conditional_headers = None
+        self._pushed_config = None
 
-        self.dumper = CustomDumper
-
-        # make sure InlineList is represented as a YAML sequence (e.g. for 'bbox')
-        self.dumper.add_representer(
-            InlineList,
-            lambda dumper, data: dumper.represent_sequence(
-                "tag:yaml.org,2002:seq", data, flow_style=True
-            ),
-        )
-
-        # make sure datetime items are not saved as strings with quotes
-        def represent_datetime_as_timestamp(dumper, data: datetime):
-            value = datetime_to_string(data)
-
-            # emit as YAML timestamp → plain scalar, no quotes
-            return dumper.represent_scalar("tag:yaml.org,2002:timestamp", value)
-
-        self.dumper.add_representer(datetime, represent_datetime_as_timestamp)
+        # YAML dumper with representers for InlineList and datetime (libyaml-based if available)
+        self.dumper = ConfigDumper
 
         # custom assignments
-        self.model = QStringListModel()
-        self.proxy = QSortFilterProxyModel()
+        self.model = ResourceListModel(self)
+        self.proxy = ResourceFilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+        self.listViewCollection.setModel(self.proxy)
+        # rows of the same height are not measured one by one
+        self.listViewCollection.setUniformItemSizes(True)
+
+        # resources are searched when typing pauses (see 'filterResources')
+        self.resource_search_index = ResourceSearchIndex()
+        self._resources_filter = ""
+        self._resources_filter_timer = QTimer(self)
+        self._resources_filter_timer.setSingleShot(True)
+        self._resources_filter_timer.setInterval(RESOURCES_FILTER_DELAY_MS)
+        self._resources_filter_timer.timeout.connect(self._apply_resources_filter)
+
+        # map canvas and base map are created on the first display of the Resources tab (see 'setup_map_widget')
+        self.bbox_map_canvas = None
+        self.bbox_base_layer = None
+        self.bbox_extents_layer = None
+        self.tabWidget.currentChanged.connect(self._on_tab_changed)
 
         self.ui_setter.customize_ui_on_launch()
         self.ui_setter.set_ui_from_data()
-        self.ui_setter.setup_map_widget()
+        self._on_tab_changed(self.tabWidget.currentIndex())
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._startup_time is not None:
+            startup_seconds = perf_counter() - self._startup_time
+            self._startup_time = None
+            self.first_painted.emit(startup_seconds)
+
+    def _on_tab_changed(self, index: int):
+        if self.tabWidget.widget(index) is self.resourcesTab:
+            self.ui_setter.setup_map_widget()
 
     def on_button_clicked(self, button):
 
@@ -227,48 +272,160 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
 
     def push_to_server(self, url, data_to_push: dict):
 
+        # if the original data was pulled from the same server, only send the changed resources
+        # (full config is sent if other sections changed, or if resource endpoints fail)
+        original_data = None
+        if self._yaml_original_url == url:
+            original_data = self.get_yaml_original_data()
+        requests_list, fallback = plan_config_push(url, original_data, data_to_push)
+
+        if len(requests_list) == 0:
+            QMessageBox.information(
+                self,
+                "Information",
+                f"Nothing to push, the configuration on {url} is up to date.",
+            )
+            return
+
         QMessageBox.information(
             self,
             "Information",
             f"Pushing configuration to: {url}",
         )
 
+        # only the resource requests are incremental, the fallback is the full config
+        self._pushed_config = (url, data_to_push, fallback is not None)
+
         # TODO: support authentication through the QT framework
-        try:
-            # Send the PUT request to Admin API
-            response = requests.put(url, headers=headers, json=data_to_push, timeout=10)
-            response.raise_for_status()
+        # Send the requests to Admin API, without blocking the UI
+        self._start_server_request(
+            requests_list,
+            fallback,
+            on_finished=self._on_push_finished,
+            action="pushing the configuration to the server",
+        )
 
-            QgsMessageLog.logMessage(f"Success! Status Code: {response.status_code}")
+    def pull_from_server(self, url):
 
-            QMessageBox.information(
-                self,
-                "Information",
-                f"Success! Status Code: {response.status_code}",
-            )
+        QMessageBox.information(
+            self,
+            "Information",
+            f"Pulling configuration from: {url}",
+        )
 
-        except requests.exceptions.RequestException as e:
-            QgsMessageLog.logMessage(f"An error occurred: {e}")
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"An error occurred pushing the configuration to the server: {e}",
+        # TODO: support authentication through the QT framework
+        # Send the GET request to Admin API, without blocking the UI
+        # if ConfigData was pulled from the same server, only download the config if it changed since
+        conditional_headers = None
+        if self._yaml_original_url == url:
+            conditional_headers = self._pull_conditional_headers
+
+        self._pulled_url = url
+        self._start_server_request(
+            [AdminApiRequest(method="GET", url=url, headers=conditional_headers)],
+            on_finished=self._on_pull_finished,
+            action="pulling the configuration from the server",
+        )
+
+    @property
+    def is_server_request_running(self) -> bool:
+        return self._server_request_thread is not None
+
+    def _start_server_request(
+        self,
+        requests_list: list[AdminApiRequest],
+        fallback: AdminApiRequest | None = None,
+        *,
+        on_finished,
+        action,
+    ):
+        """Run the Admin API requests in a worker thread, show progress with an option to cancel."""
+        if self.is_server_request_running:
+            QMessageBox.warning(
+                self, "Warning", "Another request to the server is in progress."
             )
+            return
 
-    def pull_from_server(self, url):
+        self._server_request_action = action
+        self._server_request_thread, self._server_request_worker = (
+            start_admin_api_requests(requests_list, fallback)
+        )
+        worker = self._server_request_worker
+        worker.progress.connect(self._on_server_request_progress)
+        worker.finished.connect(on_finished)
+        worker.failed.connect(self._on_server_request_failed)
+        worker.cancelled.connect(self._on_server_request_cancelled)
+        worker.done.connect(self._on_server_request_done)
+
+        # only displayed if the request takes longer than 'minimumDuration'
+        self._server_request_progress = QProgressDialog(
+            f"{action.capitalize()}...", "Cancel", 0, 0, self
+        )
+        self._server_request_progress.setWindowModality(Qt.WindowModal)
+        self._server_request_progress.setMinimumDuration(500)
+        self._server_request_progress.canceled.connect(self._cancel_server_request)
+
+    def _cancel_server_request(self):
+        # called directly (not through a signal), the worker thread is busy with the request
+        if self._server_request_worker is not None:
+            self._server_request_worker.cancel()
+
+    def _on_server_request_progress(self, transferred: int, total: int):
+        if self._server_request_progress is not None:
+            self._server_request_progress.setMaximum(total)
+            self._server_request_progress.setValue(transferred if total else 0)
+
+    def _on_push_finished(self, response: AdminApiResponse):
+        url, pushed_data, incremental = self._pushed_config
+
+        message = f"Success! Status Code: {response.status_code}"
+        # savings of the incremental push and of the compression are reported separately:
+        # the full config is compared with the changes as JSON, before compression
+        if incremental and not response.used_fallback:
+            full_size = len(
+                AdminApiRequest(method="PUT", url=url, data=pushed_data).get_body()
+            )
+            message += (
+                f"\nUpdated resources: {response.requests_count}, "
+                f"{response.json_bytes_sent} bytes of JSON instead of {full_size} "
+                f"({full_size - response.json_bytes_sent} bytes saved)"
+            )
+        if response.bytes_sent < response.json_bytes_sent:
+            message += (
+                f"\nCompressed to {response.bytes_sent} bytes "
+                f"({response.json_bytes_sent - response.bytes_sent} bytes saved by gzip)"
+            )
+        QgsMessageLog.logMessage(message)
 
         QMessageBox.information(
             self,
             "Information",
-            f"Pulling configuration from: {url}",
+            message,
         )
 
-        # TODO: support authentication through the QT framework
-        try:
-            # Send the GET request to Admin API
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+        # server now has the pushed config: next push only needs the changes made after this one
+        # (copy of the top-level dicts; the resource dicts are not modified after serialization)
+        if incremental:
+            self.set_yaml_original_data(
+                {
+                    **pushed_data,
+                    "resources": dict(pushed_data.get("resources") or {}),
+                }
+            )
+            self._yaml_original_url = url
+
+    def _on_pull_finished(self, response: AdminApiResponse):
+        if response.not_modified:
+            # nothing downloaded: the server still has the config pulled last time, which replaces local changes
+            message = (
+                f"Success! Status Code: {response.status_code}\n"
+                "Configuration not modified since the last pull, reloaded the pulled configuration."
+            )
+            QgsMessageLog.logMessage(message)
+            QMessageBox.information(self, "Information", message)
+            pulled_data = self.get_yaml_original_data()
 
+        else:
             QgsMessageLog.logMessage(f"Success! Status Code: {response.status_code}")
 
             QMessageBox.information(
@@ -277,19 +434,36 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
                 f"Success! Status Code: {response.status_code}",
             )
 
-            QgsMessageLog.logMessage(f"Response: {response.text}")
+            QgsMessageLog.logMessage(f"Response: {response.data}")
+            pulled_data = response.data
+            self._pull_conditional_headers = response.get_conditional_headers()
 
-            data_dict = response.json()
-            self.update_config_data_and_ui(data_dict)
+        self.update_config_data_and_ui(pulled_data)
+        self._yaml_original_url = self._pulled_url
 
-        except requests.exceptions.RequestException as e:
-            QgsMessageLog.logMessage(f"An error occurred: {e}")
+    def _on_server_request_failed(self, error: str):
+        QgsMessageLog.logMessage(f"An error occurred: {error}")
 
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"An error occurred pulling the configuration from the server: {e}",
-            )
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"An error occurred {self._server_request_action}: {error}",
+        )
+
+    def _on_server_request_cancelled(self):
+        QgsMessageLog.logMessage(f"Cancelled {self._server_request_action}")
+
+    def _on_server_request_done(self):
+        if self._server_request_progress is not None:
+            # closing the progress dialog emits 'canceled'
+            self._server_request_progress.canceled.disconnect()
+            self._server_request_progress.close()
+            self._server_request_progress = None
+
+        self._server_request_thread.quit()
+        self._server_request_thread.wait()
+        self._server_request_thread = None
+        self._server_request_worker = None
 
     def save_to_file(self, new_config_data: dict, file_path: str):
 
@@ -297,19 +471,13 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
             QApplication.setOverrideCursor(Qt.WaitCursor)
             try:
                 with open(file_path, "w", encoding="utf-8") as file:
-                    yaml.dump(
-                        new_config_data,
-                        file,
-                        Dumper=self.dumper,
-                        default_flow_style=False,
-                        sort_keys=False,
-                        allow_unicode=True,
-                        indent=4,
-                    )
+                    dump_yaml(new_config_data, file)
 
                 # try/except in case of running it from pytests
                 try:
-                    QgsMessageLog.logMessage(f"File saved to: {file_path}")
+                    QgsMessageLog.logMessage(
+                        f"File saved to: {file_path} (YAML backend: {YAML_BACKEND})"
+                    )
                 except:
                     pass # nosec
 
@@ -330,41 +498,89 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
             # QApplication.setOverrideCursor(Qt.WaitCursor)
             with open(file_name, "r", encoding="utf-8") as file:
                 file_content = file.read()
-                yaml_original_data_dict = yaml.safe_load(file_content)
 
-                self.update_config_data_and_ui(yaml_original_data_dict)
+            self.update_config_data_and_ui_from_yaml(file_content)
 
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Cannot open file:\n{str(e)}")
         # finally:
         #     QApplication.restoreOverrideCursor()
 
+    def get_yaml_original_data(self) -> dict | None:
+        """Originally loaded config data, used for the diff before saving.
+        If loaded from a YAML file, only the file content is kept, and it is parsed again on each call:
+        call once per use (e.g. per push or save)."""
+        if self._yaml_original_source is not None:
+            return load_yaml(self._yaml_original_source)
+        return self._yaml_original_dict
+
+    def set_yaml_original_data(self, data_dict: dict | None):
+        self._yaml_original_dict = data_dict
+        self._yaml_original_source = None
+        # Admin API URL the original data was pulled from (set after the pull)
+        self._yaml_original_url = None
+
     def update_config_data_and_ui(self, data_dict):
         """Use the data from local file or local server to reset the ConfigData and UI."""
 
+        # set data and .all_missing_props:
+        self.set_yaml_original_data(deepcopy(data_dict))
+        self._reset_config_data_and_ui(
+            lambda config_data: config_data.set_data_from_yaml(data_dict)
+        )
+
+    def update_config_data_and_ui_from_yaml(self, yaml_source: str):
+        """Use the YAML file content to reset the ConfigData and UI.
+        Resources are converted one at a time while the YAML is parsed, so the full document is never loaded at once.
+        """
+
+        # keep the compact YAML text instead of the parsed original data
+        self.set_yaml_original_data(None)
+        self._yaml_original_source = yaml_source
+        self._reset_config_data_and_ui(
+            lambda config_data: config_data.set_data_from_yaml_sections(
+                iter_yaml_config_sections(yaml_source)
+            )
+        )
+
+    def _reset_config_data_and_ui(self, set_config_data):
+        """Set the new ConfigData with the 'set_config_data' function, reset the UI and log deserialization messages."""
+
         # reset data
+        previous_config_data = self.config_data
         self.config_data = ConfigData()
 
         # set data and .all_missing_props:
-        self.yaml_original_data = deepcopy(data_dict)
-        self.config_data.set_data_from_yaml(data_dict)
+        set_config_data(self.config_data)
+        self.config_data.resources.add_rename_listener(self._on_resource_renamed)
+        self.resource_search_index.build(self.config_data.iter_resources_plain_data())
+        self.ui_setter.invalidate_resource_footprints()
+
+        # set UI from data, only where it changed
+        self.ui_setter.set_ui_from_data(
+            self.config_data.get_changed_sections(previous_config_data)
+        )
 
-        # set UI from data
-        self.ui_setter.set_ui_from_data()
+        # search results of the new resources
+        self._apply_resources_filter()
+
+        # resources' messages are logged when each resource is loaded for editing
+        self._log_deserialization_messages(*self.config_data.get_loaded_messages())
+
+    def _log_deserialization_messages(
+        self, defaults_message: list, error_message: list, all_missing_props: list
+    ):
+        """Log messages about missing or mistyped values during deserialization, warn about missing properties."""
 
-        # log messages about missing or mistyped values during deserialization
         # try/except in case of running it from pytests
         try:
+            QgsMessageLog.logMessage(f"Errors during deserialization: {error_message}")
             QgsMessageLog.logMessage(
-                f"Errors during deserialization: {self.config_data.error_message}"
-            )
-            QgsMessageLog.logMessage(
-                f"Default values used for missing YAML fields: {self.config_data.defaults_message}"
+                f"Default values used for missing YAML fields: {defaults_message}"
             )
 
             # summarize all properties missing/overwitten with defaults
             # atm, warning with the full list of properties
-            all_missing_props = self.config_data.all_missing_props
             QgsMessageLog.logMessage(
                 f"All missing or replaced properties: {all_missing_props}"
             )
@@ -376,7 +592,7 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
                     f"All missing or replaced properties (check logs for more details): {all_missing_props}",
                 ).exec_()
         except:
-        # QgsMessageLog import error in pytests, ignore
+            # QgsMessageLog import error in pytests, ignore
             pass  # nosec
 
     def _set_validate_ui_data(self) -> tuple[bool, list]:
@@ -412,31 +628,32 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
     ) -> tuple[bool, dict]:
         """Before saving the file, show the diff and give an option to proceed or cancel."""
 
-        new_config_data = self.config_data.asdict_enum_safe(
-            self.config_data, datetime_to_str=True
+        # both the string-datetime and native-datetime outputs, unchanged resources come from cache
+        new_config_data, new_config_data_native = (
+            self.config_data.asdict_enum_safe_variants()
         )
 
         # if created from skratch, no original data to compare to
-        if not self.yaml_original_data:
+        yaml_original_data = self.get_yaml_original_data()
+        if not yaml_original_data:
             return True, new_config_data
 
         diff_data = diff_yaml_dict(
-            self.yaml_original_data,
+            yaml_original_data,
             new_config_data,
         )
 
         # if get_yaml_output, preserve datetime objects without string conversion.
         # This is needed so the yaml dumper is using representer removing quotes from datetime strings
         if get_yaml_output:
-            new_config_data = self.config_data.asdict_enum_safe(
-                self.config_data, datetime_to_str=False
-            )
+            new_config_data = new_config_data_native
 
         # if no diff detected, directly accept the changes
         if (
             len(diff_data["added"])
             + len(diff_data["removed"])
             + len(diff_data["changed"])
+            + len(diff_data["moved"])
             == 0
         ):
             return True, new_config_data
@@ -568,20 +785,30 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
             sort=False,
         )
 
-    def try_add_res_provider(self, provider_index=None, data: list[str] | None = None):
-        """Called from .ui file, and from this class."""
+    def try_add_res_provider(self, provider: ProviderTemplate | None = None):
+        """Called from .ui file (with 'checked' argument, ignored), and from this class when editing a provider."""
         provider_type: ProviderTypes = get_enum_value_from_string(
             ProviderTypes, self.comboBoxResProviderType.currentText().lower()
         )
 
-        if not data:
+        if not isinstance(provider, ProviderTemplate):
             self.provider_window = NewProviderWindow(provider_type)
             provider_index = None
 
         else:
-            # if the window is triggered for editing, ignore widget provider type and read it from data instead
-            provider_type = get_enum_value_from_string(ProviderTypes, data[0])
-            self.provider_window = NewProviderWindow(provider_type, data[1:])
+            # if the window is triggered for editing, ignore widget provider type and read it from the provider instead;
+            # replaced by identity, as read-only providers can be mixed with the editable ones in the resource
+            provider_type = provider.type
+            res_providers = self.config_data.resources[self.current_res_name].providers
+            provider_index = next(
+                (
+                    i
+                    for i, res_provider in enumerate(res_providers)
+                    if res_provider is provider
+                ),
+                None,
+            )
+            self.provider_window = NewProviderWindow(provider_type, provider)
 
         # add or replace provider data to ConfigData when user clicks 'Add'
         self.provider_window.signal_provider_values.connect(
@@ -615,6 +842,69 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         url = self.data_from_ui_setter.get_extents_crs_from_ui(self)
         get_url_status(url, self)
 
+    def validate_resources_crs(self):
+        """Check CRS and TRS URLs of all resources in the background, each unique URL once,
+        and report the invalid ones per resource. Called from .ui file."""
+        references = collect_crs_references(
+            dict(self.config_data.iter_resources_plain_data())
+        )
+        if not any(references.values()):
+            QMessageBox.information(
+                self, "Information", "No CRS or TRS URLs found in resources."
+            )
+            return
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        self.pushValidateCollectionsCrs.setEnabled(False)
+        call_when_done(
+            validate_crs_references_async(references),
+            self._on_resources_crs_validated,
+        )
+
+    def _on_resources_crs_validated(self, future: Future):
+        try:
+            references = future.result()
+        except Exception as e:
+            QgsMessageLog.logMessage(f"An error occurred: {e}")
+            QMessageBox.critical(
+                self, "Error", f"An error occurred validating CRS and TRS URLs: {e}"
+            )
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+            self.pushValidateCollectionsCrs.setEnabled(True)
+
+        invalid_references = {}
+        for res_name, res_references in references.items():
+            invalid = {
+                reference.path: f"{reference.url}: {reference.message}"
+                for reference in res_references
+                if reference.valid is False
+            }
+            if invalid:
+                invalid_references[res_name] = invalid
+
+        if len(invalid_references) == 0:
+            urls_count = sum(len(res_refs) for res_refs in references.values())
+            # well-known URLs are not checked online
+            unverified_count = sum(
+                reference.valid is None
+                for res_references in references.values()
+                for reference in res_references
+            )
+            message = f"All {urls_count} CRS and TRS URLs of the resources are valid."
+            if unverified_count:
+                message = (
+                    f"No invalid CRS or TRS URLs found in the resources: "
+                    f"{urls_count - unverified_count} valid, "
+                    f"{unverified_count} well-known, not checked online."
+                )
+            QMessageBox.information(self, "Information", message)
+        else:
+            ReadOnlyTextDialog(
+                self, "Warning", {"Invalid CRS or TRS URLs": invalid_references}
+            ).exec_()
+
     def delete_server_lang(self):
         """Delete Server language from list, called from .ui file."""
         self.ui_setter.delete_list_widget_selected_item(self.listWidgetServerLangs)
@@ -656,23 +946,54 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         selected_items = self.listWidgetResProvider.selectedItems()
         if selected_items:
             item = selected_items[0]  # get the first (and only) selected item
-            data_list = item.text().split(STRING_SEPARATOR)
-            self.try_add_res_provider(self.listWidgetResProvider.row(item), data_list)
+            self.try_add_res_provider(get_item_object(item))
 
     def delete_res_provider(self):
         """Called from .ui file."""
 
-        # first, get selected item text and delete matching provider from Resource providers
-        self.data_from_ui_setter.delete_selected_provider_type_and_name(
-            self.listWidgetResProvider
-        )
+        # first, delete the provider of the selected item from Resource providers
+        self.data_from_ui_setter.delete_selected_provider(self.listWidgetResProvider)
         # then, remove the item from the list widget
         self.ui_setter.delete_list_widget_selected_item(self.listWidgetResProvider)
 
     def filterResources(self, filter):
-        """Called from .ui."""
-        self.proxy.setDynamicSortFilter(True)
-        self.proxy.setFilterFixedString(filter)
+        """Search resources (see ResourceSearchIndex), when typing pauses. Called from .ui."""
+        self._resources_filter = filter
+        self._resources_filter_timer.start()
+
+    def find_resources_in_map_extent(self):
+        """Filter the resources intersecting the current map extent. Called from .ui file."""
+        if self.bbox_map_canvas is None:
+            return
+        extent = self.bbox_map_canvas.extent()
+        bbox = [
+            extent.xMinimum(),
+            extent.yMinimum(),
+            extent.xMaximum(),
+            extent.yMaximum(),
+        ]
+        # searched as a query term, see ResourceSearchIndex
+        self.lineEditCollection.setText("bbox:" + ",".join(f"{v:.6g}" for v in bbox))
+
+    def _apply_resources_filter(self):
+        matching_names = self.resource_search_index.search(self._resources_filter)
+        # filter all resources, not only the rows fetched by the view so far
+        if matching_names is not None:
+            self.model.fetch_all()
+        self.proxy.set_matching_names(matching_names)
+
+    def _update_resource_search_index(self, res_name: str):
+        """Index the added, edited or removed resource again, refresh the search results and its map footprint."""
+        if res_name in self.config_data.resources:
+            self.resource_search_index.update_resource(
+                res_name, self.config_data.get_resource_plain_data(res_name)
+            )
+        else:
+            self.resource_search_index.remove_resource(res_name)
+        self.ui_setter.update_resource_footprint(res_name)
+
+        if self._resources_filter.strip():
+            self._apply_resources_filter()
 
     def exit_resource_edit(self):
         """Switch widgets to Preview, reset selected resource. Called from .ui and from this class too."""
@@ -680,7 +1001,9 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         self.groupBoxCollectionLoaded.hide()
         self.groupBoxCollectionSelect.show()
         self.groupBoxCollectionPreview.show()
-        self.ui_setter.refresh_resources_list_ui()
+
+        # providers can be changed without saving the resource
+        self._update_resource_search_index(self.current_res_name)
 
     def save_resource_edit_and_preview(self):
         """Save current changes to the resource data, reset widgets to Preview. Called from .ui."""
@@ -694,12 +1017,19 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
             )
             return
 
+        # a changed alias renames the resource (see '_on_resource_renamed')
         self.data_from_ui_setter.set_resource_data_from_ui()
 
-        # reset the current resource name, refresh UI list
+        # reset the current resource name
         self.current_res_name = self.lineEditResAlias.text()
         self.exit_resource_edit()
 
+    def _on_resource_renamed(self, old_name: str, new_name: str):
+        """Update the resource row in the UI list, drop the old name from the search index and the map.
+        The resource under the new name is indexed when leaving the resource edit."""
+        self.model.rename_resource(old_name, new_name)
+        self._update_resource_search_index(old_name)
+
     def preview_resource(self, model_index: QModelIndex = None):
         """Display basic Resource info, called from .ui."""
         self.ui_setter.preview_resource(model_index)
@@ -718,15 +1048,17 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         )
         if reply == QMessageBox.Yes:
             self.config_data.delete_resource(self)
+            self.model.remove_resource(self.current_res_name)
+            self._update_resource_search_index(self.current_res_name)
             self.ui_setter.preview_resource()
-            self.ui_setter.refresh_resources_list_ui()
             self.current_res_name = ""
 
     def new_resource(self):
         """Called from .ui."""
         # add resource and reload UI
         new_name = self.config_data.add_new_resource()
-        self.ui_setter.refresh_resources_list_ui()
+        self.model.insert_resource(new_name)
+        self._update_resource_search_index(new_name)
 
         # visually select new resource
         self.ui_setter.select_listcollection_item_by_text(new_name)
@@ -747,7 +1079,15 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         self.groupBoxCollectionSelect.hide()
         self.groupBoxCollectionLoaded.show()
 
+        # resource is converted from YAML data on first access: report its deserialization messages
+        newly_hydrated = not self.config_data.resources.is_hydrated(
+            self.current_res_name
+        )
         res_data = self.config_data.resources[self.current_res_name]
+        if newly_hydrated:
+            self._log_deserialization_messages(
+                *self.config_data.resources.get_messages([self.current_res_name])
+            )
         # self.ui_setter.setup_resouce_loaded_ui(res_data)
 
         # first, set ConfigData from UI (e.g. in case language was changed)
@@ -0,0 +1,1595 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'pygeoapi_config_dialog_base.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_PygeoapiConfigDialogBase(object):
+    def setupUi(self, PygeoapiConfigDialogBase):
+        PygeoapiConfigDialogBase.setObjectName("PygeoapiConfigDialogBase")
+        PygeoapiConfigDialogBase.resize(870, 947)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        PygeoapiConfigDialogBase.setWindowIcon(icon)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(PygeoapiConfigDialogBase)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.scrollArea = QtWidgets.QScrollArea(PygeoapiConfigDialogBase)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setObjectName("scrollArea")
+        self.scrollAreaWidgetContents = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, -96, 834, 1050))
+        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.tabWidget = QtWidgets.QTabWidget(self.scrollAreaWidgetContents)
+        self.tabWidget.setObjectName("tabWidget")
+        self.serverTab = QtWidgets.QWidget()
+        self.serverTab.setObjectName("serverTab")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.serverTab)
+        self.gridLayout_4.setHorizontalSpacing(50)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.groupBoxBind = QtWidgets.QGroupBox(self.serverTab)
+        self.groupBoxBind.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxBind.setObjectName("groupBoxBind")
+        self.gridLayout = QtWidgets.QGridLayout(self.groupBoxBind)
+        self.gridLayout.setObjectName("gridLayout")
+        self.lineEditHost = QtWidgets.QLineEdit(self.groupBoxBind)
+        self.lineEditHost.setObjectName("lineEditHost")
+        self.gridLayout.addWidget(self.lineEditHost, 0, 1, 1, 1)
+        self.label = QtWidgets.QLabel(self.groupBoxBind)
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+        self.label_2 = QtWidgets.QLabel(self.groupBoxBind)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+        self.lineEditPort = QtWidgets.QLineEdit(self.groupBoxBind)
+        self.lineEditPort.setObjectName("lineEditPort")
+        self.gridLayout.addWidget(self.lineEditPort, 1, 1, 1, 1)
+        self.gridLayout_4.addWidget(self.groupBoxBind, 0, 0, 1, 1)
+        self.frame = QtWidgets.QGroupBox(self.serverTab)
+        self.frame.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.frame.setTitle("")
+        self.frame.setObjectName("frame")
+        self.horizontalLayout = QtWidgets.QVBoxLayout(self.frame)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_3 = QtWidgets.QLabel(self.frame)
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_2.addWidget(self.label_3)
+        self.lineEditUrl = QtWidgets.QLineEdit(self.frame)
+        self.lineEditUrl.setObjectName("lineEditUrl")
+        self.horizontalLayout_2.addWidget(self.lineEditUrl)
+        self.horizontalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.label_5 = QtWidgets.QLabel(self.frame)
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_3.addWidget(self.label_5)
+        self.comboBoxEncoding = QtWidgets.QComboBox(self.frame)
+        self.comboBoxEncoding.setObjectName("comboBoxEncoding")
+        self.comboBoxEncoding.addItem("")
+        self.horizontalLayout_3.addWidget(self.comboBoxEncoding)
+        self.horizontalLayout.addLayout(self.horizontalLayout_3)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label_4 = QtWidgets.QLabel(self.frame)
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_4.addWidget(self.label_4)
+        self.comboBoxMime = QtWidgets.QComboBox(self.frame)
+        self.comboBoxMime.setObjectName("comboBoxMime")
+        self.comboBoxMime.addItem("")
+        self.horizontalLayout_4.addWidget(self.comboBoxMime)
+        self.horizontalLayout.addLayout(self.horizontalLayout_4)
+        self.gridLayout_4.addWidget(self.frame, 1, 0, 1, 1)
+        self.groupBoxMap = QtWidgets.QGroupBox(self.serverTab)
+        self.groupBoxMap.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxMap.setObjectName("groupBoxMap")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.groupBoxMap)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.lineEditMapUrl = QtWidgets.QLineEdit(self.groupBoxMap)
+        self.lineEditMapUrl.setObjectName("lineEditMapUrl")
+        self.gridLayout_2.addWidget(self.lineEditMapUrl, 0, 1, 1, 1)
+        self.label_9 = QtWidgets.QLabel(self.groupBoxMap)
+        self.label_9.setObjectName("label_9")
+        self.gridLayout_2.addWidget(self.label_9, 1, 0, 1, 1)
+        self.lineEditAttribution = QtWidgets.QLineEdit(self.groupBoxMap)
+        self.lineEditAttribution.setObjectName("lineEditAttribution")
+        self.gridLayout_2.addWidget(self.lineEditAttribution, 1, 1, 1, 1)
+        self.label_8 = QtWidgets.QLabel(self.groupBoxMap)
+        self.label_8.setObjectName("label_8")
+        self.gridLayout_2.addWidget(self.label_8, 0, 0, 1, 1)
+        self.gridLayout_4.addWidget(self.groupBoxMap, 2, 0, 1, 1)
+        self.groupBox = QtWidgets.QGroupBox(self.serverTab)
+        self.groupBox.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBox.setObjectName("groupBox")
+        self.gridLayoutLogSettings = QtWidgets.QGridLayout(self.groupBox)
+        self.gridLayoutLogSettings.setObjectName("gridLayoutLogSettings")
+        self.label_13 = QtWidgets.QLabel(self.groupBox)
+        self.label_13.setObjectName("label_13")
+        self.gridLayoutLogSettings.addWidget(self.label_13, 0, 0, 1, 1)
+        self._2 = QtWidgets.QHBoxLayout()
+        self._2.setObjectName("_2")
+        self.comboBoxLog = QtWidgets.QComboBox(self.groupBox)
+        self.comboBoxLog.setObjectName("comboBoxLog")
+        self._2.addWidget(self.comboBoxLog)
+        self.gridLayoutLogSettings.addLayout(self._2, 0, 1, 1, 1)
+        self.label_14 = QtWidgets.QLabel(self.groupBox)
+        self.label_14.setObjectName("label_14")
+        self.gridLayoutLogSettings.addWidget(self.label_14, 1, 0, 1, 1)
+        self._3 = QtWidgets.QHBoxLayout()
+        self._3.setObjectName("_3")
+        self.lineEditLogfile = QtWidgets.QLineEdit(self.groupBox)
+        self.lineEditLogfile.setObjectName("lineEditLogfile")
+        self._3.addWidget(self.lineEditLogfile)
+        self.pushButtonBrowse = QtWidgets.QPushButton(self.groupBox)
+        self.pushButtonBrowse.setMaximumSize(QtCore.QSize(50, 100))
+        icon = QtGui.QIcon.fromTheme("folder-open")
+        self.pushButtonBrowse.setIcon(icon)
+        self.pushButtonBrowse.setObjectName("pushButtonBrowse")
+        self._3.addWidget(self.pushButtonBrowse)
+        self.gridLayoutLogSettings.addLayout(self._3, 1, 1, 1, 1)
+        self.label_15 = QtWidgets.QLabel(self.groupBox)
+        self.label_15.setObjectName("label_15")
+        self.gridLayoutLogSettings.addWidget(self.label_15, 2, 0, 1, 1)
+        self._4 = QtWidgets.QHBoxLayout()
+        self._4.setObjectName("_4")
+        self.lineEditLogformat = QtWidgets.QLineEdit(self.groupBox)
+        self.lineEditLogformat.setObjectName("lineEditLogformat")
+        self._4.addWidget(self.lineEditLogformat)
+        self.gridLayoutLogSettings.addLayout(self._4, 2, 1, 1, 1)
+        self.label_16 = QtWidgets.QLabel(self.groupBox)
+        self.label_16.setObjectName("label_16")
+        self.gridLayoutLogSettings.addWidget(self.label_16, 3, 0, 1, 1)
+        self._5 = QtWidgets.QHBoxLayout()
+        self._5.setObjectName("_5")
+        self.lineEditDateformat = QtWidgets.QLineEdit(self.groupBox)
+        self.lineEditDateformat.setObjectName("lineEditDateformat")
+        self._5.addWidget(self.lineEditDateformat)
+        self.gridLayoutLogSettings.addLayout(self._5, 3, 1, 1, 1)
+        self.label_17 = QtWidgets.QLabel(self.groupBox)
+        self.label_17.setEnabled(False)
+        self.label_17.setObjectName("label_17")
+        self.gridLayoutLogSettings.addWidget(self.label_17, 4, 0, 1, 1)
+        self._6 = QtWidgets.QHBoxLayout()
+        self._6.setObjectName("_6")
+        self.listWidgetLogRotation = QtWidgets.QListWidget(self.groupBox)
+        self.listWidgetLogRotation.setEnabled(False)
+        self.listWidgetLogRotation.setMaximumSize(QtCore.QSize(1000, 22))
+        self.listWidgetLogRotation.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.listWidgetLogRotation.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.listWidgetLogRotation.setObjectName("listWidgetLogRotation")
+        self._6.addWidget(self.listWidgetLogRotation)
+        self.gridLayoutLogSettings.addLayout(self._6, 4, 1, 1, 1)
+        self.gridLayout_4.addWidget(self.groupBox, 5, 0, 1, 1)
+        self.groupBoxBind_2 = QtWidgets.QGroupBox(self.serverTab)
+        self.groupBoxBind_2.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxBind_2.setTitle("")
+        self.groupBoxBind_2.setObjectName("groupBoxBind_2")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.groupBoxBind_2)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.label_7 = QtWidgets.QLabel(self.groupBoxBind_2)
+        self.label_7.setObjectName("label_7")
+        self.gridLayout_3.addWidget(self.label_7, 0, 0, 1, 1)
+        self.comboBoxLangSingle = QtWidgets.QComboBox(self.groupBoxBind_2)
+        self.comboBoxLangSingle.setObjectName("comboBoxLangSingle")
+        self.gridLayout_3.addWidget(self.comboBoxLangSingle, 0, 1, 1, 1)
+        self.label_10 = QtWidgets.QLabel(self.groupBoxBind_2)
+        self.label_10.setObjectName("label_10")
+        self.gridLayout_3.addWidget(self.label_10, 1, 0, 1, 1)
+        self._7 = QtWidgets.QHBoxLayout()
+        self._7.setObjectName("_7")
+        self._8 = QtWidgets.QVBoxLayout()
+        self._8.setObjectName("_8")
+        spacerItem = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._8.addItem(spacerItem)
+        self.comboBoxServerLangs = QtWidgets.QComboBox(self.groupBoxBind_2)
+        self.comboBoxServerLangs.setObjectName("comboBoxServerLangs")
+        self.comboBoxServerLangs.addItem("")
+        self.comboBoxServerLangs.addItem("")
+        self.comboBoxServerLangs.addItem("")
+        self.comboBoxServerLangs.addItem("")
+        self.comboBoxServerLangs.addItem("")
+        self._8.addWidget(self.comboBoxServerLangs)
+        self.addServerLangsButton = QtWidgets.QPushButton(self.groupBoxBind_2)
+        self.addServerLangsButton.setObjectName("addServerLangsButton")
+        self._8.addWidget(self.addServerLangsButton)
+        self._7.addLayout(self._8)
+        self._9 = QtWidgets.QVBoxLayout()
+        self._9.setObjectName("_9")
+        spacerItem1 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._9.addItem(spacerItem1)
+        self.listWidgetServerLangs = QtWidgets.QListWidget(self.groupBoxBind_2)
+        self.listWidgetServerLangs.setMaximumSize(QtCore.QSize(1000, 80))
+        self.listWidgetServerLangs.setObjectName("listWidgetServerLangs")
+        self._9.addWidget(self.listWidgetServerLangs)
+        self.deleteServerLangsButton = QtWidgets.QPushButton(self.groupBoxBind_2)
+        self.deleteServerLangsButton.setObjectName("deleteServerLangsButton")
+        self._9.addWidget(self.deleteServerLangsButton)
+        self._7.addLayout(self._9)
+        self.gridLayout_3.addLayout(self._7, 1, 1, 1, 1)
+        self.gridLayout_4.addWidget(self.groupBoxBind_2, 6, 0, 1, 1)
+        self.groupBoxLimits = QtWidgets.QGroupBox(self.serverTab)
+        self.groupBoxLimits.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxLimits.setObjectName("groupBoxLimits")
+        self.gridLayout_5 = QtWidgets.QGridLayout(self.groupBoxLimits)
+        self.gridLayout_5.setObjectName("gridLayout_5")
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.label_6 = QtWidgets.QLabel(self.groupBoxLimits)
+        self.label_6.setWordWrap(True)
+        self.label_6.setObjectName("label_6")
+        self.horizontalLayout_8.addWidget(self.label_6)
+        self.spinBoxDefault = QtWidgets.QSpinBox(self.groupBoxLimits)
+        self.spinBoxDefault.setMaximum(9999)
+        self.spinBoxDefault.setObjectName("spinBoxDefault")
+        self.horizontalLayout_8.addWidget(self.spinBoxDefault)
+        self.gridLayout_5.addLayout(self.horizontalLayout_8, 0, 0, 1, 1)
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.label_11 = QtWidgets.QLabel(self.groupBoxLimits)
+        self.label_11.setObjectName("label_11")
+        self.horizontalLayout_9.addWidget(self.label_11)
+        self.comboBoxExceed = QtWidgets.QComboBox(self.groupBoxLimits)
+        self.comboBoxExceed.setObjectName("comboBoxExceed")
+        self.horizontalLayout_9.addWidget(self.comboBoxExceed)
+        self.gridLayout_5.addLayout(self.horizontalLayout_9, 1, 0, 1, 2)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.label_12 = QtWidgets.QLabel(self.groupBoxLimits)
+        self.label_12.setWordWrap(True)
+        self.label_12.setObjectName("label_12")
+        self.horizontalLayout_6.addWidget(self.label_12)
+        self.spinBoxMax = QtWidgets.QSpinBox(self.groupBoxLimits)
+        self.spinBoxMax.setMaximum(9999)
+        self.spinBoxMax.setObjectName("spinBoxMax")
+        self.horizontalLayout_6.addWidget(self.spinBoxMax)
+        self.gridLayout_5.addLayout(self.horizontalLayout_6, 0, 1, 1, 1)
+        self.label_18 = QtWidgets.QLabel(self.groupBoxLimits)
+        self.label_18.setEnabled(False)
+        self.label_18.setObjectName("label_18")
+        self.gridLayout_5.addWidget(self.label_18, 2, 0, 1, 1)
+        self.lineEditServerLimitsMaxDistX = QtWidgets.QLineEdit(self.groupBoxLimits)
+        self.lineEditServerLimitsMaxDistX.setEnabled(False)
+        self.lineEditServerLimitsMaxDistX.setObjectName("lineEditServerLimitsMaxDistX")
+        self.gridLayout_5.addWidget(self.lineEditServerLimitsMaxDistX, 2, 1, 1, 1)
+        self.label_19 = QtWidgets.QLabel(self.groupBoxLimits)
+        self.label_19.setEnabled(False)
+        self.label_19.setObjectName("label_19")
+        self.gridLayout_5.addWidget(self.label_19, 3, 0, 1, 1)
+        self.lineEditServerLimitsMaxDistY = QtWidgets.QLineEdit(self.groupBoxLimits)
+        self.lineEditServerLimitsMaxDistY.setEnabled(False)
+        self.lineEditServerLimitsMaxDistY.setObjectName("lineEditServerLimitsMaxDistY")
+        self.gridLayout_5.addWidget(self.lineEditServerLimitsMaxDistY, 3, 1, 1, 1)
+        self.label_20 = QtWidgets.QLabel(self.groupBoxLimits)
+        self.label_20.setEnabled(False)
+        self.label_20.setObjectName("label_20")
+        self.gridLayout_5.addWidget(self.label_20, 4, 0, 1, 1)
+        self.lineEditServerLimitsMaxDistUnits = QtWidgets.QLineEdit(self.groupBoxLimits)
+        self.lineEditServerLimitsMaxDistUnits.setEnabled(False)
+        self.lineEditServerLimitsMaxDistUnits.setObjectName("lineEditServerLimitsMaxDistUnits")
+        self.gridLayout_5.addWidget(self.lineEditServerLimitsMaxDistUnits, 4, 1, 1, 1)
+        self.gridLayout_4.addWidget(self.groupBoxLimits, 1, 1, 2, 1)
+        self.groupBox_2 = QtWidgets.QGroupBox(self.serverTab)
+        self.groupBox_2.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.gridLayout_9 = QtWidgets.QGridLayout(self.groupBox_2)
+        self.gridLayout_9.setObjectName("gridLayout_9")
+        self.label_21 = QtWidgets.QLabel(self.groupBox_2)
+        self.label_21.setObjectName("label_21")
+        self.gridLayout_9.addWidget(self.label_21, 0, 0, 1, 1)
+        self.lineEditTemplatesPath = QtWidgets.QLineEdit(self.groupBox_2)
+        self.lineEditTemplatesPath.setObjectName("lineEditTemplatesPath")
+        self.gridLayout_9.addWidget(self.lineEditTemplatesPath, 0, 1, 1, 1)
+        self.pushButtonBrowseTemplatesPath = QtWidgets.QPushButton(self.groupBox_2)
+        self.pushButtonBrowseTemplatesPath.setMaximumSize(QtCore.QSize(50, 100))
+        icon = QtGui.QIcon.fromTheme("folder-open")
+        self.pushButtonBrowseTemplatesPath.setIcon(icon)
+        self.pushButtonBrowseTemplatesPath.setObjectName("pushButtonBrowseTemplatesPath")
+        self.gridLayout_9.addWidget(self.pushButtonBrowseTemplatesPath, 0, 2, 1, 1)
+        self.label_22 = QtWidgets.QLabel(self.groupBox_2)
+        self.label_22.setObjectName("label_22")
+        self.gridLayout_9.addWidget(self.label_22, 1, 0, 1, 1)
+        self.lineEditTemplatesStatic = QtWidgets.QLineEdit(self.groupBox_2)
+        self.lineEditTemplatesStatic.setObjectName("lineEditTemplatesStatic")
+        self.gridLayout_9.addWidget(self.lineEditTemplatesStatic, 1, 1, 1, 1)
+        self.pushButtonBrowseTemplatesStatic = QtWidgets.QPushButton(self.groupBox_2)
+        self.pushButtonBrowseTemplatesStatic.setMaximumSize(QtCore.QSize(50, 100))
+        icon = QtGui.QIcon.fromTheme("folder-open")
+        self.pushButtonBrowseTemplatesStatic.setIcon(icon)
+        self.pushButtonBrowseTemplatesStatic.setObjectName("pushButtonBrowseTemplatesStatic")
+        self.gridLayout_9.addWidget(self.pushButtonBrowseTemplatesStatic, 1, 2, 1, 1)
+        self.gridLayout_4.addWidget(self.groupBox_2, 0, 1, 1, 1)
+        self.groupBox_3 = QtWidgets.QGroupBox(self.serverTab)
+        self.groupBox_3.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBox_3.setTitle("")
+        self.groupBox_3.setObjectName("groupBox_3")
+        self.gridLayoutLogSettings_2 = QtWidgets.QGridLayout(self.groupBox_3)
+        self.gridLayoutLogSettings_2.setObjectName("gridLayoutLogSettings_2")
+        self.label_23 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_23.setObjectName("label_23")
+        self.gridLayoutLogSettings_2.addWidget(self.label_23, 0, 0, 1, 1)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.comboBoxAdmin = QtWidgets.QComboBox(self.groupBox_3)
+        self.comboBoxAdmin.setObjectName("comboBoxAdmin")
+        self.horizontalLayout_5.addWidget(self.comboBoxAdmin)
+        self.gridLayoutLogSettings_2.addLayout(self.horizontalLayout_5, 0, 1, 1, 1)
+        self.label_24 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_24.setObjectName("label_24")
+        self.gridLayoutLogSettings_2.addWidget(self.label_24, 1, 0, 1, 1)
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.comboBoxGzip = QtWidgets.QComboBox(self.groupBox_3)
+        self.comboBoxGzip.setObjectName("comboBoxGzip")
+        self.horizontalLayout_7.addWidget(self.comboBoxGzip)
+        self.gridLayoutLogSettings_2.addLayout(self.horizontalLayout_7, 1, 1, 1, 1)
+        self.label_25 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_25.setObjectName("label_25")
+        self.gridLayoutLogSettings_2.addWidget(self.label_25, 2, 0, 1, 1)
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.comboBoxPretty = QtWidgets.QComboBox(self.groupBox_3)
+        self.comboBoxPretty.setObjectName("comboBoxPretty")
+        self.horizontalLayout_10.addWidget(self.comboBoxPretty)
+        self.gridLayoutLogSettings_2.addLayout(self.horizontalLayout_10, 2, 1, 1, 1)
+        self.label_26 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_26.setObjectName("label_26")
+        self.gridLayoutLogSettings_2.addWidget(self.label_26, 3, 0, 1, 1)
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.comboBoxCors = QtWidgets.QComboBox(self.groupBox_3)
+        self.comboBoxCors.setObjectName("comboBoxCors")
+        self.horizontalLayout_11.addWidget(self.comboBoxCors)
+        self.gridLayoutLogSettings_2.addLayout(self.horizontalLayout_11, 3, 1, 1, 1)
+        self.label_27 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_27.setEnabled(False)
+        self.label_27.setObjectName("label_27")
+        self.gridLayoutLogSettings_2.addWidget(self.label_27, 4, 0, 1, 1)
+        self._10 = QtWidgets.QHBoxLayout()
+        self._10.setObjectName("_10")
+        self.lineEditServerOgcSchemasLocation = QtWidgets.QLineEdit(self.groupBox_3)
+        self.lineEditServerOgcSchemasLocation.setEnabled(False)
+        self.lineEditServerOgcSchemasLocation.setObjectName("lineEditServerOgcSchemasLocation")
+        self._10.addWidget(self.lineEditServerOgcSchemasLocation)
+        self.gridLayoutLogSettings_2.addLayout(self._10, 4, 1, 1, 1)
+        self.label_28 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_28.setEnabled(False)
+        self.label_28.setObjectName("label_28")
+        self.gridLayoutLogSettings_2.addWidget(self.label_28, 5, 0, 1, 1)
+        self.lineEditServerIcon = QtWidgets.QLineEdit(self.groupBox_3)
+        self.lineEditServerIcon.setEnabled(False)
+        self.lineEditServerIcon.setObjectName("lineEditServerIcon")
+        self.gridLayoutLogSettings_2.addWidget(self.lineEditServerIcon, 5, 1, 1, 1)
+        self.label_29 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_29.setEnabled(False)
+        self.label_29.setObjectName("label_29")
+        self.gridLayoutLogSettings_2.addWidget(self.label_29, 6, 0, 1, 1)
+        self.lineEditServerLogo = QtWidgets.QLineEdit(self.groupBox_3)
+        self.lineEditServerLogo.setEnabled(False)
+        self.lineEditServerLogo.setObjectName("lineEditServerLogo")
+        self.gridLayoutLogSettings_2.addWidget(self.lineEditServerLogo, 6, 1, 1, 1)
+        self.label_30 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_30.setEnabled(False)
+        self.label_30.setObjectName("label_30")
+        self.gridLayoutLogSettings_2.addWidget(self.label_30, 7, 0, 1, 1)
+        self.lineEditServerLocaleDir = QtWidgets.QLineEdit(self.groupBox_3)
+        self.lineEditServerLocaleDir.setEnabled(False)
+        self.lineEditServerLocaleDir.setObjectName("lineEditServerLocaleDir")
+        self.gridLayoutLogSettings_2.addWidget(self.lineEditServerLocaleDir, 7, 1, 1, 1)
+        self.label_31 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_31.setEnabled(False)
+        self.label_31.setObjectName("label_31")
+        self.gridLayoutLogSettings_2.addWidget(self.label_31, 8, 0, 1, 1)
+        self._11 = QtWidgets.QHBoxLayout()
+        self._11.setObjectName("_11")
+        self.listWidgetApiRules = QtWidgets.QListWidget(self.groupBox_3)
+        self.listWidgetApiRules.setEnabled(False)
+        self.listWidgetApiRules.setMaximumSize(QtCore.QSize(1000, 22))
+        self.listWidgetApiRules.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.listWidgetApiRules.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.listWidgetApiRules.setObjectName("listWidgetApiRules")
+        self._11.addWidget(self.listWidgetApiRules)
+        self.gridLayoutLogSettings_2.addLayout(self._11, 8, 1, 1, 1)
+        self.label_32 = QtWidgets.QLabel(self.groupBox_3)
+        self.label_32.setEnabled(False)
+        self.label_32.setObjectName("label_32")
+        self.gridLayoutLogSettings_2.addWidget(self.label_32, 9, 0, 1, 1)
+        self._12 = QtWidgets.QHBoxLayout()
+        self._12.setObjectName("_12")
+        self.listWidgetServerManager = QtWidgets.QListWidget(self.groupBox_3)
+        self.listWidgetServerManager.setEnabled(False)
+        self.listWidgetServerManager.setMaximumSize(QtCore.QSize(1000, 22))
+        self.listWidgetServerManager.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.listWidgetServerManager.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.listWidgetServerManager.setObjectName("listWidgetServerManager")
+        self._12.addWidget(self.listWidgetServerManager)
+        self.gridLayoutLogSettings_2.addLayout(self._12, 9, 1, 1, 1)
+        self.gridLayout_4.addWidget(self.groupBox_3, 5, 1, 2, 1)
+        self.tabWidget.addTab(self.serverTab, "")
+        self.metadataTab = QtWidgets.QWidget()
+        self.metadataTab.setObjectName("metadataTab")
+        self.gridLayout_20 = QtWidgets.QGridLayout(self.metadataTab)
+        self.gridLayout_20.setHorizontalSpacing(50)
+        self.gridLayout_20.setObjectName("gridLayout_20")
+        self.groupBoxBind_3 = QtWidgets.QGroupBox(self.metadataTab)
+        self.groupBoxBind_3.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxBind_3.setObjectName("groupBoxBind_3")
+        self.gridLayout_6 = QtWidgets.QGridLayout(self.groupBoxBind_3)
+        self.gridLayout_6.setObjectName("gridLayout_6")
+        self.label_33 = QtWidgets.QLabel(self.groupBoxBind_3)
+        self.label_33.setObjectName("label_33")
+        self.gridLayout_6.addWidget(self.label_33, 0, 0, 1, 1)
+        self._13 = QtWidgets.QHBoxLayout()
+        self._13.setObjectName("_13")
+        self._14 = QtWidgets.QVBoxLayout()
+        self._14.setObjectName("_14")
+        spacerItem2 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._14.addItem(spacerItem2)
+        self._15 = QtWidgets.QVBoxLayout()
+        self._15.setObjectName("_15")
+        self._16 = QtWidgets.QHBoxLayout()
+        self._16.setObjectName("_16")
+        self.comboBoxIdTitleLocale = QtWidgets.QComboBox(self.groupBoxBind_3)
+        self.comboBoxIdTitleLocale.setObjectName("comboBoxIdTitleLocale")
+        self.comboBoxIdTitleLocale.addItem("")
+        self.comboBoxIdTitleLocale.addItem("")
+        self.comboBoxIdTitleLocale.addItem("")
+        self._16.addWidget(self.comboBoxIdTitleLocale)
+        self.addMetadataIdTitleLineEdit = QtWidgets.QLineEdit(self.groupBoxBind_3)
+        self.addMetadataIdTitleLineEdit.setObjectName("addMetadataIdTitleLineEdit")
+        self._16.addWidget(self.addMetadataIdTitleLineEdit)
+        self._15.addLayout(self._16)
+        self.addMetadataIdTitleButton = QtWidgets.QPushButton(self.groupBoxBind_3)
+        self.addMetadataIdTitleButton.setObjectName("addMetadataIdTitleButton")
+        self._15.addWidget(self.addMetadataIdTitleButton)
+        self._14.addLayout(self._15)
+        self._13.addLayout(self._14)
+        self._17 = QtWidgets.QVBoxLayout()
+        self._17.setObjectName("_17")
+        self.listWidgetMetadataIdTitle = QtWidgets.QListWidget(self.groupBoxBind_3)
+        self.listWidgetMetadataIdTitle.setMaximumSize(QtCore.QSize(1000, 200))
+        self.listWidgetMetadataIdTitle.setObjectName("listWidgetMetadataIdTitle")
+        self._17.addWidget(self.listWidgetMetadataIdTitle)
+        self.deleteMetadataIdTitleButton = QtWidgets.QPushButton(self.groupBoxBind_3)
+        self.deleteMetadataIdTitleButton.setObjectName("deleteMetadataIdTitleButton")
+        self._17.addWidget(self.deleteMetadataIdTitleButton)
+        self._13.addLayout(self._17)
+        self.gridLayout_6.addLayout(self._13, 0, 1, 1, 1)
+        self.label_34 = QtWidgets.QLabel(self.groupBoxBind_3)
+        self.label_34.setObjectName("label_34")
+        self.gridLayout_6.addWidget(self.label_34, 1, 0, 1, 1)
+        self._18 = QtWidgets.QHBoxLayout()
+        self._18.setObjectName("_18")
+        self._19 = QtWidgets.QVBoxLayout()
+        self._19.setObjectName("_19")
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._19.addItem(spacerItem3)
+        self._20 = QtWidgets.QVBoxLayout()
+        self._20.setObjectName("_20")
+        self._21 = QtWidgets.QHBoxLayout()
+        self._21.setObjectName("_21")
+        self.comboBoxIdDescriptionLocale = QtWidgets.QComboBox(self.groupBoxBind_3)
+        self.comboBoxIdDescriptionLocale.setObjectName("comboBoxIdDescriptionLocale")
+        self.comboBoxIdDescriptionLocale.addItem("")
+        self.comboBoxIdDescriptionLocale.addItem("")
+        self.comboBoxIdDescriptionLocale.addItem("")
+        self._21.addWidget(self.comboBoxIdDescriptionLocale)
+        self.addMetadataIdDescriptionLineEdit = QtWidgets.QLineEdit(self.groupBoxBind_3)
+        self.addMetadataIdDescriptionLineEdit.setObjectName("addMetadataIdDescriptionLineEdit")
+        self._21.addWidget(self.addMetadataIdDescriptionLineEdit)
+        self._20.addLayout(self._21)
+        self.addMetadataIdDescriptionButton = QtWidgets.QPushButton(self.groupBoxBind_3)
+        self.addMetadataIdDescriptionButton.setObjectName("addMetadataIdDescriptionButton")
+        self._20.addWidget(self.addMetadataIdDescriptionButton)
+        self._19.addLayout(self._20)
+        self._18.addLayout(self._19)
+        self._22 = QtWidgets.QVBoxLayout()
+        self._22.setObjectName("_22")
+        self.listWidgetMetadataIdDescription = QtWidgets.QListWidget(self.groupBoxBind_3)
+        self.listWidgetMetadataIdDescription.setMaximumSize(QtCore.QSize(1000, 200))
+        self.listWidgetMetadataIdDescription.setObjectName("listWidgetMetadataIdDescription")
+        self._22.addWidget(self.listWidgetMetadataIdDescription)
+        self.deleteMetadataIdDescriptionButton = QtWidgets.QPushButton(self.groupBoxBind_3)
+        self.deleteMetadataIdDescriptionButton.setObjectName("deleteMetadataIdDescriptionButton")
+        self._22.addWidget(self.deleteMetadataIdDescriptionButton)
+        self._18.addLayout(self._22)
+        self.gridLayout_6.addLayout(self._18, 1, 1, 1, 1)
+        self.label_35 = QtWidgets.QLabel(self.groupBoxBind_3)
+        self.label_35.setObjectName("label_35")
+        self.gridLayout_6.addWidget(self.label_35, 2, 0, 1, 1)
+        self._23 = QtWidgets.QHBoxLayout()
+        self._23.setObjectName("_23")
+        self._24 = QtWidgets.QVBoxLayout()
+        self._24.setObjectName("_24")
+        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._24.addItem(spacerItem4)
+        self._25 = QtWidgets.QVBoxLayout()
+        self._25.setObjectName("_25")
+        self._26 = QtWidgets.QHBoxLayout()
+        self._26.setObjectName("_26")
+        self.comboBoxKeywordsLocale = QtWidgets.QComboBox(self.groupBoxBind_3)
+        self.comboBoxKeywordsLocale.setObjectName("comboBoxKeywordsLocale")
+        self.comboBoxKeywordsLocale.addItem("")
+        self.comboBoxKeywordsLocale.addItem("")
+        self.comboBoxKeywordsLocale.addItem("")
+        self._26.addWidget(self.comboBoxKeywordsLocale)
+        self.addMetadataKeywordLineEdit = QtWidgets.QLineEdit(self.groupBoxBind_3)
+        self.addMetadataKeywordLineEdit.setObjectName("addMetadataKeywordLineEdit")
+        self._26.addWidget(self.addMetadataKeywordLineEdit)
+        self._25.addLayout(self._26)
+        self.addMetadataKeywordButton = QtWidgets.QPushButton(self.groupBoxBind_3)
+        self.addMetadataKeywordButton.setObjectName("addMetadataKeywordButton")
+        self._25.addWidget(self.addMetadataKeywordButton)
+        self._24.addLayout(self._25)
+        self._23.addLayout(self._24)
+        self._27 = QtWidgets.QVBoxLayout()
+        self._27.setObjectName("_27")
+        self.listWidgetMetadataIdKeywords = QtWidgets.QListWidget(self.groupBoxBind_3)
+        self.listWidgetMetadataIdKeywords.setMaximumSize(QtCore.QSize(1000, 200))
+        self.listWidgetMetadataIdKeywords.setObjectName("listWidgetMetadataIdKeywords")
+        self._27.addWidget(self.listWidgetMetadataIdKeywords)
+        self.deleteMetadataKeywordButton = QtWidgets.QPushButton(self.groupBoxBind_3)
+        self.deleteMetadataKeywordButton.setObjectName("deleteMetadataKeywordButton")
+        self._27.addWidget(self.deleteMetadataKeywordButton)
+        self._23.addLayout(self._27)
+        self.gridLayout_6.addLayout(self._23, 2, 1, 1, 1)
+        self.label_36 = QtWidgets.QLabel(self.groupBoxBind_3)
+        self.label_36.setObjectName("label_36")
+        self.gridLayout_6.addWidget(self.label_36, 3, 0, 1, 1)
+        self.comboBoxMetadataIdKeywordsType = QtWidgets.QComboBox(self.groupBoxBind_3)
+        self.comboBoxMetadataIdKeywordsType.setObjectName("comboBoxMetadataIdKeywordsType")
+        self.gridLayout_6.addWidget(self.comboBoxMetadataIdKeywordsType, 3, 1, 1, 1)
+        self.label_37 = QtWidgets.QLabel(self.groupBoxBind_3)
+        self.label_37.setObjectName("label_37")
+        self.gridLayout_6.addWidget(self.label_37, 4, 0, 1, 1)
+        self.lineEditMetadataIdTerms = QtWidgets.QLineEdit(self.groupBoxBind_3)
+        self.lineEditMetadataIdTerms.setObjectName("lineEditMetadataIdTerms")
+        self.gridLayout_6.addWidget(self.lineEditMetadataIdTerms, 4, 1, 1, 1)
+        self.label_38 = QtWidgets.QLabel(self.groupBoxBind_3)
+        self.label_38.setObjectName("label_38")
+        self.gridLayout_6.addWidget(self.label_38, 5, 0, 1, 1)
+        self.lineEditMetadataIdUrl = QtWidgets.QLineEdit(self.groupBoxBind_3)
+        self.lineEditMetadataIdUrl.setObjectName("lineEditMetadataIdUrl")
+        self.gridLayout_6.addWidget(self.lineEditMetadataIdUrl, 5, 1, 1, 1)
+        self.gridLayout_20.addWidget(self.groupBoxBind_3, 0, 0, 2, 1)
+        self.groupBoxBind_4 = QtWidgets.QGroupBox(self.metadataTab)
+        self.groupBoxBind_4.setMaximumSize(QtCore.QSize(800, 150))
+        self.groupBoxBind_4.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxBind_4.setObjectName("groupBoxBind_4")
+        self.gridLayout_7 = QtWidgets.QGridLayout(self.groupBoxBind_4)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        self.label_39 = QtWidgets.QLabel(self.groupBoxBind_4)
+        self.label_39.setObjectName("label_39")
+        self.gridLayout_7.addWidget(self.label_39, 0, 0, 1, 1)
+        self.lineEditMetadataLicenseName = QtWidgets.QLineEdit(self.groupBoxBind_4)
+        self.lineEditMetadataLicenseName.setObjectName("lineEditMetadataLicenseName")
+        self.gridLayout_7.addWidget(self.lineEditMetadataLicenseName, 0, 1, 1, 1)
+        self.label_40 = QtWidgets.QLabel(self.groupBoxBind_4)
+        self.label_40.setObjectName("label_40")
+        self.gridLayout_7.addWidget(self.label_40, 1, 0, 1, 1)
+        self.lineEditMetadataLicenseUrl = QtWidgets.QLineEdit(self.groupBoxBind_4)
+        self.lineEditMetadataLicenseUrl.setObjectName("lineEditMetadataLicenseUrl")
+        self.gridLayout_7.addWidget(self.lineEditMetadataLicenseUrl, 1, 1, 1, 1)
+        self.gridLayout_20.addWidget(self.groupBoxBind_4, 2, 0, 1, 1)
+        self.groupBoxBind_5 = QtWidgets.QGroupBox(self.metadataTab)
+        self.groupBoxBind_5.setMaximumSize(QtCore.QSize(800, 150))
+        self.groupBoxBind_5.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxBind_5.setObjectName("groupBoxBind_5")
+        self.gridLayout_8 = QtWidgets.QGridLayout(self.groupBoxBind_5)
+        self.gridLayout_8.setObjectName("gridLayout_8")
+        self.label_41 = QtWidgets.QLabel(self.groupBoxBind_5)
+        self.label_41.setObjectName("label_41")
+        self.gridLayout_8.addWidget(self.label_41, 0, 0, 1, 1)
+        self.lineEditMetadataProviderName = QtWidgets.QLineEdit(self.groupBoxBind_5)
+        self.lineEditMetadataProviderName.setObjectName("lineEditMetadataProviderName")
+        self.gridLayout_8.addWidget(self.lineEditMetadataProviderName, 0, 1, 1, 1)
+        self.label_42 = QtWidgets.QLabel(self.groupBoxBind_5)
+        self.label_42.setObjectName("label_42")
+        self.gridLayout_8.addWidget(self.label_42, 1, 0, 1, 1)
+        self.lineEditMetadataProviderUrl = QtWidgets.QLineEdit(self.groupBoxBind_5)
+        self.lineEditMetadataProviderUrl.setObjectName("lineEditMetadataProviderUrl")
+        self.gridLayout_8.addWidget(self.lineEditMetadataProviderUrl, 1, 1, 1, 1)
+        self.gridLayout_20.addWidget(self.groupBoxBind_5, 3, 0, 1, 1)
+        self.groupBoxBind_6 = QtWidgets.QGroupBox(self.metadataTab)
+        self.groupBoxBind_6.setMinimumSize(QtCore.QSize(300, 500))
+        self.groupBoxBind_6.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxBind_6.setObjectName("groupBoxBind_6")
+        self.gridLayout_10 = QtWidgets.QGridLayout(self.groupBoxBind_6)
+        self.gridLayout_10.setObjectName("gridLayout_10")
+        self.label_43 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_43.setObjectName("label_43")
+        self.gridLayout_10.addWidget(self.label_43, 0, 0, 1, 1)
+        self.lineEditMetadataContactName = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactName.setObjectName("lineEditMetadataContactName")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactName, 0, 1, 1, 1)
+        self.label_44 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_44.setObjectName("label_44")
+        self.gridLayout_10.addWidget(self.label_44, 1, 0, 1, 1)
+        self.lineEditMetadataContactPosition = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactPosition.setObjectName("lineEditMetadataContactPosition")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactPosition, 1, 1, 1, 1)
+        self.label_45 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_45.setObjectName("label_45")
+        self.gridLayout_10.addWidget(self.label_45, 2, 0, 1, 1)
+        self.lineEditMetadataContactAddress = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactAddress.setObjectName("lineEditMetadataContactAddress")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactAddress, 2, 1, 1, 1)
+        self.label_46 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_46.setObjectName("label_46")
+        self.gridLayout_10.addWidget(self.label_46, 3, 0, 1, 1)
+        self.lineEditMetadataContactCity = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactCity.setObjectName("lineEditMetadataContactCity")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactCity, 3, 1, 1, 1)
+        self.label_47 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_47.setObjectName("label_47")
+        self.gridLayout_10.addWidget(self.label_47, 4, 0, 1, 1)
+        self.lineEditMetadataContactState = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactState.setObjectName("lineEditMetadataContactState")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactState, 4, 1, 1, 1)
+        self.label_48 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_48.setObjectName("label_48")
+        self.gridLayout_10.addWidget(self.label_48, 5, 0, 1, 1)
+        self.lineEditMetadataContactPostal = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactPostal.setObjectName("lineEditMetadataContactPostal")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactPostal, 5, 1, 1, 1)
+        self.label_49 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_49.setObjectName("label_49")
+        self.gridLayout_10.addWidget(self.label_49, 6, 0, 1, 1)
+        self.lineEditMetadataContactCountry = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactCountry.setObjectName("lineEditMetadataContactCountry")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactCountry, 6, 1, 1, 1)
+        self.label_50 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_50.setObjectName("label_50")
+        self.gridLayout_10.addWidget(self.label_50, 7, 0, 1, 1)
+        self.lineEditMetadataContactPhone = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactPhone.setObjectName("lineEditMetadataContactPhone")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactPhone, 7, 1, 1, 1)
+        self.label_51 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_51.setObjectName("label_51")
+        self.gridLayout_10.addWidget(self.label_51, 8, 0, 1, 1)
+        self.lineEditMetadataContactFax = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactFax.setObjectName("lineEditMetadataContactFax")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactFax, 8, 1, 1, 1)
+        self.label_52 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_52.setObjectName("label_52")
+        self.gridLayout_10.addWidget(self.label_52, 9, 0, 1, 1)
+        self.lineEditMetadataContactEmail = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactEmail.setObjectName("lineEditMetadataContactEmail")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactEmail, 9, 1, 1, 1)
+        self.label_53 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_53.setObjectName("label_53")
+        self.gridLayout_10.addWidget(self.label_53, 10, 0, 1, 1)
+        self.lineEditMetadataContactUrl = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactUrl.setObjectName("lineEditMetadataContactUrl")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactUrl, 10, 1, 1, 1)
+        self.label_54 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_54.setObjectName("label_54")
+        self.gridLayout_10.addWidget(self.label_54, 11, 0, 1, 1)
+        self.lineEditMetadataContactHours = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactHours.setObjectName("lineEditMetadataContactHours")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactHours, 11, 1, 1, 1)
+        self.label_55 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_55.setObjectName("label_55")
+        self.gridLayout_10.addWidget(self.label_55, 12, 0, 1, 1)
+        self.lineEditMetadataContactInstructions = QtWidgets.QLineEdit(self.groupBoxBind_6)
+        self.lineEditMetadataContactInstructions.setObjectName("lineEditMetadataContactInstructions")
+        self.gridLayout_10.addWidget(self.lineEditMetadataContactInstructions, 12, 1, 1, 1)
+        self.label_56 = QtWidgets.QLabel(self.groupBoxBind_6)
+        self.label_56.setObjectName("label_56")
+        self.gridLayout_10.addWidget(self.label_56, 13, 0, 1, 1)
+        self.comboBoxMetadataContactRole = QtWidgets.QComboBox(self.groupBoxBind_6)
+        self.comboBoxMetadataContactRole.setObjectName("comboBoxMetadataContactRole")
+        self.gridLayout_10.addWidget(self.comboBoxMetadataContactRole, 13, 1, 1, 1)
+        self.gridLayout_20.addWidget(self.groupBoxBind_6, 0, 1, 2, 1)
+        self.tabWidget.addTab(self.metadataTab, "")
+        self.resourcesTab = QtWidgets.QWidget()
+        self.resourcesTab.setObjectName("resourcesTab")
+        self.gridLayout_11 = QtWidgets.QGridLayout(self.resourcesTab)
+        self.gridLayout_11.setObjectName("gridLayout_11")
+        self.groupBoxCollectionSelect = QtWidgets.QGroupBox(self.resourcesTab)
+        self.groupBoxCollectionSelect.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxCollectionSelect.setObjectName("groupBoxCollectionSelect")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.groupBoxCollectionSelect)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.lineEditCollection = QtWidgets.QLineEdit(self.groupBoxCollectionSelect)
+        self.lineEditCollection.setObjectName("lineEditCollection")
+        self.verticalLayout_3.addWidget(self.lineEditCollection)
+        self.listViewCollection = QtWidgets.QListView(self.groupBoxCollectionSelect)
+        self.listViewCollection.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.listViewCollection.setObjectName("listViewCollection")
+        self.verticalLayout_3.addWidget(self.listViewCollection)
+        self.pushLoadCollection = QtWidgets.QPushButton(self.groupBoxCollectionSelect)
+        self.pushLoadCollection.setObjectName("pushLoadCollection")
+        self.verticalLayout_3.addWidget(self.pushLoadCollection)
+        self.pushDeleteCollection = QtWidgets.QPushButton(self.groupBoxCollectionSelect)
+        self.pushDeleteCollection.setObjectName("pushDeleteCollection")
+        self.verticalLayout_3.addWidget(self.pushDeleteCollection)
+        self.pushNewCollection = QtWidgets.QPushButton(self.groupBoxCollectionSelect)
+        self.pushNewCollection.setObjectName("pushNewCollection")
+        self.verticalLayout_3.addWidget(self.pushNewCollection)
+        self.pushValidateCollectionsCrs = QtWidgets.QPushButton(self.groupBoxCollectionSelect)
+        self.pushValidateCollectionsCrs.setObjectName("pushValidateCollectionsCrs")
+        self.verticalLayout_3.addWidget(self.pushValidateCollectionsCrs)
+        self.gridLayout_11.addWidget(self.groupBoxCollectionSelect, 0, 0, 2, 1)
+        self.groupBoxCollectionPreview = QtWidgets.QGroupBox(self.resourcesTab)
+        self.groupBoxCollectionPreview.setStyleSheet("\n"
+"              QGroupBox {\n"
+"                background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                border-radius: 6px;         /* optional: rounded corners */\n"
+"                margin-top: 1.5em; /* reserve space for the title */\n"
+"                padding: 10px; \n"
+"              }\n"
+"            ")
+        self.groupBoxCollectionPreview.setObjectName("groupBoxCollectionPreview")
+        self.gridLayoutCollectionDetails = QtWidgets.QGridLayout(self.groupBoxCollectionPreview)
+        self.gridLayoutCollectionDetails.setObjectName("gridLayoutCollectionDetails")
+        self.label_57 = QtWidgets.QLabel(self.groupBoxCollectionPreview)
+        self.label_57.setObjectName("label_57")
+        self.gridLayoutCollectionDetails.addWidget(self.label_57, 0, 0, 1, 1)
+        self.lineEditTitle = QtWidgets.QLineEdit(self.groupBoxCollectionPreview)
+        self.lineEditTitle.setReadOnly(True)
+        self.lineEditTitle.setObjectName("lineEditTitle")
+        self.gridLayoutCollectionDetails.addWidget(self.lineEditTitle, 0, 1, 1, 1)
+        self.label_58 = QtWidgets.QLabel(self.groupBoxCollectionPreview)
+        self.label_58.setObjectName("label_58")
+        self.gridLayoutCollectionDetails.addWidget(self.label_58, 1, 0, 1, 1)
+        self.lineEditDescription = QtWidgets.QLineEdit(self.groupBoxCollectionPreview)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lineEditDescription.sizePolicy().hasHeightForWidth())
+        self.lineEditDescription.setSizePolicy(sizePolicy)
+        self.lineEditDescription.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.lineEditDescription.setReadOnly(True)
+        self.lineEditDescription.setObjectName("lineEditDescription")
+        self.gridLayoutCollectionDetails.addWidget(self.lineEditDescription, 1, 1, 1, 1)
+        self.bboxMapPlaceholder = QtWidgets.QHBoxLayout()
+        self.bboxMapPlaceholder.setObjectName("bboxMapPlaceholder")
+        self.gridLayoutCollectionDetails.addLayout(self.bboxMapPlaceholder, 2, 1, 1, 2)
+        self.pushFindCollectionsInExtent = QtWidgets.QPushButton(self.groupBoxCollectionPreview)
+        self.pushFindCollectionsInExtent.setObjectName("pushFindCollectionsInExtent")
+        self.gridLayoutCollectionDetails.addWidget(self.pushFindCollectionsInExtent, 3, 1, 1, 1)
+        self.gridLayout_11.addWidget(self.groupBoxCollectionPreview, 0, 1, 1, 1)
+        self.groupBoxCollectionLoaded = QtWidgets.QGroupBox(self.resourcesTab)
+        self.groupBoxCollectionLoaded.setVisible(False)
+        self.groupBoxCollectionLoaded.setObjectName("groupBoxCollectionLoaded")
+        self.gridLayoutCollectionLoaded = QtWidgets.QGridLayout(self.groupBoxCollectionLoaded)
+        self.gridLayoutCollectionLoaded.setHorizontalSpacing(50)
+        self.gridLayoutCollectionLoaded.setObjectName("gridLayoutCollectionLoaded")
+        self.groupBox_4 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBox_4.setMinimumSize(QtCore.QSize(400, 150))
+        self.groupBox_4.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBox_4.setObjectName("groupBox_4")
+        self._28 = QtWidgets.QGridLayout(self.groupBox_4)
+        self._28.setObjectName("_28")
+        self.label_59 = QtWidgets.QLabel(self.groupBox_4)
+        self.label_59.setObjectName("label_59")
+        self._28.addWidget(self.label_59, 0, 0, 1, 1)
+        self.lineEditResAlias = QtWidgets.QLineEdit(self.groupBox_4)
+        self.lineEditResAlias.setObjectName("lineEditResAlias")
+        self._28.addWidget(self.lineEditResAlias, 0, 1, 1, 1)
+        self.label_60 = QtWidgets.QLabel(self.groupBox_4)
+        self.label_60.setObjectName("label_60")
+        self._28.addWidget(self.label_60, 1, 0, 1, 1)
+        self.comboBoxResType = QtWidgets.QComboBox(self.groupBox_4)
+        self.comboBoxResType.setObjectName("comboBoxResType")
+        self._28.addWidget(self.comboBoxResType, 1, 1, 1, 1)
+        self.label_61 = QtWidgets.QLabel(self.groupBox_4)
+        self.label_61.setObjectName("label_61")
+        self._28.addWidget(self.label_61, 2, 0, 1, 1)
+        self.comboBoxResVisibility = QtWidgets.QComboBox(self.groupBox_4)
+        self.comboBoxResVisibility.setObjectName("comboBoxResVisibility")
+        self._28.addWidget(self.comboBoxResVisibility, 2, 1, 1, 1)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBox_4, 0, 0, 1, 1)
+        self.groupBox_5 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBox_5.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBox_5.setObjectName("groupBox_5")
+        self._29 = QtWidgets.QGridLayout(self.groupBox_5)
+        self._29.setObjectName("_29")
+        self._30 = QtWidgets.QHBoxLayout()
+        self._30.setObjectName("_30")
+        self._31 = QtWidgets.QVBoxLayout()
+        self._31.setObjectName("_31")
+        spacerItem5 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._31.addItem(spacerItem5)
+        self._32 = QtWidgets.QVBoxLayout()
+        self._32.setObjectName("_32")
+        self._33 = QtWidgets.QHBoxLayout()
+        self._33.setObjectName("_33")
+        self.comboBoxResTitleLocale = QtWidgets.QComboBox(self.groupBox_5)
+        self.comboBoxResTitleLocale.setObjectName("comboBoxResTitleLocale")
+        self.comboBoxResTitleLocale.addItem("")
+        self.comboBoxResTitleLocale.addItem("")
+        self.comboBoxResTitleLocale.addItem("")
+        self._33.addWidget(self.comboBoxResTitleLocale)
+        self.addResTitleLineEdit = QtWidgets.QLineEdit(self.groupBox_5)
+        self.addResTitleLineEdit.setObjectName("addResTitleLineEdit")
+        self._33.addWidget(self.addResTitleLineEdit)
+        self._32.addLayout(self._33)
+        self.addResTitleButton = QtWidgets.QPushButton(self.groupBox_5)
+        self.addResTitleButton.setObjectName("addResTitleButton")
+        self._32.addWidget(self.addResTitleButton)
+        self._31.addLayout(self._32)
+        self._30.addLayout(self._31)
+        self._34 = QtWidgets.QVBoxLayout()
+        self._34.setObjectName("_34")
+        self.listWidgetResTitle = QtWidgets.QListWidget(self.groupBox_5)
+        self.listWidgetResTitle.setMaximumSize(QtCore.QSize(1000, 80))
+        self.listWidgetResTitle.setObjectName("listWidgetResTitle")
+        self._34.addWidget(self.listWidgetResTitle)
+        self.deleteResTitleButton = QtWidgets.QPushButton(self.groupBox_5)
+        self.deleteResTitleButton.setObjectName("deleteResTitleButton")
+        self._34.addWidget(self.deleteResTitleButton)
+        self._30.addLayout(self._34)
+        self._29.addLayout(self._30, 0, 0, 1, 1)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBox_5, 1, 0, 1, 1)
+        self.groupBox_6 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBox_6.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBox_6.setObjectName("groupBox_6")
+        self._35 = QtWidgets.QGridLayout(self.groupBox_6)
+        self._35.setObjectName("_35")
+        self._36 = QtWidgets.QHBoxLayout()
+        self._36.setObjectName("_36")
+        self._37 = QtWidgets.QVBoxLayout()
+        self._37.setObjectName("_37")
+        spacerItem6 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._37.addItem(spacerItem6)
+        self._38 = QtWidgets.QVBoxLayout()
+        self._38.setObjectName("_38")
+        self._39 = QtWidgets.QHBoxLayout()
+        self._39.setObjectName("_39")
+        self.comboBoxResDescriptionLocale = QtWidgets.QComboBox(self.groupBox_6)
+        self.comboBoxResDescriptionLocale.setObjectName("comboBoxResDescriptionLocale")
+        self.comboBoxResDescriptionLocale.addItem("")
+        self.comboBoxResDescriptionLocale.addItem("")
+        self.comboBoxResDescriptionLocale.addItem("")
+        self._39.addWidget(self.comboBoxResDescriptionLocale)
+        self.addResDescriptionLineEdit = QtWidgets.QLineEdit(self.groupBox_6)
+        self.addResDescriptionLineEdit.setObjectName("addResDescriptionLineEdit")
+        self._39.addWidget(self.addResDescriptionLineEdit)
+        self._38.addLayout(self._39)
+        self.addResDescriptionButton = QtWidgets.QPushButton(self.groupBox_6)
+        self.addResDescriptionButton.setObjectName("addResDescriptionButton")
+        self._38.addWidget(self.addResDescriptionButton)
+        self._37.addLayout(self._38)
+        self._36.addLayout(self._37)
+        self._40 = QtWidgets.QVBoxLayout()
+        self._40.setObjectName("_40")
+        self.listWidgetResDescription = QtWidgets.QListWidget(self.groupBox_6)
+        self.listWidgetResDescription.setMaximumSize(QtCore.QSize(1000, 80))
+        self.listWidgetResDescription.setObjectName("listWidgetResDescription")
+        self._40.addWidget(self.listWidgetResDescription)
+        self.deleteResDescriptionButton = QtWidgets.QPushButton(self.groupBox_6)
+        self.deleteResDescriptionButton.setObjectName("deleteResDescriptionButton")
+        self._40.addWidget(self.deleteResDescriptionButton)
+        self._36.addLayout(self._40)
+        self._35.addLayout(self._36, 0, 0, 1, 1)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBox_6, 0, 1, 1, 1)
+        self.groupBox_7 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBox_7.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBox_7.setObjectName("groupBox_7")
+        self._41 = QtWidgets.QGridLayout(self.groupBox_7)
+        self._41.setObjectName("_41")
+        self._42 = QtWidgets.QHBoxLayout()
+        self._42.setObjectName("_42")
+        self._43 = QtWidgets.QVBoxLayout()
+        self._43.setObjectName("_43")
+        spacerItem7 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._43.addItem(spacerItem7)
+        self._44 = QtWidgets.QVBoxLayout()
+        self._44.setObjectName("_44")
+        self._45 = QtWidgets.QHBoxLayout()
+        self._45.setObjectName("_45")
+        self.comboBoxResKeywordsLocale = QtWidgets.QComboBox(self.groupBox_7)
+        self.comboBoxResKeywordsLocale.setObjectName("comboBoxResKeywordsLocale")
+        self.comboBoxResKeywordsLocale.addItem("")
+        self.comboBoxResKeywordsLocale.addItem("")
+        self.comboBoxResKeywordsLocale.addItem("")
+        self._45.addWidget(self.comboBoxResKeywordsLocale)
+        self.addResKeywordsLineEdit = QtWidgets.QLineEdit(self.groupBox_7)
+        self.addResKeywordsLineEdit.setObjectName("addResKeywordsLineEdit")
+        self._45.addWidget(self.addResKeywordsLineEdit)
+        self._44.addLayout(self._45)
+        self.addResKeywordsButton = QtWidgets.QPushButton(self.groupBox_7)
+        self.addResKeywordsButton.setObjectName("addResKeywordsButton")
+        self._44.addWidget(self.addResKeywordsButton)
+        self._43.addLayout(self._44)
+        self._42.addLayout(self._43)
+        self._46 = QtWidgets.QVBoxLayout()
+        self._46.setObjectName("_46")
+        self.listWidgetResKeywords = QtWidgets.QListWidget(self.groupBox_7)
+        self.listWidgetResKeywords.setMaximumSize(QtCore.QSize(1000, 80))
+        self.listWidgetResKeywords.setObjectName("listWidgetResKeywords")
+        self._46.addWidget(self.listWidgetResKeywords)
+        self.deleteResKeywordsButton = QtWidgets.QPushButton(self.groupBox_7)
+        self.deleteResKeywordsButton.setObjectName("deleteResKeywordsButton")
+        self._46.addWidget(self.deleteResKeywordsButton)
+        self._42.addLayout(self._46)
+        self._41.addLayout(self._42, 0, 0, 1, 1)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBox_7, 1, 1, 1, 1)
+        self.groupBoxMap_2 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBoxMap_2.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBoxMap_2.setObjectName("groupBoxMap_2")
+        self.gridLayout_12 = QtWidgets.QGridLayout(self.groupBoxMap_2)
+        self.gridLayout_12.setObjectName("gridLayout_12")
+        self._47 = QtWidgets.QHBoxLayout()
+        self._47.setObjectName("_47")
+        self._48 = QtWidgets.QVBoxLayout()
+        self._48.setObjectName("_48")
+        spacerItem8 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._48.addItem(spacerItem8)
+        self._49 = QtWidgets.QVBoxLayout()
+        self._49.setObjectName("_49")
+        self.gridLayoutAddResLinks = QtWidgets.QGridLayout()
+        self.gridLayoutAddResLinks.setObjectName("gridLayoutAddResLinks")
+        self.label_62 = QtWidgets.QLabel(self.groupBoxMap_2)
+        self.label_62.setObjectName("label_62")
+        self.gridLayoutAddResLinks.addWidget(self.label_62, 0, 0, 1, 1)
+        self.addResLinksTypeLineEdit = QtWidgets.QLineEdit(self.groupBoxMap_2)
+        self.addResLinksTypeLineEdit.setObjectName("addResLinksTypeLineEdit")
+        self.gridLayoutAddResLinks.addWidget(self.addResLinksTypeLineEdit, 0, 1, 1, 1)
+        self.label_63 = QtWidgets.QLabel(self.groupBoxMap_2)
+        self.label_63.setObjectName("label_63")
+        self.gridLayoutAddResLinks.addWidget(self.label_63, 1, 0, 1, 1)
+        self.addResLinksRelLineEdit = QtWidgets.QLineEdit(self.groupBoxMap_2)
+        self.addResLinksRelLineEdit.setObjectName("addResLinksRelLineEdit")
+        self.gridLayoutAddResLinks.addWidget(self.addResLinksRelLineEdit, 1, 1, 1, 1)
+        self.label_64 = QtWidgets.QLabel(self.groupBoxMap_2)
+        self.label_64.setObjectName("label_64")
+        self.gridLayoutAddResLinks.addWidget(self.label_64, 2, 0, 1, 1)
+        self.addResLinksHrefLineEdit = QtWidgets.QLineEdit(self.groupBoxMap_2)
+        self.addResLinksHrefLineEdit.setPlaceholderText("")
+        self.addResLinksHrefLineEdit.setObjectName("addResLinksHrefLineEdit")
+        self.gridLayoutAddResLinks.addWidget(self.addResLinksHrefLineEdit, 2, 1, 1, 1)
+        self.label_65 = QtWidgets.QLabel(self.groupBoxMap_2)
+        self.label_65.setObjectName("label_65")
+        self.gridLayoutAddResLinks.addWidget(self.label_65, 3, 0, 1, 1)
+        self.addResLinksTitleLineEdit = QtWidgets.QLineEdit(self.groupBoxMap_2)
+        self.addResLinksTitleLineEdit.setObjectName("addResLinksTitleLineEdit")
+        self.gridLayoutAddResLinks.addWidget(self.addResLinksTitleLineEdit, 3, 1, 1, 1)
+        self.label_66 = QtWidgets.QLabel(self.groupBoxMap_2)
+        self.label_66.setObjectName("label_66")
+        self.gridLayoutAddResLinks.addWidget(self.label_66, 4, 0, 1, 1)
+        self.addResLinkshreflangComboBox = QtWidgets.QComboBox(self.groupBoxMap_2)
+        self.addResLinkshreflangComboBox.setObjectName("addResLinkshreflangComboBox")
+        self.gridLayoutAddResLinks.addWidget(self.addResLinkshreflangComboBox, 4, 1, 1, 1)
+        self.label_67 = QtWidgets.QLabel(self.groupBoxMap_2)
+        self.label_67.setObjectName("label_67")
+        self.gridLayoutAddResLinks.addWidget(self.label_67, 5, 0, 1, 1)
+        self.addResLinksLengthLineEdit = QtWidgets.QLineEdit(self.groupBoxMap_2)
+        self.addResLinksLengthLineEdit.setObjectName("addResLinksLengthLineEdit")
+        self.gridLayoutAddResLinks.addWidget(self.addResLinksLengthLineEdit, 5, 1, 1, 1)
+        self._49.addLayout(self.gridLayoutAddResLinks)
+        self.addResLinksButton = QtWidgets.QPushButton(self.groupBoxMap_2)
+        self.addResLinksButton.setObjectName("addResLinksButton")
+        self._49.addWidget(self.addResLinksButton)
+        self._48.addLayout(self._49)
+        self._47.addLayout(self._48)
+        self._50 = QtWidgets.QVBoxLayout()
+        self._50.setObjectName("_50")
+        self.listWidgetResLinks = QtWidgets.QListWidget(self.groupBoxMap_2)
+        self.listWidgetResLinks.setMinimumSize(QtCore.QSize(200, 0))
+        self.listWidgetResLinks.setMaximumSize(QtCore.QSize(250, 300))
+        self.listWidgetResLinks.setObjectName("listWidgetResLinks")
+        self._50.addWidget(self.listWidgetResLinks)
+        self.deleteResLinksButton = QtWidgets.QPushButton(self.groupBoxMap_2)
+        self.deleteResLinksButton.setObjectName("deleteResLinksButton")
+        self._50.addWidget(self.deleteResLinksButton)
+        self._47.addLayout(self._50)
+        self.gridLayout_12.addLayout(self._47, 0, 0, 1, 1)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBoxMap_2, 2, 1, 1, 1)
+        self.groupBoxMap_3 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBoxMap_3.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBoxMap_3.setObjectName("groupBoxMap_3")
+        self.gridLayout_13 = QtWidgets.QGridLayout(self.groupBoxMap_3)
+        self.gridLayout_13.setObjectName("gridLayout_13")
+        self._51 = QtWidgets.QHBoxLayout()
+        self._51.setObjectName("_51")
+        self._52 = QtWidgets.QVBoxLayout()
+        self._52.setObjectName("_52")
+        spacerItem9 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self._52.addItem(spacerItem9)
+        self._53 = QtWidgets.QVBoxLayout()
+        self._53.setObjectName("_53")
+        self._54 = QtWidgets.QHBoxLayout()
+        self._54.setObjectName("_54")
+        self.comboBoxResProviderType = QtWidgets.QComboBox(self.groupBoxMap_3)
+        self.comboBoxResProviderType.setObjectName("comboBoxResProviderType")
+        self._54.addWidget(self.comboBoxResProviderType)
+        self._53.addLayout(self._54)
+        self.addResProviderButton = QtWidgets.QPushButton(self.groupBoxMap_3)
+        self.addResProviderButton.setObjectName("addResProviderButton")
+        self._53.addWidget(self.addResProviderButton)
+        self._52.addLayout(self._53)
+        self._51.addLayout(self._52)
+        self._55 = QtWidgets.QVBoxLayout()
+        self._55.setObjectName("_55")
+        self.listWidgetResProvider = QtWidgets.QListWidget(self.groupBoxMap_3)
+        self.listWidgetResProvider.setMaximumSize(QtCore.QSize(200, 300))
+        self.listWidgetResProvider.setObjectName("listWidgetResProvider")
+        self._55.addWidget(self.listWidgetResProvider)
+        self._56 = QtWidgets.QHBoxLayout()
+        self._56.setObjectName("_56")
+        self.editResProviderButton = QtWidgets.QPushButton(self.groupBoxMap_3)
+        self.editResProviderButton.setObjectName("editResProviderButton")
+        self._56.addWidget(self.editResProviderButton)
+        self.deleteResProviderButton = QtWidgets.QPushButton(self.groupBoxMap_3)
+        self.deleteResProviderButton.setObjectName("deleteResProviderButton")
+        self._56.addWidget(self.deleteResProviderButton)
+        self._55.addLayout(self._56)
+        self._51.addLayout(self._55)
+        self.gridLayout_13.addLayout(self._51, 0, 0, 1, 1)
+        self._57 = QtWidgets.QHBoxLayout()
+        self._57.setObjectName("_57")
+        self.label_68 = QtWidgets.QLabel(self.groupBoxMap_3)
+        self.label_68.setObjectName("label_68")
+        self._57.addWidget(self.label_68)
+        self.listWidgetResReadOnlyProviders = QtWidgets.QListWidget(self.groupBoxMap_3)
+        self.listWidgetResReadOnlyProviders.setMaximumSize(QtCore.QSize(1000, 40))
+        self.listWidgetResReadOnlyProviders.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.listWidgetResReadOnlyProviders.setObjectName("listWidgetResReadOnlyProviders")
+        self._57.addWidget(self.listWidgetResReadOnlyProviders)
+        self.gridLayout_13.addLayout(self._57, 1, 0, 1, 1)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBoxMap_3, 2, 0, 1, 1)
+        self.groupBox_8 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBox_8.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBox_8.setObjectName("groupBox_8")
+        self._58 = QtWidgets.QGridLayout(self.groupBox_8)
+        self._58.setObjectName("_58")
+        self.label_69 = QtWidgets.QLabel(self.groupBox_8)
+        self.label_69.setObjectName("label_69")
+        self._58.addWidget(self.label_69, 0, 0, 1, 1)
+        self._59 = QtWidgets.QGridLayout()
+        self._59.setObjectName("_59")
+        self._60 = QtWidgets.QHBoxLayout()
+        self._60.setObjectName("_60")
+        self.label_70 = QtWidgets.QLabel(self.groupBox_8)
+        self.label_70.setObjectName("label_70")
+        self._60.addWidget(self.label_70)
+        self.lineEditResExtentsSpatialXMin = QtWidgets.QLineEdit(self.groupBox_8)
+        self.lineEditResExtentsSpatialXMin.setObjectName("lineEditResExtentsSpatialXMin")
+        self._60.addWidget(self.lineEditResExtentsSpatialXMin)
+        self._59.addLayout(self._60, 0, 0, 1, 1)
+        self._61 = QtWidgets.QHBoxLayout()
+        self._61.setObjectName("_61")
+        self.label_71 = QtWidgets.QLabel(self.groupBox_8)
+        self.label_71.setObjectName("label_71")
+        self._61.addWidget(self.label_71)
+        self.lineEditResExtentsSpatialYMin = QtWidgets.QLineEdit(self.groupBox_8)
+        self.lineEditResExtentsSpatialYMin.setObjectName("lineEditResExtentsSpatialYMin")
+        self._61.addWidget(self.lineEditResExtentsSpatialYMin)
+        self._59.addLayout(self._61, 0, 1, 1, 1)
+        self._62 = QtWidgets.QHBoxLayout()
+        self._62.setObjectName("_62")
+        self.label_72 = QtWidgets.QLabel(self.groupBox_8)
+        self.label_72.setObjectName("label_72")
+        self._62.addWidget(self.label_72)
+        self.lineEditResExtentsSpatialXMax = QtWidgets.QLineEdit(self.groupBox_8)
+        self.lineEditResExtentsSpatialXMax.setObjectName("lineEditResExtentsSpatialXMax")
+        self._62.addWidget(self.lineEditResExtentsSpatialXMax)
+        self._59.addLayout(self._62, 0, 2, 1, 1)
+        self._63 = QtWidgets.QHBoxLayout()
+        self._63.setObjectName("_63")
+        self.label_73 = QtWidgets.QLabel(self.groupBox_8)
+        self.label_73.setObjectName("label_73")
+        self._63.addWidget(self.label_73)
+        self.lineEditResExtentsSpatialYMax = QtWidgets.QLineEdit(self.groupBox_8)
+        self.lineEditResExtentsSpatialYMax.setObjectName("lineEditResExtentsSpatialYMax")
+        self._63.addWidget(self.lineEditResExtentsSpatialYMax)
+        self._59.addLayout(self._63, 0, 3, 1, 1)
+        self._58.addLayout(self._59, 0, 1, 1, 1)
+        self.label_74 = QtWidgets.QLabel(self.groupBox_8)
+        self.label_74.setObjectName("label_74")
+        self._58.addWidget(self.label_74, 1, 0, 1, 1)
+        self._64 = QtWidgets.QHBoxLayout()
+        self._64.setObjectName("_64")
+        self.comboBoxResExtentsSpatialCrsType = QtWidgets.QComboBox(self.groupBox_8)
+        self.comboBoxResExtentsSpatialCrsType.setObjectName("comboBoxResExtentsSpatialCrsType")
+        self._64.addWidget(self.comboBoxResExtentsSpatialCrsType)
+        self._65 = QtWidgets.QHBoxLayout()
+        self._65.setObjectName("_65")
+        self.lineEditResExtentsSpatialCrs = QtWidgets.QLineEdit(self.groupBox_8)
+        self.lineEditResExtentsSpatialCrs.setObjectName("lineEditResExtentsSpatialCrs")
+        self._65.addWidget(self.lineEditResExtentsSpatialCrs)
+        self.validateResExtentsCrsButton = QtWidgets.QPushButton(self.groupBox_8)
+        self.validateResExtentsCrsButton.setObjectName("validateResExtentsCrsButton")
+        self._65.addWidget(self.validateResExtentsCrsButton)
+        self._64.addLayout(self._65)
+        self._58.addLayout(self._64, 1, 1, 1, 1)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBox_8, 3, 0, 1, 1)
+        self.groupBox_9 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBox_9.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBox_9.setObjectName("groupBox_9")
+        self._66 = QtWidgets.QGridLayout(self.groupBox_9)
+        self._66.setObjectName("_66")
+        self.label_75 = QtWidgets.QLabel(self.groupBox_9)
+        self.label_75.setObjectName("label_75")
+        self._66.addWidget(self.label_75, 0, 0, 1, 1)
+        self.lineEditResExtentsTemporalBegin = QtWidgets.QLineEdit(self.groupBox_9)
+        self.lineEditResExtentsTemporalBegin.setObjectName("lineEditResExtentsTemporalBegin")
+        self._66.addWidget(self.lineEditResExtentsTemporalBegin, 0, 1, 1, 1)
+        self.label_76 = QtWidgets.QLabel(self.groupBox_9)
+        self.label_76.setObjectName("label_76")
+        self._66.addWidget(self.label_76, 1, 0, 1, 1)
+        self.lineEditResExtentsTemporalEnd = QtWidgets.QLineEdit(self.groupBox_9)
+        self.lineEditResExtentsTemporalEnd.setObjectName("lineEditResExtentsTemporalEnd")
+        self._66.addWidget(self.lineEditResExtentsTemporalEnd, 1, 1, 1, 1)
+        self.label_77 = QtWidgets.QLabel(self.groupBox_9)
+        self.label_77.setObjectName("label_77")
+        self._66.addWidget(self.label_77, 2, 0, 1, 1)
+        self.comboBoxResExtentsTemporalTrs = QtWidgets.QComboBox(self.groupBox_9)
+        self.comboBoxResExtentsTemporalTrs.setObjectName("comboBoxResExtentsTemporalTrs")
+        self._66.addWidget(self.comboBoxResExtentsTemporalTrs, 2, 1, 1, 1)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBox_9, 3, 1, 1, 1)
+        self.groupBox_10 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBox_10.setEnabled(False)
+        self.groupBox_10.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 1);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 5 10 5 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBox_10.setTitle("")
+        self.groupBox_10.setObjectName("groupBox_10")
+        self._67 = QtWidgets.QGridLayout(self.groupBox_10)
+        self._67.setObjectName("_67")
+        self.label_78 = QtWidgets.QLabel(self.groupBox_10)
+        self.label_78.setEnabled(False)
+        self.label_78.setObjectName("label_78")
+        self._67.addWidget(self.label_78, 0, 0, 1, 1)
+        self.listWidgetResLinkedData = QtWidgets.QListWidget(self.groupBox_10)
+        self.listWidgetResLinkedData.setMaximumSize(QtCore.QSize(1000, 25))
+        self.listWidgetResLinkedData.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.listWidgetResLinkedData.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.listWidgetResLinkedData.setObjectName("listWidgetResLinkedData")
+        self._67.addWidget(self.listWidgetResLinkedData, 0, 1, 1, 1)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBox_10, 4, 0, 1, 1)
+        self.groupBox_11 = QtWidgets.QGroupBox(self.groupBoxCollectionLoaded)
+        self.groupBox_11.setStyleSheet("\n"
+"                      QGroupBox {\n"
+"                        background-color: rgba(240, 240, 240, 0);  /* change to your desired color */\n"
+"                        border: 0px solid #ffffffff;     /* optional: border styling */\n"
+"                        border-radius: 6px;         /* optional: rounded corners */\n"
+"                        margin-top: 1.5em; /* reserve space for the title */\n"
+"                        padding: 5 10 5 10px; \n"
+"                      }\n"
+"                    ")
+        self.groupBox_11.setTitle("")
+        self.groupBox_11.setObjectName("groupBox_11")
+        self.horizontalLayout_12 = QtWidgets.QHBoxLayout(self.groupBox_11)
+        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
+        self.pushSaveAndPreviewResource = QtWidgets.QPushButton(self.groupBox_11)
+        self.pushSaveAndPreviewResource.setObjectName("pushSaveAndPreviewResource")
+        self.horizontalLayout_12.addWidget(self.pushSaveAndPreviewResource)
+        self.pushExitResourceEdit = QtWidgets.QPushButton(self.groupBox_11)
+        self.pushExitResourceEdit.setObjectName("pushExitResourceEdit")
+        self.horizontalLayout_12.addWidget(self.pushExitResourceEdit)
+        self.gridLayoutCollectionLoaded.addWidget(self.groupBox_11, 4, 1, 1, 1)
+        self.gridLayout_11.addWidget(self.groupBoxCollectionLoaded, 0, 0, 1, 1)
+        self.tabWidget.addTab(self.resourcesTab, "")
+        self.verticalLayout_4.addWidget(self.tabWidget)
+        self.localRadio = QtWidgets.QRadioButton(self.scrollAreaWidgetContents)
+        self.localRadio.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.localRadio.setChecked(True)
+        self.localRadio.setObjectName("localRadio")
+        self.verticalLayout_4.addWidget(self.localRadio)
+        self.serverRadio = QtWidgets.QRadioButton(self.scrollAreaWidgetContents)
+        self.serverRadio.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.serverRadio.setObjectName("serverRadio")
+        self.verticalLayout_4.addWidget(self.serverRadio)
+        self.buttonBox = QtWidgets.QDialogButtonBox(self.scrollAreaWidgetContents)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close|QtWidgets.QDialogButtonBox.Open|QtWidgets.QDialogButtonBox.Save)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout_4.addWidget(self.buttonBox)
+        self.label_79 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        font = QtGui.QFont()
+        font.setFamily("Liberation Serif")
+        self.label_79.setFont(font)
+        self.label_79.setTextFormat(QtCore.Qt.MarkdownText)
+        self.label_79.setObjectName("label_79")
+        self.verticalLayout_4.addWidget(self.label_79)
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+        self.verticalLayout.addWidget(self.scrollArea)
+        self.verticalLayout_2.addLayout(self.verticalLayout)
+
+        self.retranslateUi(PygeoapiConfigDialogBase)
+        self.tabWidget.setCurrentIndex(0)
+        self.pushButtonBrowse.clicked.connect(PygeoapiConfigDialogBase.open_logfile_dialog) # type: ignore
+        self.pushButtonBrowseTemplatesPath.clicked.connect(PygeoapiConfigDialogBase.open_templates_path_dialog) # type: ignore
+        self.addServerLangsButton.clicked.connect(PygeoapiConfigDialogBase.add_server_lang) # type: ignore
+        self.deleteServerLangsButton.clicked.connect(PygeoapiConfigDialogBase.delete_server_lang) # type: ignore
+        self.addMetadataIdTitleButton.clicked.connect(PygeoapiConfigDialogBase.add_metadata_id_title) # type: ignore
+        self.addMetadataIdDescriptionButton.clicked.connect(PygeoapiConfigDialogBase.add_metadata_id_description) # type: ignore
+        self.addMetadataKeywordButton.clicked.connect(PygeoapiConfigDialogBase.add_metadata_keyword) # type: ignore
+        self.addResTitleButton.clicked.connect(PygeoapiConfigDialogBase.add_res_title) # type: ignore
+        self.addResDescriptionButton.clicked.connect(PygeoapiConfigDialogBase.add_res_description) # type: ignore
+        self.addResKeywordsButton.clicked.connect(PygeoapiConfigDialogBase.add_res_keyword) # type: ignore
+        self.addResLinksButton.clicked.connect(PygeoapiConfigDialogBase.add_res_link) # type: ignore
+        self.addResProviderButton.clicked.connect(PygeoapiConfigDialogBase.try_add_res_provider) # type: ignore
+        self.deleteMetadataIdTitleButton.clicked.connect(PygeoapiConfigDialogBase.delete_metadata_id_title) # type: ignore
+        self.deleteMetadataIdDescriptionButton.clicked.connect(PygeoapiConfigDialogBase.delete_metadata_id_description) # type: ignore
+        self.deleteResTitleButton.clicked.connect(PygeoapiConfigDialogBase.delete_res_title) # type: ignore
+        self.deleteResDescriptionButton.clicked.connect(PygeoapiConfigDialogBase.delete_res_description) # type: ignore
+        self.deleteResKeywordsButton.clicked.connect(PygeoapiConfigDialogBase.delete_res_keyword) # type: ignore
+        self.deleteResLinksButton.clicked.connect(PygeoapiConfigDialogBase.delete_res_link) # type: ignore
+        self.editResProviderButton.clicked.connect(PygeoapiConfigDialogBase.edit_res_provider) # type: ignore
+        self.deleteResProviderButton.clicked.connect(PygeoapiConfigDialogBase.delete_res_provider) # type: ignore
+        self.deleteMetadataKeywordButton.clicked.connect(PygeoapiConfigDialogBase.delete_metadata_keyword) # type: ignore
+        self.pushButtonBrowseTemplatesStatic.clicked.connect(PygeoapiConfigDialogBase.open_templates_static_dialog) # type: ignore
+        self.lineEditCollection.textChanged['QString'].connect(PygeoapiConfigDialogBase.filterResources) # type: ignore
+        self.listViewCollection.clicked['QModelIndex'].connect(PygeoapiConfigDialogBase.preview_resource) # type: ignore
+        self.pushDeleteCollection.clicked.connect(PygeoapiConfigDialogBase.delete_resource) # type: ignore
+        self.pushNewCollection.clicked.connect(PygeoapiConfigDialogBase.new_resource) # type: ignore
+        self.pushLoadCollection.clicked.connect(PygeoapiConfigDialogBase.load_resource) # type: ignore
+        self.pushSaveAndPreviewResource.clicked.connect(PygeoapiConfigDialogBase.save_resource_edit_and_preview) # type: ignore
+        self.pushExitResourceEdit.clicked.connect(PygeoapiConfigDialogBase.exit_resource_edit) # type: ignore
+        self.pushFindCollectionsInExtent.clicked.connect(PygeoapiConfigDialogBase.find_resources_in_map_extent) # type: ignore
+        self.pushValidateCollectionsCrs.clicked.connect(PygeoapiConfigDialogBase.validate_resources_crs) # type: ignore
+        self.validateResExtentsCrsButton.clicked.connect(PygeoapiConfigDialogBase.validate_res_extents_crs) # type: ignore
+        self.buttonBox.clicked['QAbstractButton*'].connect(PygeoapiConfigDialogBase.on_button_clicked) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(PygeoapiConfigDialogBase)
+
+    def retranslateUi(self, PygeoapiConfigDialogBase):
+        _translate = QtCore.QCoreApplication.translate
+        PygeoapiConfigDialogBase.setWindowTitle(_translate("PygeoapiConfigDialogBase", "pygeoapi configurator"))
+        self.groupBoxBind.setTitle(_translate("PygeoapiConfigDialogBase", "bind*"))
+        self.label.setText(_translate("PygeoapiConfigDialogBase", "host*"))
+        self.label_2.setText(_translate("PygeoapiConfigDialogBase", "port*"))
+        self.label_3.setText(_translate("PygeoapiConfigDialogBase", "url*"))
+        self.label_5.setText(_translate("PygeoapiConfigDialogBase", "encoding*"))
+        self.comboBoxEncoding.setItemText(0, _translate("PygeoapiConfigDialogBase", "utf-8"))
+        self.label_4.setText(_translate("PygeoapiConfigDialogBase", "mimetype*"))
+        self.comboBoxMime.setItemText(0, _translate("PygeoapiConfigDialogBase", "application/json; charset=UTF-8"))
+        self.groupBoxMap.setTitle(_translate("PygeoapiConfigDialogBase", "map*"))
+        self.label_9.setText(_translate("PygeoapiConfigDialogBase", "attribution*"))
+        self.label_8.setText(_translate("PygeoapiConfigDialogBase", "url*"))
+        self.groupBox.setTitle(_translate("PygeoapiConfigDialogBase", "logging*"))
+        self.label_13.setText(_translate("PygeoapiConfigDialogBase", "level*"))
+        self.label_14.setText(_translate("PygeoapiConfigDialogBase", "logfile"))
+        self.pushButtonBrowse.setText(_translate("PygeoapiConfigDialogBase", "📂"))
+        self.label_15.setText(_translate("PygeoapiConfigDialogBase", "logformat"))
+        self.label_16.setText(_translate("PygeoapiConfigDialogBase", "dateformat"))
+        self.label_17.setText(_translate("PygeoapiConfigDialogBase", "rotation"))
+        self.label_7.setText(_translate("PygeoapiConfigDialogBase", "language"))
+        self.label_10.setText(_translate("PygeoapiConfigDialogBase", "languages"))
+        self.comboBoxServerLangs.setItemText(0, _translate("PygeoapiConfigDialogBase", "en-US"))
+        self.comboBoxServerLangs.setItemText(1, _translate("PygeoapiConfigDialogBase", "en-GB"))
+        self.comboBoxServerLangs.setItemText(2, _translate("PygeoapiConfigDialogBase", "fr-CA"))
+        self.comboBoxServerLangs.setItemText(3, _translate("PygeoapiConfigDialogBase", "fr-FR"))
+        self.comboBoxServerLangs.setItemText(4, _translate("PygeoapiConfigDialogBase", "pt-PT"))
+        self.addServerLangsButton.setText(_translate("PygeoapiConfigDialogBase", "Add"))
+        self.deleteServerLangsButton.setText(_translate("PygeoapiConfigDialogBase", "Delete Selected"))
+        self.groupBoxLimits.setTitle(_translate("PygeoapiConfigDialogBase", "limits"))
+        self.label_6.setText(_translate("PygeoapiConfigDialogBase", "default"))
+        self.label_11.setText(_translate("PygeoapiConfigDialogBase", "on exceed"))
+        self.label_12.setText(_translate("PygeoapiConfigDialogBase", "maximum"))
+        self.label_18.setText(_translate("PygeoapiConfigDialogBase", "max_distance_x"))
+        self.label_19.setText(_translate("PygeoapiConfigDialogBase", "max_distance_y"))
+        self.label_20.setText(_translate("PygeoapiConfigDialogBase", "max_distance_units"))
+        self.groupBox_2.setTitle(_translate("PygeoapiConfigDialogBase", "templates"))
+        self.label_21.setText(_translate("PygeoapiConfigDialogBase", "path"))
+        self.pushButtonBrowseTemplatesPath.setText(_translate("PygeoapiConfigDialogBase", "📂"))
+        self.label_22.setText(_translate("PygeoapiConfigDialogBase", "static"))
+        self.pushButtonBrowseTemplatesStatic.setText(_translate("PygeoapiConfigDialogBase", "📂"))
+        self.label_23.setText(_translate("PygeoapiConfigDialogBase", "admin"))
+        self.label_24.setText(_translate("PygeoapiConfigDialogBase", "gzip"))
+        self.label_25.setText(_translate("PygeoapiConfigDialogBase", "pretty print"))
+        self.label_26.setText(_translate("PygeoapiConfigDialogBase", "cors"))
+        self.label_27.setText(_translate("PygeoapiConfigDialogBase", "ogc_schemas_location"))
+        self.label_28.setText(_translate("PygeoapiConfigDialogBase", "icon"))
+        self.label_29.setText(_translate("PygeoapiConfigDialogBase", "logo"))
+        self.label_30.setText(_translate("PygeoapiConfigDialogBase", "locale_dir"))
+        self.label_31.setText(_translate("PygeoapiConfigDialogBase", "api_rules"))
+        self.label_32.setText(_translate("PygeoapiConfigDialogBase", "manager"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.serverTab), _translate("PygeoapiConfigDialogBase", "Server"))
+        self.groupBoxBind_3.setTitle(_translate("PygeoapiConfigDialogBase", "identification*"))
+        self.label_33.setText(_translate("PygeoapiConfigDialogBase", "title*"))
+        self.comboBoxIdTitleLocale.setItemText(0, _translate("PygeoapiConfigDialogBase", "en"))
+        self.comboBoxIdTitleLocale.setItemText(1, _translate("PygeoapiConfigDialogBase", "pt"))
+        self.comboBoxIdTitleLocale.setItemText(2, _translate("PygeoapiConfigDialogBase", "fr"))
+        self.addMetadataIdTitleLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "Enter title"))
+        self.addMetadataIdTitleButton.setText(_translate("PygeoapiConfigDialogBase", "Add"))
+        self.deleteMetadataIdTitleButton.setText(_translate("PygeoapiConfigDialogBase", "Delete Selected"))
+        self.label_34.setText(_translate("PygeoapiConfigDialogBase", "description*"))
+        self.comboBoxIdDescriptionLocale.setItemText(0, _translate("PygeoapiConfigDialogBase", "en"))
+        self.comboBoxIdDescriptionLocale.setItemText(1, _translate("PygeoapiConfigDialogBase", "pt"))
+        self.comboBoxIdDescriptionLocale.setItemText(2, _translate("PygeoapiConfigDialogBase", "fr"))
+        self.addMetadataIdDescriptionLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "Enter description"))
+        self.addMetadataIdDescriptionButton.setText(_translate("PygeoapiConfigDialogBase", "Add"))
+        self.deleteMetadataIdDescriptionButton.setText(_translate("PygeoapiConfigDialogBase", "Delete Selected"))
+        self.label_35.setText(_translate("PygeoapiConfigDialogBase", "keywords*"))
+        self.comboBoxKeywordsLocale.setItemText(0, _translate("PygeoapiConfigDialogBase", "en"))
+        self.comboBoxKeywordsLocale.setItemText(1, _translate("PygeoapiConfigDialogBase", "pt"))
+        self.comboBoxKeywordsLocale.setItemText(2, _translate("PygeoapiConfigDialogBase", "fr"))
+        self.addMetadataKeywordLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "Enter keyword"))
+        self.addMetadataKeywordButton.setText(_translate("PygeoapiConfigDialogBase", "Add"))
+        self.deleteMetadataKeywordButton.setText(_translate("PygeoapiConfigDialogBase", "Delete Selected"))
+        self.label_36.setText(_translate("PygeoapiConfigDialogBase", "keywords type"))
+        self.label_37.setText(_translate("PygeoapiConfigDialogBase", "terms of service"))
+        self.label_38.setText(_translate("PygeoapiConfigDialogBase", "url*"))
+        self.groupBoxBind_4.setTitle(_translate("PygeoapiConfigDialogBase", "license*"))
+        self.label_39.setText(_translate("PygeoapiConfigDialogBase", "name*"))
+        self.label_40.setText(_translate("PygeoapiConfigDialogBase", "url"))
+        self.groupBoxBind_5.setTitle(_translate("PygeoapiConfigDialogBase", "provider*"))
+        self.label_41.setText(_translate("PygeoapiConfigDialogBase", "name*"))
+        self.label_42.setText(_translate("PygeoapiConfigDialogBase", "url"))
+        self.groupBoxBind_6.setTitle(_translate("PygeoapiConfigDialogBase", "contact*"))
+        self.label_43.setText(_translate("PygeoapiConfigDialogBase", "name*"))
+        self.label_44.setText(_translate("PygeoapiConfigDialogBase", "position"))
+        self.label_45.setText(_translate("PygeoapiConfigDialogBase", "address"))
+        self.label_46.setText(_translate("PygeoapiConfigDialogBase", "city"))
+        self.label_47.setText(_translate("PygeoapiConfigDialogBase", "stateorprovince"))
+        self.label_48.setText(_translate("PygeoapiConfigDialogBase", "postalcode"))
+        self.label_49.setText(_translate("PygeoapiConfigDialogBase", "country"))
+        self.label_50.setText(_translate("PygeoapiConfigDialogBase", "phone"))
+        self.label_51.setText(_translate("PygeoapiConfigDialogBase", "fax"))
+        self.label_52.setText(_translate("PygeoapiConfigDialogBase", "email"))
+        self.label_53.setText(_translate("PygeoapiConfigDialogBase", "url"))
+        self.label_54.setText(_translate("PygeoapiConfigDialogBase", "hours"))
+        self.label_55.setText(_translate("PygeoapiConfigDialogBase", "instructions"))
+        self.label_56.setText(_translate("PygeoapiConfigDialogBase", "role"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.metadataTab), _translate("PygeoapiConfigDialogBase", "Metadata"))
+        self.groupBoxCollectionSelect.setTitle(_translate("PygeoapiConfigDialogBase", "select collection"))
+        self.lineEditCollection.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "Search by name"))
+        self.pushLoadCollection.setText(_translate("PygeoapiConfigDialogBase", "Load"))
+        self.pushDeleteCollection.setText(_translate("PygeoapiConfigDialogBase", "Delete"))
+        self.pushNewCollection.setText(_translate("PygeoapiConfigDialogBase", "New"))
+        self.pushValidateCollectionsCrs.setToolTip(_translate("PygeoapiConfigDialogBase", "Check CRS and TRS URLs of all resources"))
+        self.pushValidateCollectionsCrs.setText(_translate("PygeoapiConfigDialogBase", "Validate CRS"))
+        self.groupBoxCollectionPreview.setTitle(_translate("PygeoapiConfigDialogBase", "collection details"))
+        self.label_57.setText(_translate("PygeoapiConfigDialogBase", "title"))
+        self.label_58.setText(_translate("PygeoapiConfigDialogBase", "description"))
+        self.pushFindCollectionsInExtent.setToolTip(_translate("PygeoapiConfigDialogBase", "Show resources intersecting the current map extent"))
+        self.pushFindCollectionsInExtent.setText(_translate("PygeoapiConfigDialogBase", "Find resources in map extent"))
+        self.groupBoxCollectionLoaded.setTitle(_translate("PygeoapiConfigDialogBase", "collection details"))
+        self.label_59.setText(_translate("PygeoapiConfigDialogBase", "alias*"))
+        self.label_60.setText(_translate("PygeoapiConfigDialogBase", "type*"))
+        self.label_61.setText(_translate("PygeoapiConfigDialogBase", "visibility"))
+        self.groupBox_5.setTitle(_translate("PygeoapiConfigDialogBase", "title*"))
+        self.comboBoxResTitleLocale.setItemText(0, _translate("PygeoapiConfigDialogBase", "en"))
+        self.comboBoxResTitleLocale.setItemText(1, _translate("PygeoapiConfigDialogBase", "pt"))
+        self.comboBoxResTitleLocale.setItemText(2, _translate("PygeoapiConfigDialogBase", "fr"))
+        self.addResTitleLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "Enter title"))
+        self.addResTitleButton.setText(_translate("PygeoapiConfigDialogBase", "Add"))
+        self.deleteResTitleButton.setText(_translate("PygeoapiConfigDialogBase", "Delete Selected"))
+        self.groupBox_6.setTitle(_translate("PygeoapiConfigDialogBase", "description*"))
+        self.comboBoxResDescriptionLocale.setItemText(0, _translate("PygeoapiConfigDialogBase", "en"))
+        self.comboBoxResDescriptionLocale.setItemText(1, _translate("PygeoapiConfigDialogBase", "pt"))
+        self.comboBoxResDescriptionLocale.setItemText(2, _translate("PygeoapiConfigDialogBase", "fr"))
+        self.addResDescriptionLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "Enter description"))
+        self.addResDescriptionButton.setText(_translate("PygeoapiConfigDialogBase", "Add"))
+        self.deleteResDescriptionButton.setText(_translate("PygeoapiConfigDialogBase", "Delete Selected"))
+        self.groupBox_7.setTitle(_translate("PygeoapiConfigDialogBase", "keywords*"))
+        self.comboBoxResKeywordsLocale.setItemText(0, _translate("PygeoapiConfigDialogBase", "en"))
+        self.comboBoxResKeywordsLocale.setItemText(1, _translate("PygeoapiConfigDialogBase", "pt"))
+        self.comboBoxResKeywordsLocale.setItemText(2, _translate("PygeoapiConfigDialogBase", "fr"))
+        self.addResKeywordsLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "Enter keyword"))
+        self.addResKeywordsButton.setText(_translate("PygeoapiConfigDialogBase", "Add"))
+        self.deleteResKeywordsButton.setText(_translate("PygeoapiConfigDialogBase", "Delete Selected"))
+        self.groupBoxMap_2.setTitle(_translate("PygeoapiConfigDialogBase", "links"))
+        self.label_62.setText(_translate("PygeoapiConfigDialogBase", "Type"))
+        self.addResLinksTypeLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "text/csv"))
+        self.label_63.setText(_translate("PygeoapiConfigDialogBase", "Relations"))
+        self.addResLinksRelLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "canonical"))
+        self.label_64.setText(_translate("PygeoapiConfigDialogBase", "URL"))
+        self.label_65.setText(_translate("PygeoapiConfigDialogBase", "Title"))
+        self.addResLinksTitleLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "(optional)"))
+        self.label_66.setText(_translate("PygeoapiConfigDialogBase", "Language"))
+        self.addResLinkshreflangComboBox.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "(optional) e.g. \'en-US\'"))
+        self.label_67.setText(_translate("PygeoapiConfigDialogBase", "Length"))
+        self.addResLinksLengthLineEdit.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "(optional) content size"))
+        self.addResLinksButton.setText(_translate("PygeoapiConfigDialogBase", "Add"))
+        self.deleteResLinksButton.setText(_translate("PygeoapiConfigDialogBase", "Delete Selected"))
+        self.groupBoxMap_3.setTitle(_translate("PygeoapiConfigDialogBase", "providers*"))
+        self.addResProviderButton.setText(_translate("PygeoapiConfigDialogBase", "Add"))
+        self.editResProviderButton.setText(_translate("PygeoapiConfigDialogBase", "Edit Selected"))
+        self.deleteResProviderButton.setText(_translate("PygeoapiConfigDialogBase", "Delete Selected"))
+        self.label_68.setText(_translate("PygeoapiConfigDialogBase", "Read-only"))
+        self.groupBox_8.setTitle(_translate("PygeoapiConfigDialogBase", "spatial extents*"))
+        self.label_69.setText(_translate("PygeoapiConfigDialogBase", "bbox*"))
+        self.label_70.setText(_translate("PygeoapiConfigDialogBase", "XMin"))
+        self.lineEditResExtentsSpatialXMin.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "-180"))
+        self.label_71.setText(_translate("PygeoapiConfigDialogBase", "YMin"))
+        self.lineEditResExtentsSpatialYMin.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "-90"))
+        self.label_72.setText(_translate("PygeoapiConfigDialogBase", "XMax"))
+        self.lineEditResExtentsSpatialXMax.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "180"))
+        self.label_73.setText(_translate("PygeoapiConfigDialogBase", "YMax"))
+        self.lineEditResExtentsSpatialYMax.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "90"))
+        self.label_74.setText(_translate("PygeoapiConfigDialogBase", "crs"))
+        self.lineEditResExtentsSpatialCrs.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "CRS84"))
+        self.validateResExtentsCrsButton.setText(_translate("PygeoapiConfigDialogBase", "Validate"))
+        self.groupBox_9.setTitle(_translate("PygeoapiConfigDialogBase", "temporal extents"))
+        self.label_75.setText(_translate("PygeoapiConfigDialogBase", "begin"))
+        self.lineEditResExtentsTemporalBegin.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "1900-10-30T18:25:00Z"))
+        self.label_76.setText(_translate("PygeoapiConfigDialogBase", "end"))
+        self.lineEditResExtentsTemporalEnd.setPlaceholderText(_translate("PygeoapiConfigDialogBase", "1900-10-30T18:25:00Z"))
+        self.label_77.setText(_translate("PygeoapiConfigDialogBase", "trs"))
+        self.label_78.setText(_translate("PygeoapiConfigDialogBase", "linked-data"))
+        self.pushSaveAndPreviewResource.setText(_translate("PygeoapiConfigDialogBase", "Save changes"))
+        self.pushExitResourceEdit.setText(_translate("PygeoapiConfigDialogBase", "Cancel changes"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.resourcesTab), _translate("PygeoapiConfigDialogBase", "Resources"))
+        self.localRadio.setText(_translate("PygeoapiConfigDialogBase", "Local File"))
+        self.serverRadio.setText(_translate("PygeoapiConfigDialogBase", "Server Connection"))
+        self.label_79.setText(_translate("PygeoapiConfigDialogBase", "Brought to you with ❤️ by ByteRoad and DGT"))
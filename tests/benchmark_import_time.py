@@ -0,0 +1,66 @@
+"""Import time of the plugin per module (see 'python -X importtime'), in two stages: when QGIS loads the plugin
+('classFactory', 'initGui') and on the first 'run()' of the plugin.
+
+Usage: python tests/benchmark_import_time.py [number of modules listed per stage]
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Paths
+REPO_ROOT = Path(__file__).parent.parent
+PACKAGE = REPO_ROOT.name
+
+# statements importing the modules of each stage, in a fresh interpreter
+STAGES = {
+    "QGIS start (classFactory)": f"import {PACKAGE}.pygeoapi_config",
+    "first run()": f"import {PACKAGE}.resources, {PACKAGE}.pygeoapi_config_dialog",
+}
+STAGE_MARKER = "import time stage: "
+
+
+def measure_import_times() -> dict[str, list[tuple[int, int, str]]]:
+    """Get (self, cumulative) import times in microseconds, with module name, for each stage."""
+    code = ["import sys"]
+    for stage, statement in STAGES.items():
+        code.append(f"sys.stderr.write({STAGE_MARKER + stage!r} + '\\n')")
+        code.append(statement)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "\n".join(code)],
+        cwd=REPO_ROOT.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    stage = None
+    for line in result.stderr.splitlines():
+        if line.startswith(STAGE_MARKER):
+            stage = line[len(STAGE_MARKER) :]
+            times[stage] = []
+        elif stage is not None and line.startswith("import time:"):
+            self_time, cumulative_time, module = line[len("import time:") :].split("|")
+            if self_time.strip().isdigit():
+                times[stage].append(
+                    (int(self_time), int(cumulative_time), module.strip())
+                )
+    return times
+
+
+def main(modules_count: int = 15):
+    for stage, modules in measure_import_times().items():
+        total = sum(self_time for self_time, _, _ in modules)
+        print(f"\n=== {stage}: {total / 1000:.1f} ms, {len(modules)} modules ===")
+        print(f"{'self [ms]':>10} {'cumulative [ms]':>16}  module")
+        slowest_modules = sorted(modules, reverse=True)[:modules_count]
+        for self_time, cumulative_time, module in slowest_modules:
+            print(
+                f"{self_time / 1000:>10.1f} {cumulative_time / 1000:>16.1f}  {module}"
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,346 @@
+from copy import deepcopy
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from .. import pygeoapi_config_dialog as dialog_module
+from ..pygeoapi_config_dialog import PygeoapiConfigDialog
+from ..utils.admin_api import set_request_compression
+
+CONFIG = {
+    "server": {"bind": {"host": "0.0.0.0", "port": 5000}},
+    "resources": {"lakes": {"type": "collection", "title": "Large Lakes"}},
+}
+
+
+class StubAdminApiHandler(BaseHTTPRequestHandler):
+    """Serves CONFIG on GET, records PUT bodies. Responses are delayed by 'server.delay' seconds.
+    Like pygeoapi, ignores Content-Encoding and parses the raw body, unless 'server.gzip' is True.
+    Rejects gzip-compressed bodies with 'server.gzip_error' (status, message) if it is set,
+    and all bodies with 'server.put_status' if it is set."""
+
+    def do_GET(self):
+        body = json.dumps(CONFIG).encode("utf-8")
+        if self.server.status != 200:
+            self.send_error(self.server.status)
+            return
+
+        etag = f'"{self.server.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        # send in 2 parts, to allow cancelling in between
+        self.wfile.write(body[:10])
+        self.wfile.flush()
+        time.sleep(self.server.delay)
+        self.wfile.write(body[10:])
+
+    def do_PUT(self):
+        self._receive()
+
+    def do_POST(self):
+        self._receive()
+
+    def do_DELETE(self):
+        self._receive()
+
+    def _receive(self):
+        """Record (method, path, JSON body), reject resource endpoints if not supported."""
+        if "/resources" in self.path and not self.server.resource_endpoints:
+            self.send_error(405)
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        self.server.encodings.append(self.headers.get("Content-Encoding"))
+        if self.server.put_status is not None:
+            self.send_error(self.server.put_status, "Invalid configuration")
+            return
+        if self.headers.get("Content-Encoding") == "gzip":
+            if self.server.gzip_error is not None:
+                self.send_error(*self.server.gzip_error)
+                return
+            if self.server.gzip:
+                body = gzip.decompress(body)
+
+        try:
+            body = json.loads(body) if length else None
+        except ValueError:
+            self.send_error(400, "Invalid request data")
+            return
+        self.server.received.append((self.command, self.path, body))
+        self.send_response(201 if self.command == "POST" else 204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAdminApiHandler)
+    server.received = []
+    server.resource_endpoints = True
+    server.gzip = False
+    server.gzip_error = None
+    server.put_status = None
+    server.encodings = []
+    server.version = 1
+    server.delay = 0
+    server.status = 200
+    server.url = f"http://127.0.0.1:{server.server_port}/admin/config"
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    set_request_compression(server.url, False)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def dialog(qtbot):
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+    dialog.update_config_data_and_ui = MagicMock()
+
+    with patch.object(dialog_module, "QMessageBox") as mock_msgbox, patch.object(
+        dialog_module, "QgsMessageLog", create=True
+    ) as mock_log:
+        dialog.mock_msgbox = mock_msgbox
+        dialog.mock_log = mock_log
+        yield dialog
+
+
+def wait_for_request(qtbot, dialog):
+    qtbot.waitUntil(lambda: not dialog.is_server_request_running, timeout=15000)
+
+
+def test_pull_from_server(qtbot, dialog, server):
+    """Pulled config is passed to 'update_config_data_and_ui', without blocking the UI thread."""
+
+    dialog.pull_from_server(server.url)
+
+    # returns before the response is received
+    assert dialog.is_server_request_running
+    wait_for_request(qtbot, dialog)
+
+    dialog.update_config_data_and_ui.assert_called_once_with(CONFIG)
+    assert not dialog.mock_msgbox.critical.called
+
+
+def test_push_to_server(qtbot, dialog, server):
+    """Pushed config is received by a server that doesn't decompress request bodies (like pygeoapi),
+    success is reported."""
+
+    dialog.push_to_server(server.url, CONFIG)
+    wait_for_request(qtbot, dialog)
+
+    assert server.received == [("PUT", "/admin/config", CONFIG)]
+    assert server.encodings == [None]
+    assert any(
+        "Success! Status Code: 204" in call[0][2]
+        for call in dialog.mock_msgbox.information.call_args_list
+    )
+
+
+def test_cancel_pull(qtbot, dialog, server):
+    """Cancelled pull doesn't update ConfigData."""
+
+    server.delay = 1
+    dialog.pull_from_server(server.url)
+    dialog._cancel_server_request()
+    wait_for_request(qtbot, dialog)
+
+    assert not dialog.update_config_data_and_ui.called
+    assert not dialog.mock_msgbox.critical.called
+
+
+def test_pull_error(qtbot, dialog, server):
+    """Server errors are reported."""
+
+    server.status = 500
+    dialog.pull_from_server(server.url)
+    wait_for_request(qtbot, dialog)
+
+    assert not dialog.update_config_data_and_ui.called
+    assert "pulling the configuration" in dialog.mock_msgbox.critical.call_args[0][2]
+
+
+def pull_then_push_changes(qtbot, dialog, server) -> dict:
+    """Pull CONFIG (with the real ConfigData update), push it with changed resources."""
+    del dialog.update_config_data_and_ui
+
+    # don't open the warning about missing properties
+    with patch.object(dialog_module, "ReadOnlyTextDialog"):
+        dialog.pull_from_server(server.url)
+        wait_for_request(qtbot, dialog)
+
+    new_config = deepcopy(CONFIG)
+    new_config["resources"]["lakes"]["title"] = "Lakes"
+    new_config["resources"]["rivers"] = {"type": "collection", "title": "Rivers"}
+    dialog.push_to_server(server.url, new_config)
+    wait_for_request(qtbot, dialog)
+
+    return new_config
+
+
+def test_push_changed_resources(qtbot, dialog, server):
+    """Only changed resources are pushed to a server the config was pulled from."""
+
+    new_config = pull_then_push_changes(qtbot, dialog, server)
+
+    assert server.received == [
+        ("PUT", "/admin/config/resources/lakes", new_config["resources"]["lakes"]),
+        (
+            "POST",
+            "/admin/config/resources",
+            {"rivers": new_config["resources"]["rivers"]},
+        ),
+    ]
+    # sizes of the changes and of the full config are compared as JSON, before compression
+    json_size = len(json.dumps(new_config["resources"]["lakes"])) + len(
+        json.dumps({"rivers": new_config["resources"]["rivers"]})
+    )
+    message = dialog.mock_msgbox.information.call_args[0][2]
+    assert f"{json_size} bytes of JSON instead of {len(json.dumps(new_config))}" in (
+        message
+    )
+
+    # pushed config is the new reference for the next push
+    server.received.clear()
+    del new_config["resources"]["rivers"]
+    dialog.push_to_server(server.url, new_config)
+    wait_for_request(qtbot, dialog)
+
+    assert server.received == [("DELETE", "/admin/config/resources/rivers", None)]
+
+
+def test_push_full_config_after_pull(qtbot, dialog, server):
+    """Full config is pushed if other sections changed, and not reported as incremental."""
+    del dialog.update_config_data_and_ui
+
+    with patch.object(dialog_module, "ReadOnlyTextDialog"):
+        dialog.pull_from_server(server.url)
+        wait_for_request(qtbot, dialog)
+
+    new_config = deepcopy(CONFIG)
+    new_config["server"]["bind"]["port"] = 5001
+    dialog.push_to_server(server.url, new_config)
+    wait_for_request(qtbot, dialog)
+
+    assert server.received == [("PUT", "/admin/config", new_config)]
+    message = dialog.mock_msgbox.information.call_args[0][2]
+    assert "Success! Status Code: 204" in message
+    assert "Updated resources" not in message
+
+
+def test_push_unchanged_config(qtbot, dialog, server):
+    """Nothing is sent if the config didn't change since it was pulled."""
+    del dialog.update_config_data_and_ui
+
+    with patch.object(dialog_module, "ReadOnlyTextDialog"):
+        dialog.pull_from_server(server.url)
+        wait_for_request(qtbot, dialog)
+
+    dialog.push_to_server(server.url, deepcopy(CONFIG))
+
+    assert not dialog.is_server_request_running
+    assert server.received == []
+    assert "Nothing to push" in dialog.mock_msgbox.information.call_args[0][2]
+
+
+def test_push_fallback_to_full_config(qtbot, dialog, server):
+    """Full config is pushed if resource endpoints fail."""
+
+    server.resource_endpoints = False
+    new_config = pull_then_push_changes(qtbot, dialog, server)
+
+    assert server.received == [("PUT", "/admin/config", new_config)]
+    assert not dialog.mock_msgbox.critical.called
+
+
+def test_push_compressed(qtbot, dialog, server):
+    """Bodies are gzip-compressed if enabled for the server."""
+
+    server.gzip = True
+    set_request_compression(server.url)
+    dialog.push_to_server(server.url, CONFIG)
+    wait_for_request(qtbot, dialog)
+
+    assert server.received == [("PUT", "/admin/config", CONFIG)]
+    assert server.encodings == ["gzip"]
+    assert "bytes saved by gzip" in dialog.mock_msgbox.information.call_args[0][2]
+
+
+@pytest.mark.parametrize(
+    "gzip_error", [(415, None), (400, "Content-Encoding 'gzip' is not supported")]
+)
+def test_push_uncompressed(qtbot, dialog, server, gzip_error):
+    """Uncompressed body is sent if the server rejects gzip-compressed bodies."""
+
+    server.gzip_error = gzip_error
+    set_request_compression(server.url)
+    dialog.push_to_server(server.url, CONFIG)
+    wait_for_request(qtbot, dialog)
+
+    assert server.received == [("PUT", "/admin/config", CONFIG)]
+    assert server.encodings == ["gzip", None]
+
+
+def test_push_bad_request(qtbot, dialog, server):
+    """Other 400 errors are reported, without sending the body again uncompressed."""
+
+    server.gzip = True
+    set_request_compression(server.url)
+    server.put_status = 400
+    dialog.push_to_server(server.url, CONFIG)
+    wait_for_request(qtbot, dialog)
+
+    assert server.encodings == ["gzip"]
+    assert "pushing the configuration" in dialog.mock_msgbox.critical.call_args[0][2]
+
+    # compression is still used for the server
+    server.put_status = None
+    dialog.push_to_server(server.url, CONFIG)
+    wait_for_request(qtbot, dialog)
+
+    assert server.encodings == ["gzip", "gzip"]
+
+
+def test_conditional_pull(qtbot, dialog, server):
+    """Config is not downloaded again if not modified on the server since the last pull,
+    but the pulled config still replaces local changes."""
+    del dialog.update_config_data_and_ui
+
+    with patch.object(dialog_module, "ReadOnlyTextDialog"):
+        dialog.pull_from_server(server.url)
+        wait_for_request(qtbot, dialog)
+
+        dialog.config_data.resources["lakes"].title = "Edited"
+        dialog.pull_from_server(server.url)
+        wait_for_request(qtbot, dialog)
+
+        assert "not modified" in dialog.mock_msgbox.information.call_args[0][2]
+        assert dialog.config_data.resources["lakes"].title == "Large Lakes"
+
+        # next pull is conditional too, and a modified config is downloaded
+        server.version = 2
+        dialog.pull_from_server(server.url)
+        wait_for_request(qtbot, dialog)
+
+    assert "not modified" not in dialog.mock_msgbox.information.call_args[0][2]
+    assert dialog._pull_conditional_headers == {"If-None-Match": '"2"'}
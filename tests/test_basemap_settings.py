@@ -0,0 +1,27 @@
+from PyQt5.QtCore import QSettings
+
+from ..ui_widgets.ui_setter_utils import (
+    BASEMAP_SETTINGS_GROUP,
+    DEFAULT_BASEMAP_URL,
+    BasemapSettings,
+)
+
+
+def test_basemap_settings(tmp_path):
+    """Base map options are read from QSettings, with defaults for the missing ones."""
+
+    settings = QSettings(str(tmp_path / "settings.ini"), QSettings.IniFormat)
+    assert BasemapSettings.from_settings(settings) == BasemapSettings(
+        url=DEFAULT_BASEMAP_URL, cache_tiles=True, offline=False
+    )
+
+    settings.setValue(f"{BASEMAP_SETTINGS_GROUP}/cache_tiles", False)
+    settings.setValue(f"{BASEMAP_SETTINGS_GROUP}/offline", "true")
+    settings.setValue(
+        f"{BASEMAP_SETTINGS_GROUP}/url", "https://tiles.example.org/{z}/{x}/{y}.png"
+    )
+    assert BasemapSettings.from_settings(settings) == BasemapSettings(
+        url="https://tiles.example.org/{z}/{x}/{y}.png",
+        cache_tiles=False,
+        offline=True,
+    )
@@ -0,0 +1,171 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ..models.top_level.providers.records import CrsAuthorities
+from ..utils import crs_validation
+from ..utils.crs_validation import (
+    CRS_BASE_URL,
+    UNVERIFIED_RESULT,
+    CrsUrlCache,
+    check_crs_url,
+    check_crs_urls,
+    collect_crs_references,
+    validate_crs_references,
+)
+from ..ui_widgets.utils import call_when_done
+
+
+class StubCrsHandler(BaseHTTPRequestHandler):
+    """Serves a CRS definition on /valid*, an exception report on /invalid, 404 otherwise."""
+
+    def do_GET(self):
+        self.server.requested.append(self.path)
+
+        if self.path.startswith("/valid"):
+            body = b"<gml:GeodeticCRS>" + b" " * 100_000 + b"</gml:GeodeticCRS>"
+        elif self.path == "/invalid":
+            body = (
+                b"<ows:ExceptionReport><ows:ExceptionText>Not found</ows:ExceptionText>"
+            )
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except OSError:
+            # client stopped reading
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubCrsHandler)
+    server.requested = []
+    server.url = f"http://127.0.0.1:{server.server_port}"
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CrsUrlCache(tmp_path / "crs_url_cache.json")
+    crs_validation.set_crs_url_cache(cache)
+    yield cache
+    crs_validation.set_crs_url_cache(None)
+
+
+def test_check_crs_url_cached(server, cache):
+    """Results are cached and persisted; not found URLs are reported."""
+
+    assert check_crs_url(f"{server.url}/valid") == (True, "Valid CRS URL")
+    assert check_crs_url(f"{server.url}/invalid") == (False, "Invalid CRS URL")
+    assert check_crs_url(f"{server.url}/missing") == (
+        False,
+        "HTTP response status code: 404",
+    )
+    assert check_crs_url(f"{server.url}/valid") == (True, "Valid CRS URL")
+    assert server.requested == ["/valid", "/invalid", "/missing"]
+
+    reloaded_cache = CrsUrlCache(cache.path)
+    assert reloaded_cache.get(f"{server.url}/invalid") == (False, "Invalid CRS URL")
+
+
+def test_offline_seed(cache):
+    """Every CRS authority is known without an online check, but not reported as valid."""
+
+    for authority in CrsAuthorities:
+        assert cache.get(f"{CRS_BASE_URL}{authority.value}") == UNVERIFIED_RESULT
+    assert check_crs_url(f"{CRS_BASE_URL}OGC/1.3/CRS84") == UNVERIFIED_RESULT
+
+
+def test_check_crs_urls_in_parallel(server, cache):
+    """Unique URLs are requested once."""
+
+    urls = [f"{server.url}/valid/{i % 5}" for i in range(20)]
+    results = check_crs_urls(urls)
+
+    assert len(results) == 5
+    assert all(result == (True, "Valid CRS URL") for result in results.values())
+    assert sorted(server.requested) == sorted(f"/valid/{i}" for i in range(5))
+
+
+def test_check_crs_urls_saved_once(server, cache, monkeypatch):
+    """Cache file is written once after checking many URLs, not after each one."""
+
+    saves = []
+    save = cache.save
+    monkeypatch.setattr(cache, "save", lambda: saves.append(save()))
+
+    urls = [f"{server.url}/valid/{i}" for i in range(5)]
+    check_crs_urls(urls)
+
+    assert len(saves) == 1
+    reloaded_cache = CrsUrlCache(cache.path)
+    assert all(reloaded_cache.get(url) == (True, "Valid CRS URL") for url in urls)
+
+
+def test_validate_crs_references(server, cache):
+    """CRS and TRS URLs of all resources are collected, each unique URL is requested once."""
+
+    resources = {
+        "lakes": {
+            "extents": {
+                "spatial": {"crs": f"{server.url}/valid"},
+                "temporal": {"trs": f"{server.url}/invalid"},
+            },
+            "providers": [
+                {
+                    "crs": [f"{server.url}/valid", f"{CRS_BASE_URL}OGC/1.3/CRS84"],
+                    "storage_crs": f"{server.url}/missing",
+                }
+            ],
+        },
+        "rivers": {"providers": [{"crs": f"{server.url}/valid"}]},
+        "links": {"extents": {"spatial": {}}},
+    }
+
+    references = validate_crs_references(collect_crs_references(resources))
+
+    assert {reference.path: reference.valid for reference in references["lakes"]} == {
+        "extents.spatial.crs": True,
+        "extents.temporal.trs": False,
+        "providers[0].crs[0]": True,
+        "providers[0].crs[1]": None,
+        "providers[0].storage_crs": False,
+    }
+    assert [reference.path for reference in references["rivers"]] == [
+        "providers[0].crs"
+    ]
+    assert references["links"] == []
+    assert sorted(server.requested) == ["/invalid", "/missing", "/valid"]
+
+
+def test_call_when_done_delivers_errors(qtbot):
+    def fail():
+        raise ValueError("failed")
+
+    done_futures = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        call_when_done(executor.submit(fail), done_futures.append)
+    cancelled = Future()
+    call_when_done(cancelled, done_futures.append)
+    cancelled.cancel()
+
+    qtbot.waitUntil(lambda: len(done_futures) == 2)
+    with pytest.raises(ValueError):
+        done_futures[0].result()
+    assert done_futures[1].cancelled()
@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+
+from ..utils.data_diff import diff_yaml_dict
+
+
+def test_diff_added_removed_changed():
+    """Nested differences are reported by path, equal subtrees are ignored."""
+
+    unchanged = {"title": "Lakes", "bbox": [-180, -90, 180, 90]}
+    old = {
+        "resources": {
+            "lakes": unchanged,
+            "obs": {"title": "Obs", "links": [{"href": "a"}, {"href": "b"}]},
+        },
+        "logging": {"level": "ERROR"},
+    }
+    new = {
+        "resources": {
+            "lakes": dict(unchanged),
+            "obs": {"title": "Observations", "links": [{"href": "a"}]},
+        },
+        "server": {"url": "http://localhost"},
+    }
+
+    diff_data = diff_yaml_dict(old, new)
+
+    assert diff_data["added"] == {"server": {"url": "http://localhost"}}
+    assert diff_data["removed"] == {
+        "logging": {"level": "ERROR"},
+        "resources.obs.links[1]": {"href": "b"},
+    }
+    assert diff_data["changed"] == {
+        "resources.obs.title": {"old": "Obs", "new": "Observations"}
+    }
+
+
+def test_diff_equivalent_datetimes():
+    """Datetimes equal to their string representation are not reported as changed."""
+
+    old = {
+        "temporal": {
+            "begin": datetime(2000, 10, 30, 18, 24, 39, tzinfo=timezone.utc),
+            "end": "2007-10-30T08:57:29+00:00",
+        }
+    }
+    new = {
+        "temporal": {
+            "begin": "2000-10-30T18:24:39Z",
+            "end": "2007-10-30T08:57:29Z",
+        }
+    }
+
+    assert diff_yaml_dict(old, new) == {
+        "added": {},
+        "removed": {},
+        "changed": {},
+        "moved": {},
+    }
+
+
+def test_diff_keyed_and_aligned_lists():
+    """Moved providers, inserted links and list items don't show following items as changed."""
+
+    feature = {"type": "feature", "name": "CSV", "data": "obs.csv"}
+    tile = {"type": "tile", "name": "MVT-proxy", "data": "http://tiles"}
+    old = {
+        "providers": [tile, feature],
+        "links": [{"href": "a", "rel": "item"}, {"href": "b", "rel": "item"}],
+        "keywords": ["lakes", "water"],
+    }
+    new = {
+        "providers": [feature, dict(tile, options={"zoom": 5})],
+        "links": [
+            {"href": "new", "rel": "item"},
+            {"href": "a", "rel": "item"},
+            {"href": "b", "rel": "item"},
+        ],
+        "keywords": ["rivers", "lakes", "water"],
+    }
+
+    diff_data = diff_yaml_dict(old, new)
+
+    assert diff_data["moved"] == {"providers[0]": {"from": 1, "to": 0}}
+    assert diff_data["added"] == {
+        "providers[1].options": {"zoom": 5},
+        "links[0]": {"href": "new", "rel": "item"},
+        "keywords[0]": "rivers",
+    }
+    assert diff_data["removed"] == {}
+    assert diff_data["changed"] == {}
@@ -0,0 +1,340 @@
+from copy import deepcopy
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+import yaml
+
+from ..models.top_level import ResourceConfigTemplate
+from ..models.top_level.providers import (
+    ProviderPostgresql,
+    ProviderMvtProxy,
+    ProviderTemplate,
+)
+from ..models.top_level.providers.records import ProviderTypes
+from ..models.top_level.providers.registry import (
+    PROVIDER_CLASSES,
+    get_provider_class,
+    get_ui_elements_grid,
+    register_provider,
+)
+from ..models.utils import (
+    cast_element_to_type,
+    get_dataclass_plan,
+    update_dataclass_from_dict,
+)
+from ..models.ConfigData import ConfigData
+from ..models.ResourceStore import ResourceStore
+from ..utils.yaml_io import iter_yaml_config_sections
+
+BASE_DIR = Path(__file__).parent
+
+
+@pytest.fixture(scope="module")
+def large_yaml_data() -> dict:
+    """Parsed large sample config, shared by the tests: deepcopy it before modifying."""
+    with open(
+        BASE_DIR / "byteroad_pygeoapi-config_@a015a48_docker.config.yml",
+        "r",
+        encoding="utf-8",
+    ) as file:
+        return yaml.safe_load(file)
+
+
+def test_dataclass_plan_is_cached():
+    """The deserialization plan is compiled once per dataclass."""
+
+    plan = get_dataclass_plan(ResourceConfigTemplate)
+
+    assert plan is get_dataclass_plan(ResourceConfigTemplate)
+    assert [f.name for f in plan][:3] == ["type", "title", "description"]
+    assert next(f for f in plan if f.name == "linked__data").alias == "linked-data"
+
+
+def test_providers_dispatched_by_type_and_name():
+    """Provider dicts are cast by their 'type' and 'name', unsupported providers are kept as dicts."""
+
+    resource = ResourceConfigTemplate.init_with_name(instance_name="lakes")
+    update_dataclass_from_dict(
+        resource,
+        {
+            "providers": [
+                {
+                    "type": "feature",
+                    "name": "PostgreSQL",
+                    "data": {"host": "localhost", "dbname": "test", "user": "postgres"},
+                    "id_field": "id",
+                    "table": "lakes",
+                },
+                {
+                    "type": "tile",
+                    "name": "MVT-proxy",
+                    "data": "http://localhost:9000/{z}/{x}/{y}.pbf",
+                    "format": {
+                        "name": "pbf",
+                        "mimetype": "application/vnd.mapbox-vector-tile",
+                    },
+                },
+                {"type": "feature", "name": "OGR", "data": {"source": "lakes.gpkg"}},
+                {"type": "map", "name": "PostgreSQL", "data": {}},
+            ]
+        },
+        "resources.lakes",
+    )
+
+    assert isinstance(resource.providers[0], ProviderPostgresql)
+    assert resource.providers[0].data.host == "localhost"
+    assert isinstance(resource.providers[1], ProviderMvtProxy)
+    assert resource.providers[2] == {
+        "type": "feature",
+        "name": "OGR",
+        "data": {"source": "lakes.gpkg"},
+    }
+    assert resource.providers[3] == {"type": "map", "name": "PostgreSQL", "data": {}}
+
+
+def test_registered_provider_is_cast():
+    """New provider classes are cast after registering them, without changes to the models."""
+
+    @register_provider
+    @dataclass(kw_only=True)
+    class ProviderTest(ProviderTemplate):
+        type: ProviderTypes = ProviderTypes.FEATURE
+        name: str = "Test"
+        data: str = ""
+
+        @classmethod
+        def ui_elements_grid(cls):
+            return [(*cls.get_field_info(cls, "data*"), None, "")]
+
+        def assign_ui_dict_to_provider_data_on_save(self, values):
+            pass
+
+    try:
+        assert get_provider_class(ProviderTypes.FEATURE, "Test") is ProviderTest
+        # the first registered provider of the type stays the default
+        assert get_provider_class(ProviderTypes.FEATURE) is ProviderPostgresql
+        assert get_ui_elements_grid(ProviderTest) is get_ui_elements_grid(ProviderTest)
+
+        resource = ResourceConfigTemplate.init_with_name(instance_name="lakes")
+        update_dataclass_from_dict(
+            resource,
+            {"providers": [{"type": "feature", "name": "Test", "data": "lakes.csv"}]},
+            "resources.lakes",
+        )
+        assert isinstance(resource.providers[0], ProviderTest)
+        assert resource.providers[0].data == "lakes.csv"
+    finally:
+        del PROVIDER_CLASSES[(ProviderTypes.FEATURE, "Test")]
+
+
+def test_provider_fields():
+    """Provider fields are computed once per class, and used to pack, read and validate the UI values."""
+
+    fields = ProviderPostgresql.get_fields()
+    assert fields is ProviderPostgresql.get_fields()
+    assert [f.path for f in fields if f.mandatory] == [
+        "name",
+        "table",
+        "id_field",
+        "data.host",
+        "data.dbname",
+        "data.user",
+    ]
+    assert get_ui_elements_grid(ProviderPostgresql) == tuple(
+        ProviderPostgresql.ui_elements_grid()
+    )
+
+    provider = ProviderMvtProxy()
+    provider.assign_value_list_to_provider_data_on_read(
+        ["tile", "MVT-proxy", "http://localhost:9000", "pbf", "", "", "2", "", ""]
+    )
+    # optional parents are only created for non-empty values
+    assert provider.options.zoom.min == 2
+    assert provider.options.zoom.max is None
+    assert provider.options.schemes is None
+    assert provider.get_invalid_properties() == ["format.mimetype"]
+    assert provider.pack_data_to_list() == [
+        "tile",
+        "MVT-proxy",
+        "http://localhost:9000",
+        "pbf",
+        "",
+        None,
+        2,
+        None,
+        None,
+    ]
+
+
+def test_cast_optional_ui_values():
+    """Values from the provider window are matched against optional types."""
+
+    assert cast_element_to_type(None, str | None, "data.password") is None
+    assert cast_element_to_type("5432", int | str | None, "data.port") == 5432
+    assert cast_element_to_type(["osm"], list | None, "crs") == ["osm"]
+
+
+def test_large_config_messages(large_yaml_data):
+    """Loading a large config reports the missing properties of every resource."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(large_yaml_data)
+
+    assert len(config_data.resources) == len(large_yaml_data["resources"])
+    assert len(config_data.error_message) == 0
+    assert all(
+        prop.startswith(("server.", "logging.", "metadata.", "resources."))
+        for prop in config_data.all_missing_props
+    )
+
+
+def test_streamed_yaml_matches_full_load():
+    """Loading resources one at a time from the YAML stream gives the same ConfigData as loading the full dict."""
+
+    with open(
+        BASE_DIR / "dgterritorio_OGCAPI_@21359a6_docker.config.yml",
+        "r",
+        encoding="utf-8",
+    ) as file:
+        yaml_source = file.read()
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(yaml.safe_load(yaml_source))
+
+    streamed_config_data = ConfigData()
+    streamed_config_data.set_data_from_yaml_sections(
+        iter_yaml_config_sections(yaml_source)
+    )
+
+    assert list(streamed_config_data.resources) == list(config_data.resources)
+    assert streamed_config_data.all_missing_props == config_data.all_missing_props
+    assert streamed_config_data.asdict_enum_safe(
+        streamed_config_data
+    ) == config_data.asdict_enum_safe(config_data)
+
+
+def test_resources_hydrated_on_access(large_yaml_data):
+    """Resources are kept as YAML data until accessed, with the same messages as eager conversion."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(large_yaml_data)
+    res_name = next(iter(config_data.resources))
+
+    assert not config_data.resources.is_hydrated(res_name)
+    assert config_data.resources.summary(res_name).title == (
+        large_yaml_data["resources"][res_name]["title"]
+    )
+    assert not config_data.resources.is_hydrated(res_name)
+
+    assert isinstance(config_data.resources[res_name], ResourceConfigTemplate)
+    assert config_data.resources.is_hydrated(res_name)
+
+    _, _, all_missing_props = config_data.get_loaded_messages()
+    assert set(all_missing_props) <= set(config_data.all_missing_props)
+    assert all(
+        config_data.resources.is_hydrated(name) for name in config_data.resources
+    )
+
+
+def test_deleted_resource_messages():
+    """Messages of a deleted resource are not reported for a new resource with the same name."""
+
+    resources = ResourceStore()
+    resources.add_from_yaml("new_resource", {"type": "collection", "title": 5})
+    resources["new_resource"]
+    assert any(resources.get_messages(["new_resource"]))
+
+    del resources["new_resource"]
+    resources["new_resource"] = ResourceConfigTemplate.init_with_name(
+        instance_name="new_resource"
+    )
+    assert resources.get_messages() == ([], [], [])
+
+
+def test_serialization_cache_and_variants(large_yaml_data):
+    """Both datetime variants match 'asdict_enum_safe'; only modified resources are serialized again."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(large_yaml_data)
+
+    str_data, native_data = config_data.asdict_enum_safe_variants()
+    assert str_data == config_data.asdict_enum_safe(config_data, datetime_to_str=True)
+    assert native_data == config_data.asdict_enum_safe(
+        config_data, datetime_to_str=False
+    )
+
+    res_name, other_res_name = list(config_data.resources)[:2]
+    config_data.resources[res_name].title = "New title"
+    config_data.resources.mark_dirty(res_name)
+
+    new_str_data, _ = config_data.asdict_enum_safe_variants()
+    assert new_str_data["resources"][res_name]["title"] == "New title"
+    assert (
+        new_str_data["resources"][other_res_name]
+        is str_data["resources"][other_res_name]
+    )
+
+
+def test_resource_rename_in_place(large_yaml_data):
+    """Renamed resources keep their position and cached data; listeners are notified."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(large_yaml_data)
+    resources = config_data.resources
+    names = list(resources)
+    renamed = []
+    resources.add_rename_listener(lambda *names: renamed.append(names))
+
+    str_data, _ = resources.get_serialized(names[1], config_data._asdict_variants)
+    resources.rename(names[1], "renamed")
+    resources.rename("renamed", "renamed")
+
+    assert list(resources) == [names[0], "renamed", *names[2:]]
+    assert names[1] not in resources
+    assert renamed == [(names[1], "renamed")]
+    assert (
+        resources.get_serialized("renamed", config_data._asdict_variants)[0] is str_data
+    )
+    # other resources are not touched
+    assert [name for name in resources if resources.is_hydrated(name)] == ["renamed"]
+
+    # another resource with the new name is not replaced
+    with pytest.raises(ValueError):
+        resources.rename(names[0], names[2])
+    assert list(resources) == [names[0], "renamed", *names[2:]]
+    assert renamed == [(names[1], "renamed")]
+    for name in (names[0], names[2]):
+        assert resources.get_plain(name, config_data._asdict_variants) == (
+            large_yaml_data["resources"][name]
+        )
+
+
+def test_changed_sections(large_yaml_data):
+    """Only sections that differ are reported; unchanged raw resources are compared without hydration."""
+
+    yaml_data = deepcopy(large_yaml_data)
+    previous = ConfigData()
+    previous.set_data_from_yaml(large_yaml_data)
+    res_name, edited_res_name, removed_res_name = list(previous.resources)[:3]
+    # hydrated in the previous data only
+    previous.resources[edited_res_name]
+
+    yaml_data["logging"]["level"] = "WARNING"
+    yaml_data["resources"][res_name]["title"] = "New title"
+    del yaml_data["resources"][removed_res_name]
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(yaml_data)
+
+    assert config_data.get_changed_sections(previous) == {
+        "logging",
+        "resources",
+        f"resources.{res_name}",
+        f"resources.{removed_res_name}",
+    }
+    assert [
+        name
+        for name in config_data.resources
+        if config_data.resources.is_hydrated(name)
+    ] == [edited_res_name]
@@ -0,0 +1,22 @@
+from PyQt5.QtWidgets import QListWidget
+
+from ..models.top_level.providers import ProviderPostgresql
+from ..ui_widgets.data_from_ui_setter_utils import get_list_widget_items_data
+from ..ui_widgets.ui_setter_utils import pack_providers_into_list_widget
+
+
+def test_providers_kept_in_list_widget(qtbot):
+    """List entries hold the providers themselves, so values with separators are not split on reading."""
+
+    list_widget = QListWidget()
+    qtbot.addWidget(list_widget)
+
+    provider = ProviderPostgresql(table="lakes | rivers", id_field="id")
+    read_only_provider = {"type": "feature", "name": "CSV", "data": "a | b.csv"}
+    pack_providers_into_list_widget([provider, read_only_provider], list_widget)
+
+    assert "lakes | rivers" in list_widget.item(0).text()
+    providers = get_list_widget_items_data(list_widget)
+    assert providers[0] is provider
+    assert providers[1] is read_only_provider
+    assert provider.table == "lakes | rivers"
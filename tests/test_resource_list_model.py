@@ -0,0 +1,50 @@
+from PyQt5.QtCore import QModelIndex
+
+from ..ui_widgets.ResourceListModel import ResourceListModel
+
+
+def test_lazy_rows_and_name_index(qtmodeltester):
+    """Rows are fetched in batches; resources are found by name without scanning the rows."""
+
+    model = ResourceListModel()
+    model.set_resources(f"res_{i}" for i in range(1200))
+
+    assert model.rowCount() == model.FETCH_BATCH_SIZE
+    assert model.canFetchMore(QModelIndex())
+    model.fetchMore(QModelIndex())
+    assert model.rowCount() == 2 * model.FETCH_BATCH_SIZE
+
+    # not fetched yet: fetched on request
+    index = model.index_of("res_1100")
+    assert index.row() == 1100 and index.data() == "res_1100"
+    assert model.rowCount() == 1101
+    assert not model.index_of("missing").isValid()
+
+    qtmodeltester.check(model)
+
+
+def test_row_changes(qtmodeltester, qtbot):
+    """Inserts, removals and renames are notified per row, and the name index follows them."""
+
+    model = ResourceListModel()
+    model.set_resources(["lakes", "rivers", "seas"])
+    qtmodeltester.check(model)
+
+    with qtbot.waitSignal(model.rowsRemoved):
+        model.remove_resource("lakes")
+    assert model.row_of("rivers") == 0 and model.row_of("seas") == 1
+
+    with qtbot.waitSignal(model.rowsInserted):
+        model.insert_resource("new_resource")
+    assert model.row_of("new_resource") == 2
+
+    with qtbot.waitSignal(model.dataChanged):
+        model.rename_resource("rivers", "streams")
+    assert model.index(0, 0).data() == "streams"
+    assert model.row_of("rivers") is None
+
+    assert [model.index(row, 0).data() for row in range(model.rowCount())] == [
+        "streams",
+        "seas",
+        "new_resource",
+    ]
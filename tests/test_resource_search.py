@@ -0,0 +1,69 @@
+from ..utils.resource_search import ResourceSearchIndex
+
+RESOURCES = {
+    "obs_stations": {
+        "title": {"en": "Observation stations", "fr": "Stations d'observation"},
+        "keywords": ["weather", "climate"],
+        "extents": {"spatial": {"bbox": [-10, 35, 5, 45]}},
+        "providers": [{"name": "PostgreSQL", "data": {"host": "db"}, "table": "obs"}],
+    },
+    "lakes": {
+        "title": "Large Lakes",
+        "description": "lakes of the world",
+        "extents": {"spatial": {"bbox": [-180, -90, 180, 90]}},
+        "providers": [{"name": "GeoJSON", "data": "tests/data/ne_110m_lakes.geojson"}],
+    },
+}
+
+
+def build_index() -> ResourceSearchIndex:
+    index = ResourceSearchIndex()
+    index.build(RESOURCES.items())
+    return index
+
+
+def test_search_fields():
+    """Terms match word prefixes of any field, or of the given field; all terms must match."""
+
+    index = build_index()
+
+    assert index.search("") is None
+    assert index.search("stat") == {"obs_stations"}
+    assert index.search("observ") == {"obs_stations"}
+    assert index.search("LAKES") == {"lakes"}
+    assert index.search("provider:postgresql") == {"obs_stations"}
+    assert index.search("provider:geojson lakes") == {"lakes"}
+    assert index.search("provider:geojson climate") == set()
+    assert index.search("keywords:climate") == {"obs_stations"}
+    assert index.search("title:world") == set()
+    assert index.search("bbox:0,0,10,10") == {"lakes"}
+    assert index.search("bbox:0,40,10,50") == {"obs_stations", "lakes"}
+
+
+def test_search_bbox_across_antimeridian():
+    """Resource extents crossing the antimeridian are found on both sides of it."""
+
+    index = ResourceSearchIndex()
+    index.build([("fiji", {"extents": {"spatial": {"bbox": [177, -21, -178, -12]}}})])
+
+    assert index.search("bbox:178,-20,179,-15") == {"fiji"}
+    assert index.search("bbox:-179,-20,-178.5,-15") == {"fiji"}
+    assert index.search("bbox:0,-20,10,-15") == set()
+
+
+def test_incremental_update():
+    """Edited, renamed and removed resources are indexed again without rebuilding the index."""
+
+    index = build_index()
+
+    index.update_resource("lakes", {"title": "Rivers"})
+    assert index.search("large") == set()
+    assert index.search("rivers") == {"lakes"}
+
+    index.rename_resource("lakes", "rivers", {"title": "Rivers"})
+    assert index.search("name:riv") == {"rivers"}
+    assert index.search("name:lakes") == set()
+
+    index.remove_resource("rivers")
+    assert index.search("rivers") == set()
+    assert len(index) == 1
@@ -24,13 +24,14 @@ def dialog(qtbot):
 
 @patch("pygeoapi_config.pygeoapi_config_dialog.QgsMessageLog", create=True)
 @patch("pygeoapi_config.pygeoapi_config_dialog.QMessageBox")
-def test_pull_then_push_config(mock_msgbox, mock_log, dialog):
+def test_pull_then_push_config(mock_msgbox, mock_log, dialog, qtbot):
 
     """Pull config data from server, then push it back."""
 
     print(f"Pulling data from: {SERVER_URL}", flush=True)
 
     dialog.pull_from_server(SERVER_URL)
+    qtbot.waitUntil(lambda: not dialog.is_server_request_running, timeout=15000)
 
     if mock_msgbox.critical.called:
         error_call = mock_msgbox.critical.call_args[0][2]
@@ -40,7 +41,7 @@ def test_pull_then_push_config(mock_msgbox, mock_log, dialog):
 
     # Get the data that was pulled
     yaml1_data = dialog.config_data.asdict_enum_safe(
-        deepcopy(dialog.yaml_original_data), datetime_to_str=False
+        deepcopy(dialog.get_yaml_original_data()), datetime_to_str=False
     )
 
     pulled_data = dialog.update_config_data_and_ui.call_args[0][0]
@@ -53,6 +54,7 @@ def test_pull_then_push_config(mock_msgbox, mock_log, dialog):
 
     print(f"Pushing data back to: {SERVER_URL}", flush=True)
     dialog.push_to_server(SERVER_URL, pulled_data)
+    qtbot.waitUntil(lambda: not dialog.is_server_request_running, timeout=15000)
 
     # Check if push failed
     if mock_msgbox.critical.called:
@@ -70,9 +72,10 @@ def test_pull_then_push_config(mock_msgbox, mock_log, dialog):
 
     # Pull again and get the data to compare
     dialog.pull_from_server(SERVER_URL)
+    qtbot.waitUntil(lambda: not dialog.is_server_request_running, timeout=15000)
 
     yaml2_data = dialog.config_data.asdict_enum_safe(
-        deepcopy(dialog.yaml_original_data), datetime_to_str=False
+        deepcopy(dialog.get_yaml_original_data()), datetime_to_str=False
     )
 
     yaml1_missing_props= None
@@ -0,0 +1,46 @@
+import random
+
+from ..utils.spatial_index import NODE_CAPACITY, BboxIndex
+
+
+def test_intersecting_matches_linear_scan():
+    """Results of the packed R-tree are the same as checking every bbox."""
+
+    rng = random.Random(0)
+    entries = []
+    for i in range(20 * NODE_CAPACITY**2):
+        x, y = rng.uniform(-180, 170), rng.uniform(-90, 80)
+        entries.append((i, (x, y, x + rng.uniform(0, 10), y + rng.uniform(0, 10))))
+    index = BboxIndex(entries)
+
+    assert len(index) == len(entries)
+    for _ in range(100):
+        x, y = rng.uniform(-180, 160), rng.uniform(-90, 70)
+        query = (x, y, x + 20, y + 20)
+        expected = {
+            key
+            for key, bbox in entries
+            if bbox[0] <= query[2]
+            and bbox[2] >= query[0]
+            and bbox[1] <= query[3]
+            and bbox[3] >= query[1]
+        }
+        assert set(index.intersecting(query)) == expected
+
+    assert BboxIndex().intersecting((-180, -90, 180, 90)) == []
+
+
+def test_antimeridian():
+    """Bboxes crossing the antimeridian (minx > maxx) match on both sides of it."""
+
+    index = BboxIndex(
+        [("pacific", (170, -20, -170, 10)), ("atlantic", (-60, 0, -10, 40))]
+    )
+
+    assert len(index) == 2
+    assert index.intersecting((175, 0, 178, 5)) == ["pacific"]
+    assert index.intersecting((-178, 0, -175, 5)) == ["pacific"]
+    assert index.intersecting((0, 0, 10, 10)) == []
+    assert sorted(index.intersecting((-180, -90, 180, 90))) == ["atlantic", "pacific"]
+    # query crossing the antimeridian too
+    assert index.intersecting((179, 0, -179, 5)) == ["pacific"]
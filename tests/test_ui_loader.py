@@ -0,0 +1,30 @@
+import os
+import shutil
+
+from ..ui_widgets.utils import UI_MTIME_TOLERANCE_S, load_ui_form_class
+
+REPO_DIR = os.path.dirname(os.path.dirname(__file__))
+
+
+def test_load_ui_form_class(tmp_path, monkeypatch):
+    """Form class is taken from the compiled module, unless the .ui file is newer."""
+
+    package_dir = tmp_path / "compiled_forms"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").touch()
+    for file_name in ("server_config_dialog.ui", "server_config_dialog.py"):
+        shutil.copy(os.path.join(REPO_DIR, file_name), package_dir / file_name)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    ui_path = str(package_dir / "server_config_dialog.ui")
+    module_mtime = os.path.getmtime(package_dir / "server_config_dialog.py")
+
+    os.utime(ui_path, (module_mtime, module_mtime))
+    form_class = load_ui_form_class(ui_path, "compiled_forms")
+    assert form_class.__module__ == "compiled_forms.server_config_dialog"
+
+    newer = module_mtime + UI_MTIME_TOLERANCE_S + 1
+    os.utime(ui_path, (newer, newer))
+    form_class = load_ui_form_class(ui_path, "compiled_forms")
+    assert form_class.__module__ != "compiled_forms.server_config_dialog"
+    assert hasattr(form_class, "setupUi")
@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+
+import yaml
+
+from ..models.top_level.utils import InlineList
+from ..utils.yaml_io import ConfigDumper, YAML_BACKEND, dump_yaml, load_yaml
+
+
+def test_dump_config_types():
+    """InlineList is written in flow style, datetime as unquoted timestamp."""
+
+    yaml_text = dump_yaml(
+        {
+            "bbox": InlineList([-180, -90, 180, 90]),
+            "begin": datetime(2000, 10, 30, 18, 24, 39, tzinfo=timezone.utc),
+        }
+    )
+
+    assert yaml_text == "bbox: [-180, -90, 180, 90]\nbegin: 2000-10-30T18:24:39Z\n"
+    assert load_yaml(yaml_text)["begin"] == datetime(
+        2000, 10, 30, 18, 24, 39, tzinfo=timezone.utc
+    )
+
+
+def test_backends_write_same_yaml():
+    """The active backend writes the same YAML as the pure-Python dumper."""
+
+    class PythonConfigDumper(yaml.SafeDumper):
+        yaml_representers = dict(ConfigDumper.yaml_representers)
+
+    data = {
+        "server": {"bind": {"host": "0.0.0.0", "port": 5000}},  # nosec
+        "resources": {
+            "lakes": {
+                "title": {"en": "Large Lakes", "fr": "Grands Lacs"},
+                "extents": {"spatial": {"bbox": InlineList([-180, -90, 180, 90])}},
+            }
+        },
+    }
+
+    assert YAML_BACKEND in ("libyaml", "python")
+    assert dump_yaml(data) == yaml.dump(
+        data,
+        Dumper=PythonConfigDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        indent=4,
+    )
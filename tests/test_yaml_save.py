@@ -5,6 +5,7 @@ import subprocess
 from pathlib import Path
 
 from ..utils.data_diff import diff_yaml_dict_remove_known_faulty_fields
+from ..utils import yaml_io
 from ..pygeoapi_config_dialog import PygeoapiConfigDialog
 
 BASE_DIR = Path(__file__).parent / "yaml_samples"
@@ -19,7 +20,7 @@ sample_yaml_files = list(BASE_DIR.glob("*.yml"))
 
 def load_yaml(path: str | Path) -> dict:
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)  # returns nested dicts/lists
+        return yaml_io.load_yaml(f)  # returns nested dicts/lists
 
 
 @pytest.fixture()
@@ -101,7 +102,7 @@ def test_open_file_validate_ui_data_save_file(qtbot, sample_yaml: str):
         sample_yaml
     )  # now dialog.config_data has the data stored including .all_missing_props
     yaml1_data = dialog.config_data.asdict_enum_safe(
-        deepcopy(dialog.yaml_original_data), datetime_to_str=False
+        deepcopy(dialog.get_yaml_original_data()), datetime_to_str=False
     )
     yaml1_missing_props = deepcopy(dialog.config_data.all_missing_props)
 
@@ -115,7 +116,7 @@ def test_open_file_validate_ui_data_save_file(qtbot, sample_yaml: str):
     # open the new file
     dialog.open_file(abs_new_yaml_path)  # now dialog.config_data has the data stored
     yaml2_data = dialog.config_data.asdict_enum_safe(
-        deepcopy(dialog.yaml_original_data), datetime_to_str=False
+        deepcopy(dialog.get_yaml_original_data()), datetime_to_str=False
     )
 
     # get diff between old and new data
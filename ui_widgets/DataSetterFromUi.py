@@ -4,9 +4,10 @@ from typing import TYPE_CHECKING
 
 from datetime import datetime
 
-from .utils import get_widget_text_value
+from .utils import get_item_object, get_widget_text_value
 
 from .data_from_ui_setter_utils import (
+    get_list_widget_items_data,
     unpack_locales_values_list_to_dict,
     unpack_listwidget_values_to_sublists,
 )
@@ -25,10 +26,8 @@ from ..models.top_level import (
     ServerTemplatesConfig,
     ServerLimitsConfig,
 )
-from ..models.top_level.providers import ProviderTemplate
 from ..models.top_level.providers.records import (
     Languages,
-    ProviderTypes,
     TrsAuthorities,
 )
 
@@ -38,7 +37,6 @@ from ..models.top_level.utils import (
     is_valid_string,
 )
 
-
 if TYPE_CHECKING:
     # preserve type checking, but don't import in runtime to avoid circular import
     from ..pygeoapi_config_dialog import PygeoapiConfigDialog
@@ -254,6 +252,7 @@ class DataSetterFromUi:
         dialog: PygeoapiConfigDialog = self.dialog
         config_data: ConfigData = dialog.config_data
         res_name = dialog.current_res_name
+        config_data.resources.mark_dirty(res_name)
 
         config_data.resources[res_name].type = get_enum_value_from_string(
             ResourceTypesEnum, dialog.comboBoxResType.currentText()
@@ -354,71 +353,34 @@ class DataSetterFromUi:
             new_linked_data = read_only_linked_data_lists[0][0]
             config_data.resources[res_name].linked__data = json.loads(new_linked_data)
 
-        # providers
-        config_data.resources[res_name].providers = []
-
-        # add editable providers from a widget
-        providers_data_lists: list[list[str]] = unpack_listwidget_values_to_sublists(
+        # providers: the list entries hold the provider objects (editable ones first, then read-only dicts),
+        # so unchanged providers are kept as they are
+        config_data.resources[res_name].providers = get_list_widget_items_data(
             dialog.listWidgetResProvider
-        )
-
-        for pr in providers_data_lists:
-            provider_type = get_enum_value_from_string(ProviderTypes, pr[0])
-            new_pr = ProviderTemplate.init_provider_from_type(provider_type)
-            new_pr.assign_value_list_to_provider_data_on_read(pr)
-
-            config_data.resources[res_name].providers.append(new_pr)
-
-        # add read-only providers from another widget
-        read_only_providers_data_lists: list[list[str]] = (
-            unpack_listwidget_values_to_sublists(
-                dialog.listWidgetResReadOnlyProviders, 1
-            )
-        )
-        for read_pr in read_only_providers_data_lists:
-            new_read_pr = read_pr[0]
-            config_data.resources[res_name].providers.append(json.loads(new_read_pr))
+        ) + get_list_widget_items_data(dialog.listWidgetResReadOnlyProviders)
 
         # change resource key to a new alias
         new_alias = dialog.lineEditResAlias.text()
 
-        new_resources = {}
-        for k, v in config_data.resources.items():
-            if k == res_name:
-                new_resources[new_alias] = v
-            else:
-                new_resources[k] = v
-        config_data.resources = new_resources
+        config_data.resources.rename(res_name, new_alias)
 
-    def delete_selected_provider_type_and_name(self, list_widget):
-        """Find and remove first matching resource provider with specified type and name."""
+    def delete_selected_provider(self, list_widget):
+        """Remove the resource provider held by the selected list entry (see set_item_object)."""
         dialog: PygeoapiConfigDialog = self.dialog
         config_data: ConfigData = dialog.config_data
         res_name = dialog.current_res_name
 
-        # get selected provider data from a widget (by selection index)
-        providers_data_lists: list[list] = unpack_listwidget_values_to_sublists(
-            list_widget
-        )
-        selected_index = list_widget.currentRow()
-        if selected_index < 0:
+        selected_item = list_widget.currentItem()
+        if selected_item is None:
             return
-        selected_pr_data = providers_data_lists[selected_index]
-        selected_pr_type = get_enum_value_from_string(
-            ProviderTypes, selected_pr_data[0]
-        )
-        selected_pr_name = selected_pr_data[1]
-
-        # iterate through resource providers and delete the first matching one
-        for res_provider in config_data.resources[res_name].providers:
-            if isinstance(res_provider, dict):
-                continue  # ignore read-only providers
-
-            if (
-                res_provider.name == selected_pr_name
-                and res_provider.type == selected_pr_type
-            ):
-                config_data.resources[res_name].providers.remove(res_provider)
+        selected_provider = get_item_object(selected_item)
+
+        # compare by identity: providers with the same type and name can be in the resource
+        providers = config_data.resources[res_name].providers
+        for i, res_provider in enumerate(providers):
+            if res_provider is selected_provider:
+                del providers[i]
+                config_data.resources.mark_dirty(res_name)
                 break
 
     def get_extents_crs_from_ui(self, dialog):
@@ -435,8 +397,14 @@ class DataSetterFromUi:
         dialog: PygeoapiConfigDialog = self.dialog
         invalid_fields = []
 
-        if not is_valid_string(dialog.lineEditResAlias.text()):
+        new_alias = dialog.lineEditResAlias.text()
+        if not is_valid_string(new_alias):
             invalid_fields.append("alias")
+        elif (
+            new_alias != dialog.current_res_name
+            and new_alias in dialog.config_data.resources
+        ):
+            invalid_fields.append("alias (already used by another resource)")
         if dialog.listWidgetResTitle.count() == 0:
             invalid_fields.append("title")
         if dialog.listWidgetResDescription.count() == 0:
@@ -0,0 +1,154 @@
+from typing import Iterable
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+
+class ResourceListModel(QAbstractListModel):
+    """List model of resource names, in the order of ConfigData.resources.
+
+    Rows are exposed to the view in batches as it scrolls (see 'canFetchMore', 'fetchMore'), and a name:row index
+    allows to find resources without scanning the rows. Changes of single resources are notified per row
+    ('insert_resource', 'remove_resource', 'rename_resource'), without resetting the view.
+    """
+
+    # number of rows added to the view at once
+    FETCH_BATCH_SIZE = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: list[str] = []
+        self._rows: dict[str, int] = {}
+        # number of rows exposed to the view so far
+        self._fetched = 0
+
+    def set_resources(self, names: Iterable[str]):
+        """Replace all rows, e.g. after loading a new config."""
+        self.beginResetModel()
+        self._names = list(names)
+        self._rows = {name: row for row, name in enumerate(self._names)}
+        self._fetched = min(self.FETCH_BATCH_SIZE, len(self._names))
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._fetched
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._names[index.row()]
+        return None
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if parent.isValid():
+            return False
+        return self._fetched < len(self._names)
+
+    def fetchMore(self, parent: QModelIndex):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH_SIZE, len(self._names) - self._fetched)
+        if count <= 0:
+            return
+
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def fetch_all(self):
+        """Expose all rows to the view, e.g. before filtering."""
+        if self._fetched < len(self._names):
+            self.beginInsertRows(QModelIndex(), self._fetched, len(self._names) - 1)
+            self._fetched = len(self._names)
+            self.endInsertRows()
+
+    def name_at(self, row: int) -> str:
+        return self._names[row]
+
+    def row_of(self, name: str) -> int | None:
+        return self._rows.get(name)
+
+    def index_of(self, name: str) -> QModelIndex:
+        """Get the model index of the resource (fetching its row if needed), invalid index if not found."""
+        row = self._rows.get(name)
+        if row is None:
+            return QModelIndex()
+
+        if row >= self._fetched:
+            self.beginInsertRows(QModelIndex(), self._fetched, row)
+            self._fetched = row + 1
+            self.endInsertRows()
+        return self.index(row, 0)
+
+    def insert_resource(self, name: str):
+        """Append a new resource; nothing happens if the name is already listed."""
+        if name in self._rows:
+            return
+
+        row = len(self._names)
+        # rows after the fetched ones are not visible yet
+        if self._fetched < row:
+            self._names.append(name)
+            self._rows[name] = row
+            return
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._names.append(name)
+        self._rows[name] = row
+        self._fetched += 1
+        self.endInsertRows()
+
+    def remove_resource(self, name: str):
+        row = self._rows.get(name)
+        if row is None:
+            return
+
+        visible = row < self._fetched
+        if visible:
+            self.beginRemoveRows(QModelIndex(), row, row)
+        del self._names[row]
+        del self._rows[name]
+        # shift the following rows
+        for following_row in range(row, len(self._names)):
+            self._rows[self._names[following_row]] = following_row
+        if visible:
+            self._fetched -= 1
+            self.endRemoveRows()
+
+    def rename_resource(self, old_name: str, new_name: str):
+        """Rename the resource, keeping its row."""
+        row = self._rows.get(old_name)
+        if row is None or old_name == new_name:
+            return
+
+        # the new name replaces another listed resource (overwritten in ConfigData)
+        if new_name in self._rows:
+            self.remove_resource(new_name)
+            row = self._rows[old_name]
+
+        self._names[row] = new_name
+        del self._rows[old_name]
+        self._rows[new_name] = row
+        if row < self._fetched:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+
+
+class ResourceFilterProxyModel(QSortFilterProxyModel):
+    """Shows only the resources in the set of matching names (e.g. from ResourceSearchIndex), all if None.
+    The source model is a ResourceListModel."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._matching_names: set[str] | None = None
+
+    def set_matching_names(self, names: set[str] | None):
+        self._matching_names = names
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._matching_names is None:
+            return True
+        return self.sourceModel().name_at(source_row) in self._matching_names
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import partial
 import json
 from typing import TYPE_CHECKING
 
@@ -23,11 +24,17 @@ from ..models.top_level.utils import (
 from .utils import set_combo_box_value_from_data
 
 from .ui_setter_utils import (
+    BasemapSettings,
     clear_layout,
+    create_basemap_layer,
+    create_footprints_layer,
     create_rect_layer_from_bbox,
+    update_footprint,
+    update_rect_layer_bbox,
     fill_combo_box,
     pack_locales_data_into_list,
     pack_list_data_into_list_widget,
+    pack_providers_into_list_widget,
     get_default_language,
 )
 from .utils import get_widget_text_value, reset_widget
@@ -37,14 +44,14 @@ from PyQt5.QtGui import QIntValidator, QDoubleValidator
 from PyQt5.QtCore import (
     Qt,
 )
-from PyQt5.QtWidgets import QMessageBox
+from PyQt5.QtWidgets import QComboBox, QLineEdit, QListWidget, QMessageBox, QSpinBox
 
 # make imports optional for pytests
 try:
     from qgis.gui import QgsMapCanvas
     from qgis.core import (
-        QgsRasterLayer,
         QgsCoordinateReferenceSystem,
+        QgsVectorLayer,
     )
 except:
     pass # nosec
@@ -54,6 +61,12 @@ if TYPE_CHECKING:
     from ..pygeoapi_config_dialog import PygeoapiConfigDialog
     from ..models.ConfigData import ConfigData
 
+# main UI tabs, and the ConfigData sections edited in them
+TAB_SECTIONS = {
+    "serverTab": ("server", "logging"),
+    "metadataTab": ("metadata",),
+}
+
 
 class UiSetter:
 
@@ -62,8 +75,45 @@ class UiSetter:
     def __init__(self, dialog: PygeoapiConfigDialog):
         self.dialog = dialog
 
-    def set_ui_from_data(self):
-        """Set values for all main UI tabs from ConfigData."""
+        # sections with widgets edited in the UI (not necessarily saved to ConfigData yet)
+        self._ui_modified_sections: set[str] = set()
+        self._updating_ui = False
+
+        # bboxes of all resources on the map, created on the next preview after loading resources
+        self._footprints_layer = None
+        self._footprint_ids: dict[str, int] = {}
+        # layers currently set to the map canvas
+        self._canvas_layers = []
+
+    def set_ui_from_data(self, sections: set[str] | None = None):
+        """Set values for all main UI tabs from ConfigData. If 'sections' are given (see ConfigData.get_changed_sections),
+        only the widgets of these sections are updated, together with the sections edited in the UI since the last update.
+        """
+        if sections is not None:
+            sections = sections | self._ui_modified_sections
+
+        self._updating_ui = True
+        try:
+            if sections is None or "server" in sections:
+                self.set_server_ui_from_data()
+            if sections is None or "logging" in sections:
+                self.set_logging_ui_from_data()
+            # metadata locales depend on the server language
+            if sections is None or {"metadata", "server"} & sections:
+                self.set_metadata_ui_from_data()
+
+            # collections
+            if sections is None or "resources" in sections:
+                self.refresh_resources_list_ui()
+            elif f"resources.{self.dialog.current_res_name}" in sections:
+                self._refresh_resource_preview()
+        finally:
+            self._updating_ui = False
+
+        self._ui_modified_sections.clear()
+
+    def set_server_ui_from_data(self):
+        """Set values of the server widgets from ConfigData."""
         config_data: ConfigData = self.dialog.config_data
 
         # bind
@@ -185,27 +235,30 @@ class UiSetter:
                 self.dialog.listWidgetServerLangs,
             )
 
-        # limits
-        if config_data.server.limits is None:
-            config_data.server.limits = ServerLimitsConfig()
+        # limits (defaults, if not set)
+        limits = config_data.server.limits or ServerLimitsConfig()
 
-        self.dialog.spinBoxDefault.setValue(config_data.server.limits.default_items)
-        self.dialog.spinBoxMax.setValue(config_data.server.limits.max_items)
+        self.dialog.spinBoxDefault.setValue(limits.default_items)
+        self.dialog.spinBoxMax.setValue(limits.max_items)
 
-        max_distance_x = config_data.server.limits.max_distance_x or ""
+        max_distance_x = limits.max_distance_x or ""
         self.dialog.lineEditServerLimitsMaxDistX.setText(str(max_distance_x))
 
-        max_distance_y = config_data.server.limits.max_distance_y or ""
+        max_distance_y = limits.max_distance_y or ""
         self.dialog.lineEditServerLimitsMaxDistY.setText(str(max_distance_y))
 
-        max_distance_units = config_data.server.limits.max_distance_units or ""
+        max_distance_units = limits.max_distance_units or ""
         self.dialog.lineEditServerLimitsMaxDistUnits.setText(str(max_distance_units))
 
         set_combo_box_value_from_data(
             combo_box=self.dialog.comboBoxExceed or ServerOnExceedEnum.NONE,
-            value=config_data.server.limits.on_exceed,
+            value=limits.on_exceed,
         )
 
+    def set_logging_ui_from_data(self):
+        """Set values of the logging widgets from ConfigData."""
+        config_data: ConfigData = self.dialog.config_data
+
         # logging
         set_combo_box_value_from_data(
             combo_box=self.dialog.comboBoxLog,
@@ -234,6 +287,10 @@ class UiSetter:
             self.dialog.listWidgetLogRotation,
         )
 
+    def set_metadata_ui_from_data(self):
+        """Set values of the metadata widgets from ConfigData."""
+        config_data: ConfigData = self.dialog.config_data
+
         # metadata identification
 
         # DATA WITH LOCALES
@@ -328,16 +385,19 @@ class UiSetter:
             value=config_data.metadata.contact.role,
         )
 
-        # collections
-        self.refresh_resources_list_ui()
+    def _refresh_resource_preview(self):
+        """Preview the selected resource again, e.g. after its data changed."""
+        model_index = self.dialog.listViewCollection.currentIndex()
+        if (
+            model_index.isValid()
+            and model_index.data() == self.dialog.current_res_name
+            and self.dialog.groupBoxCollectionPreview.isVisible()
+        ):
+            self.preview_resource(model_index)
 
     def refresh_resources_list_ui(self):
         """Refresh ListWidget with resources from ConfigData."""
-        self.dialog.model.setStringList(
-            [k for k, _ in self.dialog.config_data.resources.items()]
-        )
-        self.dialog.proxy.setSourceModel(self.dialog.model)
-        self.dialog.listViewCollection.setModel(self.dialog.proxy)
+        self.dialog.model.set_resources(self.dialog.config_data.resources)
 
     def set_resource_ui_from_data(self, res_data: ResourceConfigTemplate):
         """Set values for Resource UI from resource data."""
@@ -483,24 +543,18 @@ class UiSetter:
         """
         dialog = self.dialog
 
-        data_lists = []
-        read_only_data_lists = []
+        # list entries hold the providers themselves (see 'pack_providers_into_list_widget')
+        providers = []
+        read_only_providers = []
         for p in res_data.providers:
-
             if isinstance(p, dict):  # provider type not supported yet
-                read_only_data_lists.append(str(json.dumps(p)))
+                read_only_providers.append(p)
             else:
+                providers.append(p)
 
-                data_chunk: list = p.pack_data_to_list()
-                data_lists.append(data_chunk)
-
-        pack_list_data_into_list_widget(
-            data_lists,
-            dialog.listWidgetResProvider,
-        )
-        pack_list_data_into_list_widget(
-            read_only_data_lists,
-            dialog.listWidgetResReadOnlyProviders,
+        pack_providers_into_list_widget(providers, dialog.listWidgetResProvider)
+        pack_providers_into_list_widget(
+            read_only_providers, dialog.listWidgetResReadOnlyProviders
         )
 
     def customize_ui_on_launch(self):
@@ -566,31 +620,92 @@ class UiSetter:
         # resource content size
         self.dialog.addResLinksLengthLineEdit.setValidator(QIntValidator())
 
+        self._track_ui_modifications()
+
+    def _track_ui_modifications(self):
+        """Record the sections edited in the UI, so that their widgets are reset on the next partial update
+        (see 'set_ui_from_data'), even if their data didn't change."""
+
+        for tab_name, sections in TAB_SECTIONS.items():
+            tab = getattr(self.dialog, tab_name)
+            on_modified = partial(self._on_ui_modified, sections)
+
+            for line_edit in tab.findChildren(QLineEdit):
+                line_edit.textChanged.connect(on_modified)
+            for combo_box in tab.findChildren(QComboBox):
+                combo_box.currentIndexChanged.connect(on_modified)
+            for spin_box in tab.findChildren(QSpinBox):
+                spin_box.valueChanged.connect(on_modified)
+            for list_widget in tab.findChildren(QListWidget):
+                list_widget.model().rowsInserted.connect(on_modified)
+                list_widget.model().rowsRemoved.connect(on_modified)
+                list_widget.model().dataChanged.connect(on_modified)
+
+    def _on_ui_modified(self, sections: tuple[str, ...], *_):
+        if not self._updating_ui:
+            self._ui_modified_sections.update(sections)
+
     def setup_map_widget(self):
-        try:  # using qgis imports, so we should ignore for pytests
-            dialog = self.dialog
+        """Create the map canvas with the base map (see BasemapSettings) on the first display of the resource
+        preview, and show the current preview on it. Nothing happens if the canvas already exists.
+        """
+        dialog = self.dialog
+        if dialog.bbox_map_canvas is not None:
+            return
 
-            # Define base tile layer (OSM)
-            urlWithParams = (
-                "type=xyz&url=https://tile.openstreetmap.org/{z}/{x}/{y}.png"
-            )
-            dialog.bbox_base_layer = QgsRasterLayer(
-                urlWithParams, "OpenStreetMap", "wms"
-            )
+        try:  # using qgis imports, so we should ignore for pytests
+            basemap_settings = BasemapSettings.from_settings()
+            dialog.bbox_base_layer = create_basemap_layer(basemap_settings)
 
-            # Create QgsMapCanvas with OSM layer
+            # Create QgsMapCanvas with the base layer
             dialog.bbox_map_canvas = QgsMapCanvas()
+            dialog.bbox_map_canvas.setCachingEnabled(basemap_settings.cache_tiles)
             crs = QgsCoordinateReferenceSystem("EPSG:4326")
             dialog.bbox_map_canvas.setDestinationCrs(crs)
             dialog.bbox_map_canvas.setCanvasColor(Qt.white)
             dialog.bbox_map_canvas.setLayers([dialog.bbox_base_layer])
-            dialog.bbox_map_canvas.zoomToFullExtent()
-            # self.canvas.setExtent(layer.extent(), True)
-            # self.canvas.refreshAllLayers()
+            self._canvas_layers = [dialog.bbox_base_layer]
 
             # Add QgsMapCanvas as a widget to the Resource Tab
             clear_layout(dialog.bboxMapPlaceholder)
             dialog.bboxMapPlaceholder.addWidget(dialog.bbox_map_canvas)
+        except NameError:
+            return
+
+        self._update_map_preview()
+
+    def invalidate_resource_footprints(self):
+        """Recreate the footprints layer on the next preview, e.g. after loading new resources."""
+        self._footprints_layer = None
+        self._footprint_ids = {}
+
+    def update_resource_footprint(self, res_name: str):
+        """Update the footprint of an added, edited or removed resource in place (from ResourceSearchIndex)."""
+        if self._footprints_layer is None:
+            return
+        update_footprint(
+            self._footprints_layer,
+            self._footprint_ids,
+            res_name,
+            self.dialog.resource_search_index.get_resource_bbox(res_name),
+        )
+
+    def show_resource_footprints(self, selected_layer: "QgsVectorLayer" = None):
+        """Show bboxes of all resources on the map (from ResourceSearchIndex), with the selected resource on top."""
+        try:  # using qgis imports, so we should ignore for pytests
+            dialog = self.dialog
+            if self._footprints_layer is None:
+                self._footprints_layer, self._footprint_ids = create_footprints_layer(
+                    dialog.resource_search_index.get_bboxes()
+                )
+
+            layers = [self._footprints_layer, dialog.bbox_base_layer]
+            if selected_layer is not None:
+                layers.insert(0, selected_layer)
+            # layers are only reset if they changed, otherwise repainted in place
+            if layers != self._canvas_layers:
+                dialog.bbox_map_canvas.setLayers(layers)
+                self._canvas_layers = layers
         except NameError:
             pass
 
@@ -601,23 +716,26 @@ class UiSetter:
         if not model_index:
             dialog.lineEditTitle.setText("")
             dialog.lineEditDescription.setText("")
-            self.setup_map_widget()
 
             dialog.groupBoxCollectionLoaded.hide()
             dialog.groupBoxCollectionSelect.show()
             dialog.groupBoxCollectionPreview.show()
 
             dialog.current_res_name = ""
+            self._update_map_preview()
             return
 
         dialog.current_res_name = model_index.data()
 
+        # preview from the resource summary, without converting the resource from YAML data
+        summary = dialog.config_data.resources.summary(dialog.current_res_name)
+
         # do nothing, if resource is unsupported
-        if isinstance(dialog.config_data.resources[dialog.current_res_name], dict):
+        if not summary.supported:
             QMessageBox.warning(
                 self.dialog,
                 "Message",
-                f"Preview is not supported for the Resource type '{dialog.config_data.resources[dialog.current_res_name].get('type')}'.",
+                f"Preview is not supported for the Resource type '{summary.type}'.",
             )
             return
 
@@ -627,26 +745,38 @@ class UiSetter:
         dialog.groupBoxCollectionPreview.show()
 
         # If title is a dictionary, use the first (default) value
-        title = dialog.config_data.resources[dialog.current_res_name].title
+        title = summary.title
         if isinstance(title, dict):
             title = next(iter(title.values()), "")
         dialog.lineEditTitle.setText(title)
 
         # If description is a dictionary, use the first (default) value
-        description = dialog.config_data.resources[dialog.current_res_name].description
+        description = summary.description
         if isinstance(description, dict):
             description = next(iter(description.values()), "")
         dialog.lineEditDescription.setText(description)
 
-        # load bbox
-        bbox = dialog.config_data.resources[
-            dialog.current_res_name
-        ].extents.spatial.bbox
+        self._update_map_preview(summary.bbox)
 
-        dialog.bbox_extents_layer = create_rect_layer_from_bbox(bbox)
-        dialog.bbox_map_canvas.setLayers(
-            [dialog.bbox_extents_layer, dialog.bbox_base_layer]
-        )
+    def _update_map_preview(self, bbox: list[float] | None = None):
+        """Show the footprints and the bbox of the previewed resource (if any) on the map, once the map exists."""
+        dialog = self.dialog
+        if dialog.bbox_map_canvas is None:
+            return
+
+        if bbox is None and dialog.current_res_name in dialog.config_data.resources:
+            bbox = dialog.config_data.resources.summary(dialog.current_res_name).bbox
+        if not bbox:
+            self.show_resource_footprints()
+            dialog.bbox_map_canvas.zoomToFullExtent()
+            return
+
+        # the selected bbox layer is created once, and then moved to the selected resource
+        if getattr(dialog, "bbox_extents_layer", None) is None:
+            dialog.bbox_extents_layer = create_rect_layer_from_bbox(bbox)
+        else:
+            update_rect_layer_bbox(dialog.bbox_extents_layer, bbox)
+        self.show_resource_footprints(dialog.bbox_extents_layer)
         # self.bbox_map_canvas.zoomToFullExtent()
         dialog.bbox_map_canvas.setExtent(dialog.bbox_extents_layer.extent(), True)
         # self.canvas.refreshAllLayers()
@@ -654,12 +784,10 @@ class UiSetter:
     def select_listcollection_item_by_text(self, target_text: str):
         dialog = self.dialog
 
-        model = dialog.listViewCollection.model()
-        for row in range(model.rowCount()):
-            index = model.index(row, 0)
-            if model.data(index) == target_text:
-                dialog.listViewCollection.setCurrentIndex(index)
-                break
+        # resource row from the name index, mapped to the (filtered) list view
+        index = dialog.proxy.mapFromSource(dialog.model.index_of(target_text))
+        if index.isValid():
+            dialog.listViewCollection.setCurrentIndex(index)
 
     def _lang_entry_exists_in_list_widget(
         self, list_widget, locale, punctuation=True
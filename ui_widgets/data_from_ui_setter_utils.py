@@ -1,4 +1,5 @@
 from ..models.top_level.utils import STRING_SEPARATOR
+from .utils import get_item_object
 
 
 def unpack_locales_values_list_to_dict(list_widget, allow_list_per_locale: bool):
@@ -38,3 +39,8 @@ def unpack_listwidget_values_to_sublists(
         all_sublists.append(values)
 
     return all_sublists
+
+
+def get_list_widget_items_data(list_widget) -> list:
+    """Objects held by the list widget entries (see set_item_object), e.g. providers."""
+    return [get_item_object(list_widget.item(i)) for i in range(list_widget.count())]
@@ -13,13 +13,12 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtGui import QIntValidator
 
-from ...models.top_level.providers import (
-    ProviderPostgresql,
-    ProviderMvtProxy,
-    ProviderWmsFacade,
-)
-
+from ...models.top_level.providers import ProviderTemplate
 from ...models.top_level.providers.records import ProviderTypes
+from ...models.top_level.providers.registry import (
+    get_provider_class,
+    get_ui_elements_grid,
+)
 from ...models.utils import cast_list_elements_to_expected_types, cast_element_to_type
 from .StringListWidget import StringListWidget
 from .utils import add_widgets_to_grid_by_specs
@@ -34,7 +33,7 @@ class NewProviderWindow(QDialog):
     def __init__(
         self,
         provider_type: ProviderTypes,
-        data_list: list[str] | None = None,
+        provider: ProviderTemplate | None = None,
     ):
         super().__init__()
         self.signal_provider_close.connect(self.close)
@@ -52,21 +51,19 @@ class NewProviderWindow(QDialog):
         group_box.setLayout(group_layout)
         self.main_layout.addWidget(group_box)
 
-        # fill the box depending on the provider type
-        self.elements_with_values = {}
-        if provider_type == ProviderTypes.FEATURE:
-            self.elements_with_values = add_widgets_to_grid_by_specs(
-                ProviderPostgresql.ui_elements_grid(), group_layout, data_list
-            )
-
-        elif provider_type == ProviderTypes.MAP:
-            self.elements_with_values = add_widgets_to_grid_by_specs(
-                ProviderWmsFacade.ui_elements_grid(), group_layout, data_list
-            )
+        # fill the box depending on the provider class (of the edited provider, or the default one of the type);
+        # when editing, the widgets are filled with the typed values of the provider, without the type
+        if provider is not None:
+            provider_class = type(provider)
+            data_list = provider.pack_data_to_list()[1:]
+        else:
+            provider_class = get_provider_class(provider_type)
+            data_list = None
 
-        elif provider_type == ProviderTypes.TILE:
+        self.elements_with_values = {}
+        if provider_class is not None:
             self.elements_with_values = add_widgets_to_grid_by_specs(
-                ProviderMvtProxy.ui_elements_grid(), group_layout, data_list
+                get_ui_elements_grid(provider_class), group_layout, data_list
             )
 
         # Add buttons at the bottom
@@ -1,3 +1,5 @@
+import json
+
 from PyQt5.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -41,7 +43,7 @@ def create_list_widget(
 def add_widgets_to_grid_by_specs(
     specs_list: list[tuple],
     group_layout: QGridLayout,
-    data_list: list[str] | None = None,
+    data_list: list | None = None,
 ) -> dict:
 
     all_data_widgets = {}
@@ -104,13 +106,25 @@ def add_widgets_to_grid_by_specs(
     return all_data_widgets
 
 
-def assign_value_to_field(widget, text_data):
+def assign_value_to_field(widget, value):
+    """Show the provider field value in the widget: typed values as they are stored in the provider
+    (e.g. lists are added item by item, not split from a text), or text."""
     if isinstance(widget, QLineEdit):
-        widget.setText(text_data)
+        if value is None:
+            widget.setText("")
+        elif isinstance(value, dict):
+            widget.setText(json.dumps(value))
+        elif isinstance(value, list):
+            widget.setText(",".join(str(v) for v in value))
+        else:
+            widget.setText(str(value))
     if isinstance(widget, QComboBox):
-        set_combo_box_value_from_data(combo_box=widget, value=text_data)
+        set_combo_box_value_from_data(combo_box=widget, value=value)
     if isinstance(widget, StringListWidget):
         widget.list_widget.clear()
-        if len(text_data) > 0:
-            for item in text_data.split(","):
+        if isinstance(value, list):
+            for item in value:
+                widget.list_widget.addItem(str(item))
+        elif value:
+            for item in value.split(","):
                 widget.list_widget.addItem(item)
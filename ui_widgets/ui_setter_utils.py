@@ -1,10 +1,19 @@
+from dataclasses import dataclass
 from enum import Enum
+import json
+import os
+
+from PyQt5.QtCore import QSettings
+from PyQt5.QtWidgets import QListWidgetItem
+
 from ..models.top_level.utils import STRING_SEPARATOR, is_valid_string
+from .utils import set_item_object
 
 # make imports optional for pytests
 try:
     from qgis.gui import QgsMapCanvas
     from qgis.core import (
+        QgsApplication,
         QgsRasterLayer,
         QgsVectorLayer,
         QgsFeature,
@@ -37,45 +46,174 @@ def clear_layout(layout):
 
 def create_rect_layer_from_bbox(bbox: list[float], layer_name="Rectangle"):
 
-    xmin, ymin, xmax, ymax = bbox
     # Create memory vector layer with polygon geometry
     layer = QgsVectorLayer("Polygon?crs=EPSG:4326", layer_name, "memory")
     provider = layer.dataProvider()
     crs = QgsCoordinateReferenceSystem("EPSG:4326")
     layer.setCrs(crs)
 
-    # Create rectangular geometry from bbox
-    rect = QgsRectangle(xmin, ymin, xmax, ymax)
-    geom = QgsGeometry.fromRect(rect)
-
-    # Create feature and assign geometry
+    # Create feature with rectangular geometry
     feature = QgsFeature()
-    feature.setGeometry(geom)
+    feature.setGeometry(_geometry_from_bbox(bbox))
     provider.addFeatures([feature])
 
     # Update layer
     layer.updateExtents()
-    _apply_red_transparent_style(layer)
+    layer.renderer().setSymbol(_get_cached_symbol("selected").clone())
 
     # QgsProject.instance().addMapLayer(layer)
     return layer
 
 
-def _apply_red_transparent_style(layer):
-    # Create a fill symbol with red color and 50% transparency
-    symbol = QgsFillSymbol.createSimple(
-        {
-            "color": "255,0,0,80",  # Red fill with 128/255 alpha (50% transparent)
-            "outline_color": "255,0,0, 128",  # Red outline
-            "outline_width": "0.5",  # Outline width in mm
-        }
+def update_rect_layer_bbox(layer, bbox: list[float]):
+    """Move the rectangle of a layer from 'create_rect_layer_from_bbox' in place, and repaint the layer."""
+    provider = layer.dataProvider()
+    feature_id = next(iter(provider.allFeatureIds()))
+    provider.changeGeometryValues({feature_id: _geometry_from_bbox(bbox)})
+
+    layer.updateExtents()
+    layer.triggerRepaint()
+
+
+def create_footprints_layer(
+    bboxes: dict[str, tuple[float, float, float, float]], layer_name="Resources"
+) -> tuple["QgsVectorLayer", dict[str, int]]:
+    """Create a memory layer with the bbox rectangles of all resources, added in a single bulk call.
+    Returns the layer and the feature IDs by resource name (see 'update_footprint')."""
+
+    layer = QgsVectorLayer(
+        "Polygon?crs=EPSG:4326&field=name:string", layer_name, "memory"
     )
+    features = [
+        _create_footprint_feature(layer, name, bbox) for name, bbox in bboxes.items()
+    ]
+    _, added_features = layer.dataProvider().addFeatures(features)
+    feature_ids = {
+        feature.attribute("name"): feature.id() for feature in added_features
+    }
+
+    layer.updateExtents()
+    layer.renderer().setSymbol(_get_cached_symbol("footprint").clone())
+    return layer, feature_ids
+
+
+def update_footprint(
+    layer,
+    feature_ids: dict[str, int],
+    name: str,
+    bbox: tuple[float, float, float, float] | None,
+):
+    """Add, move or remove (if bbox is None) the resource footprint in place, and repaint the layer."""
+    provider = layer.dataProvider()
+    feature_id = feature_ids.get(name)
 
-    # Apply symbol to layer renderer
-    layer.renderer().setSymbol(symbol)
+    if bbox is None:
+        if feature_id is None:
+            return
+        provider.deleteFeatures([feature_id])
+        del feature_ids[name]
+    elif feature_id is None:
+        _, added_features = provider.addFeatures(
+            [_create_footprint_feature(layer, name, bbox)]
+        )
+        feature_ids[name] = added_features[0].id()
+    else:
+        provider.changeGeometryValues({feature_id: _geometry_from_bbox(bbox)})
+
+    layer.updateExtents()
     layer.triggerRepaint()
 
 
+def _create_footprint_feature(layer, name: str, bbox) -> "QgsFeature":
+    feature = QgsFeature(layer.fields())
+    feature.setGeometry(_geometry_from_bbox(bbox))
+    feature.setAttribute("name", name)
+    return feature
+
+
+def _geometry_from_bbox(bbox) -> "QgsGeometry":
+    xmin, ymin, xmax, ymax = bbox
+    return QgsGeometry.fromRect(QgsRectangle(xmin, ymin, xmax, ymax))
+
+
+# symbols by style name, created once and cloned for each layer
+_SYMBOL_STYLES = {
+    # Red fill with 80/255 alpha, red outline (width in mm)
+    "selected": {
+        "color": "255,0,0,80",
+        "outline_color": "255,0,0, 128",
+        "outline_width": "0.5",
+    },
+    # Thin grey outlines, no fill: footprints stay visible under the selected resource
+    "footprint": {
+        "color": "0,0,0,0",
+        "outline_color": "80,80,80,160",
+        "outline_width": "0.2",
+    },
+}
+_symbols = {}
+
+
+def _get_cached_symbol(style: str) -> "QgsFillSymbol":
+    if style not in _symbols:
+        _symbols[style] = QgsFillSymbol.createSimple(_SYMBOL_STYLES[style])
+    return _symbols[style]
+
+
+# QSettings group of the base map options (see BasemapSettings)
+BASEMAP_SETTINGS_GROUP = "pygeoapi_config/basemap"
+DEFAULT_BASEMAP_URL = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+
+
+@dataclass(kw_only=True)
+class BasemapSettings:
+    """Base map of the resource preview, read from QSettings (see BASEMAP_SETTINGS_GROUP)."""
+
+    # XYZ tiles URL
+    url: str = DEFAULT_BASEMAP_URL
+    # keep rendered tiles in the map canvas cache, so they are not requested again on every repaint
+    cache_tiles: bool = True
+    # use the local fallback base map, without requesting tiles
+    offline: bool = False
+
+    @classmethod
+    def from_settings(cls, settings: QSettings | None = None) -> "BasemapSettings":
+        if settings is None:
+            settings = QSettings()
+
+        default = cls()
+        settings.beginGroup(BASEMAP_SETTINGS_GROUP)
+        try:
+            return cls(
+                url=settings.value("url", default.url, type=str) or default.url,
+                cache_tiles=settings.value(
+                    "cache_tiles", default.cache_tiles, type=bool
+                ),
+                offline=settings.value("offline", default.offline, type=bool),
+            )
+        finally:
+            settings.endGroup()
+
+
+def create_basemap_layer(basemap_settings: BasemapSettings):
+    """Create the XYZ tiles layer, or the fallback world map shipped with QGIS if offline or if the tiles layer is invalid."""
+    if not basemap_settings.offline:
+        layer = QgsRasterLayer(
+            f"type=xyz&url={basemap_settings.url}", "Base map", "wms"
+        )
+        if layer.isValid():
+            return layer
+
+    return QgsVectorLayer(
+        os.path.join(
+            QgsApplication.pkgDataPath(), "resources", "data", "world_map.gpkg"
+        )
+        + "|layername=countries",
+        "World map",
+        "ogr",
+    )
+
+
 def get_default_language(config_data) -> str:
     """Get the default language from ConfigData (server.language or server.languages)."""
     if config_data.server.language is not None:
@@ -122,27 +260,47 @@ def pack_list_data_into_list_widget(data: list[list | str], list_widget):
     list_widget.clear()
 
     for line_data in data:
-        all_elements = []
+        list_widget.addItem(_get_list_entry_text(line_data))
+
 
-        if isinstance(line_data, str):  # if Provider type not supported yet
-            all_elements.append(line_data)
+def pack_providers_into_list_widget(providers: list, list_widget):
+    """Add an entry for each provider (dataclass, or dict if the provider type is not supported yet).
+    The provider itself is kept in the item data (see set_item_object), and the text is only for display.
+    """
+    list_widget.clear()
 
+    for provider in providers:
+        if isinstance(provider, dict):
+            text = json.dumps(provider)
         else:
-            for d in line_data:
-                # convert all values to strings and joint with SEPARATOR symbol
-                if d is not None:
-                    if isinstance(d, list):
-                        # convert list to a string without brackets (e.g. for bbox)
-                        all_elements.append(",".join(d))
-                    elif isinstance(d, Enum):  # e.g. Languages Enum
-                        all_elements.append(str(d.value))
-                    else:
-                        all_elements.append(str(d))
+            text = _get_list_entry_text(provider.pack_data_to_list())
+
+        item = QListWidgetItem(text)
+        set_item_object(item, provider)
+        list_widget.addItem(item)
+
+
+def _get_list_entry_text(line_data: list | str) -> str:
+    all_elements = []
+
+    if isinstance(line_data, str):  # if Provider type not supported yet
+        all_elements.append(line_data)
+
+    else:
+        for d in line_data:
+            # convert all values to strings and joint with SEPARATOR symbol
+            if d is not None:
+                if isinstance(d, list):
+                    # convert list to a string without brackets (e.g. for bbox)
+                    all_elements.append(",".join(d))
+                elif isinstance(d, Enum):  # e.g. Languages Enum
+                    all_elements.append(str(d.value))
                 else:
-                    all_elements.append("")
+                    all_elements.append(str(d))
+            else:
+                all_elements.append("")
 
-        text_entry = STRING_SEPARATOR.join(all_elements)
-        list_widget.addItem(text_entry)
+    return STRING_SEPARATOR.join(all_elements)
 
 
 def select_list_widget_items_by_texts(*, list_widget, texts_to_select):
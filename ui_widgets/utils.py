@@ -1,8 +1,67 @@
+from concurrent.futures import Future
 from enum import Enum
-import requests
+import importlib
+import os
 from urllib.parse import urlparse
 
-from PyQt5.QtWidgets import QComboBox, QLineEdit, QMessageBox
+from PyQt5.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QApplication, QComboBox, QLineEdit, QMessageBox
+
+from ..utils.crs_validation import check_crs_url_async
+
+# item data role of list widget entries holding the represented object (e.g. a provider, see 'set_item_object')
+ITEM_DATA_ROLE = Qt.UserRole
+
+# tolerance when comparing modification times of .ui files and their compiled modules (e.g. zip archives store
+# them with 2 seconds precision, and git checkouts write them in any order)
+UI_MTIME_TOLERANCE_S = 2
+
+
+class _ItemObject:
+    """Holder of a Python object in the item data: Qt stores it as is, while e.g. dictionaries with string keys
+    would be converted to (copied) QVariantMap."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+def set_item_object(item, value):
+    """Keep the object itself in the list widget item (see ITEM_DATA_ROLE)."""
+    item.setData(ITEM_DATA_ROLE, _ItemObject(value))
+
+
+def get_item_object(item):
+    """Object kept in the list widget item by 'set_item_object', None if there is none."""
+    holder = item.data(ITEM_DATA_ROLE)
+    return holder.value if isinstance(holder, _ItemObject) else None
+
+
+def load_ui_form_class(ui_path: str, package: str):
+    """Get the form class of a Qt Designer file from its module compiled by pyuic5 in the same package (e.g.
+    'dialog_base.py' for 'dialog_base.ui', see 'compile' in Makefile). The .ui file is only compiled at runtime
+    with 'uic.loadUiType' if the module is missing, or older than the .ui file."""
+    module_path = os.path.splitext(ui_path)[0] + ".py"
+    try:
+        up_to_date = os.path.getmtime(
+            module_path
+        ) + UI_MTIME_TOLERANCE_S >= os.path.getmtime(ui_path)
+    except OSError:
+        up_to_date = False
+
+    if up_to_date:
+        module_name = os.path.splitext(os.path.basename(ui_path))[0]
+        module = importlib.import_module(f".{module_name}", package)
+        for name, value in vars(module).items():
+            if name.startswith("Ui_") and isinstance(value, type):
+                return value
+
+    # uic compiler is only imported if needed
+    from PyQt5 import uic
+
+    form_class, _ = uic.loadUiType(ui_path)
+    return form_class
 
 
 def get_widget_text_value(widget):
@@ -44,38 +103,66 @@ def set_combo_box_value_from_data(*, combo_box, value):
         combo_box.clear()
 
 
-def _is_url_responsive(url: str) -> bool:
+class _GuiThreadNotifier(QObject):
+    """Delivers results of background tasks to the GUI thread."""
 
-    parsed_url = urlparse(url)
-    if not all([parsed_url.scheme, parsed_url.netloc]):
-        return False, "Invalid URL"
+    done = pyqtSignal(object, object)
 
-    try:
-        # Detect OGC ExceptionReport (invalid request)
-        response = requests.get(url, allow_redirects=True, timeout=5)
-        if response.status_code != 200:
-            return False, f"HTTP response status code: {response.status_code}"
-        else:
-            text = response.text
-            if "ExceptionReport" in text or "ExceptionText" in text:
-                return False, "Invalid CRS URL"
-            return True, "Valid CRS URL"
+    @pyqtSlot(object, object)
+    def call(self, callback, future):
+        callback(future)
 
-    except requests.ConnectionError:
-        # No internet or server unreachable
-        return False, "No internet connection or cannot reach server."
 
-    except requests.Timeout:
-        return False, "Request timed out."
+_gui_thread_notifier: _GuiThreadNotifier | None = None
 
-    except requests.RequestException:
-        return False, "Something went wrong with the request :("
+
+def call_when_done(future: Future, callback):
+    """Call 'callback(future)' in the GUI thread, when the future is done. To be called from the GUI thread.
+    The callback gets the done future, so that 'future.result()' raises errors and cancellation in the GUI thread.
+    """
+    global _gui_thread_notifier
+
+    # created on first use, in the GUI thread
+    if _gui_thread_notifier is None:
+        _gui_thread_notifier = _GuiThreadNotifier()
+        _gui_thread_notifier.done.connect(_gui_thread_notifier.call)
+
+    notifier = _gui_thread_notifier
+    future.add_done_callback(
+        lambda done_future: notifier.done.emit(callback, done_future)
+    )
 
 
 def get_url_status(url, parent=None):
+    """Check the CRS URL (in a background thread, if not cached) and show the result in a message box."""
+
+    parsed_url = urlparse(url)
+    if not all([parsed_url.scheme, parsed_url.netloc]):
+        _show_url_status((False, "Invalid URL"), parent)
+        return
+
+    future = check_crs_url_async(url)
+    if future.done():
+        _show_url_status(future.result(), parent)
+        return
+
+    QApplication.setOverrideCursor(Qt.WaitCursor)
+    call_when_done(future, lambda done_future: _on_url_checked(done_future, parent))
+
+
+def _on_url_checked(future: Future, parent=None):
+    try:
+        response = future.result()
+    except Exception as e:
+        response = (False, f"Error checking the URL: {e}")
+    finally:
+        QApplication.restoreOverrideCursor()
+    _show_url_status(response, parent)
+
 
-    response = _is_url_responsive(url)
-    if response[0]:
+def _show_url_status(response: tuple[bool | None, str], parent=None):
+    # valid, or well-known and not checked online
+    if response[0] is not False:
         QMessageBox.information(
             parent,
             "Information",
@@ -0,0 +1,352 @@
+from dataclasses import dataclass
+import gzip
+import json
+import threading
+from urllib.parse import quote, urlparse
+
+import requests
+
+from .data_diff import diff_yaml_dict
+from .http_session import get_http_session
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+ADMIN_API_HEADERS = {
+    "accept": "*/*",
+    "Content-Type": "application/json; charset=utf-8",
+}
+ADMIN_API_TIMEOUT = 10
+
+# size of the chunks read from / written to the connection between progress reports
+CHUNK_SIZE = 64 * 1024
+
+# request bodies are sent as plain JSON: pygeoapi doesn't decompress them. They are gzip-compressed
+# only for the hosts known to accept it (see 'set_request_compression'), until the server rejects them
+GZIP_COMPRESSLEVEL = 6
+_GZIP_HOSTS: set[str] = set()
+
+
+class AdminApiCancelled(Exception):
+    """Raised inside the worker thread when the request is cancelled by the user."""
+
+    pass
+
+
+@dataclass(kw_only=True)
+class AdminApiRequest:
+    """Request to the admin API, with JSON body if 'data' is set."""
+
+    method: str
+    url: str
+    data: dict | None = None
+    # additional headers, e.g. conditional GET headers (see 'get_conditional_headers')
+    headers: dict | None = None
+
+    def get_body(self) -> bytes | None:
+        if self.data is None:
+            return None
+        return json.dumps(self.data, allow_nan=False).encode("utf-8")
+
+
+@dataclass(kw_only=True)
+class AdminApiResponse:
+    """Result of finished admin API request(s): status code and data of the last response."""
+
+    status_code: int
+    data: dict | None = None
+    # number of requests sent successfully, total size of their (compressed) bodies,
+    # and of their JSON bodies before compression
+    requests_count: int = 1
+    bytes_sent: int = 0
+    json_bytes_sent: int = 0
+    # if the original requests failed, and the fallback request was sent instead
+    used_fallback: bool = False
+    # validators of the pulled config, for the next conditional pull
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+    def get_conditional_headers(self) -> dict:
+        """Headers for a GET request, to only get the config if it changed since this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def set_request_compression(url: str, compress: bool = True):
+    """Send gzip-compressed request bodies to the host of 'url' (e.g. a server behind a proxy
+    that decompresses them), or plain JSON again."""
+    host = urlparse(url).netloc
+    if compress:
+        _GZIP_HOSTS.add(host)
+    else:
+        _GZIP_HOSTS.discard(host)
+
+
+def plan_config_push(
+    url: str, original_data: dict | None, new_data: dict
+) -> tuple[list[AdminApiRequest], AdminApiRequest | None]:
+    """Get requests to push the config to the admin API (at 'url', e.g. http://localhost:5000/admin/config),
+    and the full PUT request as a fallback, if only resources are sent.
+
+    If 'original_data' (the current server config) only differs from 'new_data' in resources,
+    only the changed, added and removed resources are sent to the admin resource endpoints.
+    Otherwise, the full config is sent with PUT."""
+
+    full_push = AdminApiRequest(method="PUT", url=url, data=new_data)
+    if not original_data:
+        return [full_push], None
+
+    # any change outside of resources requires the full config
+    for section in original_data.keys() | new_data.keys():
+        if section != "resources" and _has_diff(
+            original_data.get(section), new_data.get(section)
+        ):
+            return [full_push], None
+
+    original_resources = original_data.get("resources") or {}
+    new_resources = new_data.get("resources") or {}
+    resources_url = f"{url.rstrip('/')}/resources"
+
+    requests_list = []
+    for res_name, res_data in new_resources.items():
+        res_url = f"{resources_url}/{quote(str(res_name), safe='')}"
+        if res_name not in original_resources:
+            requests_list.append(
+                AdminApiRequest(
+                    method="POST", url=resources_url, data={res_name: res_data}
+                )
+            )
+        elif _has_diff(original_resources[res_name], res_data):
+            requests_list.append(
+                AdminApiRequest(method="PUT", url=res_url, data=res_data)
+            )
+
+    for res_name in original_resources.keys() - new_resources.keys():
+        requests_list.append(
+            AdminApiRequest(
+                method="DELETE",
+                url=f"{resources_url}/{quote(str(res_name), safe='')}",
+            )
+        )
+
+    return requests_list, full_push
+
+
+def _has_diff(original_value, new_value) -> bool:
+    diff_data = diff_yaml_dict({"value": original_value}, {"value": new_value})
+    return any(len(diff_data[k]) > 0 for k in diff_data)
+
+
+class _ProgressBody:
+    """Request body read by the HTTP connection in chunks, reporting upload progress.
+    Raising AdminApiCancelled from 'read' aborts the upload."""
+
+    def __init__(self, content: bytes, on_chunk):
+        self._content = content
+        self._position = 0
+        self._on_chunk = on_chunk
+
+    def __len__(self) -> int:
+        return len(self._content)
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self._content) - self._position
+        chunk = self._content[self._position : self._position + min(size, CHUNK_SIZE)]
+        self._position += len(chunk)
+        self._on_chunk(self._position, len(self._content))
+        return chunk
+
+
+class AdminApiWorker(QObject):
+    """Sends a request to the pygeoapi admin API, to be run in a separate QThread (see 'start_admin_api_request').
+    Results are delivered through signals, so that the GUI thread is not blocked during the transfer.
+    """
+
+    # bytes transferred, total bytes (0 if unknown)
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    # emitted after any of the 3 signals above
+    done = pyqtSignal()
+
+    def __init__(
+        self,
+        requests_list: list[AdminApiRequest],
+        fallback: AdminApiRequest | None = None,
+    ):
+        super().__init__()
+        self.requests_list = requests_list
+        self.fallback = fallback
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation, can be called from any thread.
+        Takes effect between the transferred chunks."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            try:
+                result = self._send_all(self.requests_list)
+            except requests.exceptions.RequestException:
+                # e.g. admin resource endpoints not supported: send everything at once
+                if self.fallback is None or self.is_cancelled():
+                    raise
+                result = self._send_all([self.fallback])
+                result.used_fallback = True
+        except AdminApiCancelled:
+            self.cancelled.emit()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            if self.is_cancelled():
+                self.cancelled.emit()
+            else:
+                self.failed.emit(str(e))
+        else:
+            self.finished.emit(result)
+        finally:
+            self.done.emit()
+
+    def _check_cancelled(self):
+        if self.is_cancelled():
+            raise AdminApiCancelled()
+
+    def _send_all(self, requests_list: list[AdminApiRequest]) -> AdminApiResponse:
+        """Send requests one by one, reporting the progress of all request bodies together."""
+        bodies = [_encode_body(request) for request in requests_list]
+        total = sum(len(body) for body, _, _ in bodies if body)
+
+        result = AdminApiResponse(status_code=0, requests_count=0)
+        for request, (body, content_encoding, json_size) in zip(requests_list, bodies):
+            self._check_cancelled()
+            if request.method == "GET":
+                response = self._get(request)
+            else:
+                response = self._send(
+                    request, body, content_encoding, result.bytes_sent, total
+                )
+
+            result.status_code = response.status_code
+            result.data = response.data
+            result.etag = response.etag
+            result.last_modified = response.last_modified
+            result.requests_count += 1
+            result.bytes_sent += response.bytes_sent
+            result.json_bytes_sent += json_size
+
+        return result
+
+    def _get(self, request: AdminApiRequest) -> AdminApiResponse:
+        with get_http_session().get(
+            request.url,
+            headers={**ADMIN_API_HEADERS, **(request.headers or {})},
+            timeout=ADMIN_API_TIMEOUT,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+
+            result = AdminApiResponse(
+                status_code=response.status_code,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            # config not changed since the last pull, no content
+            if result.not_modified:
+                return result
+
+            total = int(response.headers.get("Content-Length") or 0)
+            content = bytearray()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                self._check_cancelled()
+                content.extend(chunk)
+                self.progress.emit(len(content), total)
+
+            result.data = json.loads(bytes(content))
+            return result
+
+    def _send(
+        self,
+        request: AdminApiRequest,
+        body: bytes | None,
+        content_encoding: str | None,
+        offset: int,
+        total: int,
+    ) -> AdminApiResponse:
+
+        def on_chunk(sent: int, _: int):
+            self._check_cancelled()
+            self.progress.emit(offset + sent, total)
+
+        headers = {**ADMIN_API_HEADERS, **(request.headers or {})}
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+
+        response = get_http_session().request(
+            request.method,
+            request.url,
+            headers=headers,
+            data=_ProgressBody(body, on_chunk) if body is not None else None,
+            timeout=ADMIN_API_TIMEOUT,
+        )
+
+        # server doesn't accept compressed bodies: send uncompressed, now and later
+        if content_encoding and _is_content_encoding_rejected(response):
+            set_request_compression(request.url, False)
+            body, _, _ = _encode_body(request)
+            return self._send(request, body, None, offset, total)
+
+        response.raise_for_status()
+        return AdminApiResponse(
+            status_code=response.status_code, bytes_sent=len(body) if body else 0
+        )
+
+
+def _is_content_encoding_rejected(response: requests.Response) -> bool:
+    """If the server rejected the compressed body: 415 Unsupported Media Type, or 400 saying that the
+    Content-Encoding is not supported. Other errors (e.g. validation of the config) are not retried.
+    """
+    if response.status_code == 415:
+        return True
+    if response.status_code != 400:
+        return False
+    text = response.text.lower()
+    return "encoding" in text and ("unsupported" in text or "not supported" in text)
+
+
+def _encode_body(request: AdminApiRequest) -> tuple[bytes | None, str | None, int]:
+    """Request body (JSON, gzip-compressed if enabled for the server), its Content-Encoding,
+    and the size of the JSON body before compression."""
+    body = request.get_body()
+    json_size = len(body) if body else 0
+    if body is None or urlparse(request.url).netloc not in _GZIP_HOSTS:
+        return body, None, json_size
+    return gzip.compress(body, compresslevel=GZIP_COMPRESSLEVEL), "gzip", json_size
+
+
+def start_admin_api_requests(
+    requests_list: list[AdminApiRequest], fallback: AdminApiRequest | None = None
+) -> tuple[QThread, AdminApiWorker]:
+    """Create the worker in a new QThread and start sending the requests.
+    Keep a reference to the returned thread and worker until the 'done' signal."""
+
+    thread = QThread()
+    worker = AdminApiWorker(requests_list, fallback)
+    worker.moveToThread(thread)
+
+    thread.started.connect(worker.run)
+    worker.done.connect(thread.quit)
+
+    thread.start()
+    return thread, worker
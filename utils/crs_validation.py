@@ -0,0 +1,344 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Iterable
+
+import requests
+
+from .http_session import get_http_session
+from ..models.top_level.providers.records import CrsAuthorities, TrsAuthorities
+
+CRS_BASE_URL = "http://www.opengis.net/def/crs/"
+
+# how long the results of online checks are kept (seconds)
+VALID_URL_TTL = 30 * 24 * 3600
+INVALID_URL_TTL = 24 * 3600
+
+CHECK_TIMEOUT = 5
+MAX_WORKERS = 8
+
+# CRS definitions are checked for exception reports in the beginning of the response only
+MAX_CHECKED_BYTES = 16 * 1024
+EXCEPTION_MARKERS = (b"ExceptionReport", b"ExceptionText")
+
+# well-known CRS, not checked online (see 'get_offline_seed')
+SEED_CRS_PATHS = (
+    "OGC/1.3/CRS84",
+    "OGC/1.3/CRS83",
+    "OGC/1.3/CRS27",
+    "OGC/0/CRS84",
+    "OGC/0/CRS84h",
+    "EPSG/0/4326",
+    "EPSG/0/4258",
+    "EPSG/0/3857",
+    "EPSG/0/3035",
+    "EPSG/0/25832",
+    "EPSG/0/25833",
+    "EPSG/0/4979",
+)
+
+# (valid, message), valid is None for well-known URLs that are not checked online
+CrsCheckResult = tuple[bool | None, str]
+UNVERIFIED_RESULT: CrsCheckResult = (None, "Well-known CRS URL, not checked online")
+
+
+@dataclass(kw_only=True)
+class CrsReference:
+    """CRS or TRS URI used in a resource, with the check result."""
+
+    # property path in the resource, e.g. 'providers[0].crs[1]'
+    path: str
+    url: str
+    # None if not validated yet, or not checked online (see UNVERIFIED_RESULT)
+    valid: bool | None = None
+    message: str = ""
+
+
+def get_offline_seed() -> dict[str, CrsCheckResult]:
+    """Results known without an online check: every CrsAuthorities register, well-known CRS and TRS.
+    They are not proven to resolve, so they are reported as unverified (see UNVERIFIED_RESULT), not as valid.
+    """
+    seed = {
+        f"{CRS_BASE_URL}{authority.value}": UNVERIFIED_RESULT
+        for authority in CrsAuthorities
+    }
+    seed.update({f"{CRS_BASE_URL}{path}": UNVERIFIED_RESULT for path in SEED_CRS_PATHS})
+    seed.update({trs.value: UNVERIFIED_RESULT for trs in TrsAuthorities if trs.value})
+    return seed
+
+
+class CrsUrlCache:
+    """Results of CRS URL checks by URL. Results of online checks expire (see VALID_URL_TTL, INVALID_URL_TTL)
+    and are persisted to a JSON file, if 'path' is set. Offline seed results never expire.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._seed = get_offline_seed()
+        # url: (valid, message, expiry timestamp)
+        self._entries: dict[str, tuple[bool, str, float]] = {}
+        # entries added since the last save
+        self._modified = False
+        self.load()
+
+    def get(self, url: str) -> CrsCheckResult | None:
+        if url in self._seed:
+            return self._seed[url]
+
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            if entry[2] < time.time():
+                del self._entries[url]
+                return None
+            return entry[0], entry[1]
+
+    def set(self, url: str, result: CrsCheckResult, save: bool = True):
+        """Add the result of an online check. With 'save' False, the file is only written on the next 'save',
+        e.g. once after checking many URLs."""
+        valid, message = result
+        expiry = time.time() + (VALID_URL_TTL if valid else INVALID_URL_TTL)
+        with self._lock:
+            self._entries[url] = (valid, message, expiry)
+            self._modified = True
+        if save:
+            self.save()
+
+    def load(self):
+        if self.path is None or not self.path.is_file():
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            # corrupted or unreadable cache is ignored, and overwritten on the next save
+            return
+
+        now = time.time()
+        with self._lock:
+            self._entries = {
+                url: (valid, message, expiry)
+                for url, (valid, message, expiry) in entries.items()
+                if expiry >= now
+            }
+
+    def save(self):
+        """Write the entries to the file, if any were added since the last save."""
+        if self.path is None:
+            return
+
+        with self._lock:
+            if not self._modified:
+                return
+            entries = dict(self._entries)
+            self._modified = False
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as file:
+                    json.dump(entries, file)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                # cache is only an optimization
+                pass
+
+
+_cache: CrsUrlCache | None = None
+_executor: ThreadPoolExecutor | None = None
+_init_lock = threading.Lock()
+
+
+def get_default_cache_path() -> Path:
+    from PyQt5.QtCore import QStandardPaths
+
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    return Path(cache_dir) / "pygeoapi_config" / "crs_url_cache.json"
+
+
+def get_crs_url_cache() -> CrsUrlCache:
+    global _cache
+    with _init_lock:
+        if _cache is None:
+            _cache = CrsUrlCache(get_default_cache_path())
+    return _cache
+
+
+def set_crs_url_cache(cache: CrsUrlCache | None):
+    """Replace the shared cache (e.g. with a cache stored in a different file), None to reset to default."""
+    global _cache
+    with _init_lock:
+        _cache = cache
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _init_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_WORKERS, thread_name_prefix="crs_check"
+            )
+    return _executor
+
+
+def check_crs_url(url: str, save_cache: bool = True) -> CrsCheckResult:
+    """Check if the CRS URL resolves to a CRS definition. Uses the cache, results of online checks are cached,
+    except for network errors. The cache file is written if 'save_cache' is True."""
+
+    cache = get_crs_url_cache()
+    cached = cache.get(url)
+    if cached is not None:
+        return cached
+
+    result, cacheable = _resolve_crs_url(url)
+    if cacheable:
+        cache.set(url, result, save=save_cache)
+    return result
+
+
+def check_crs_url_async(url: str, save_cache: bool = True) -> Future:
+    """Check the CRS URL in a background thread; the Future result is (valid, message)."""
+    cached = get_crs_url_cache().get(url)
+    if cached is not None:
+        future = Future()
+        future.set_result(cached)
+        return future
+    return get_executor().submit(check_crs_url, url, save_cache)
+
+
+def check_crs_urls(urls: Iterable[str]) -> dict[str, CrsCheckResult]:
+    """Check all unique URLs in parallel (cached ones are not requested again).
+    The cache file is written once, after all checks."""
+    futures = {
+        url: check_crs_url_async(url, save_cache=False) for url in dict.fromkeys(urls)
+    }
+    try:
+        return {url: future.result() for url, future in futures.items()}
+    finally:
+        get_crs_url_cache().save()
+
+
+def _resolve_crs_url(url: str) -> tuple[CrsCheckResult, bool]:
+    """Request the URL, reading only the beginning of the response. Returns the result,
+    and whether the result can be cached."""
+
+    try:
+        with get_http_session().get(
+            url, allow_redirects=True, timeout=CHECK_TIMEOUT, stream=True
+        ) as response:
+            if response.status_code != 200:
+                # client errors are permanent, server errors might not be
+                return (
+                    False,
+                    f"HTTP response status code: {response.status_code}",
+                ), response.status_code < 500
+
+            # Detect OGC ExceptionReport (invalid request)
+            checked = b""
+            for chunk in response.iter_content(4096):
+                checked += chunk
+                if any(marker in checked for marker in EXCEPTION_MARKERS):
+                    return (False, "Invalid CRS URL"), True
+                if len(checked) >= MAX_CHECKED_BYTES:
+                    break
+            return (True, "Valid CRS URL"), True
+
+    except requests.ConnectionError:
+        # No internet or server unreachable
+        return (False, "No internet connection or cannot reach server."), False
+
+    except requests.Timeout:
+        return (False, "Request timed out."), False
+
+    except requests.RequestException:
+        return (False, "Something went wrong with the request :("), False
+
+
+def collect_crs_references(resources: dict) -> dict[str, list[CrsReference]]:
+    """Get CRS/TRS URIs of each resource (serialized as dictionaries): extents CRS and TRS,
+    providers' 'crs' lists and 'storage_crs'."""
+
+    references = {}
+    for res_name, res_data in resources.items():
+        if not isinstance(res_data, dict):
+            continue
+
+        res_references = []
+        extents = res_data.get("extents") or {}
+        _add_reference(
+            res_references,
+            "extents.spatial.crs",
+            (extents.get("spatial") or {}).get("crs"),
+        )
+        _add_reference(
+            res_references,
+            "extents.temporal.trs",
+            (extents.get("temporal") or {}).get("trs"),
+        )
+
+        for i, provider in enumerate(res_data.get("providers") or []):
+            if not isinstance(provider, dict):
+                continue
+            crs_list = provider.get("crs")
+            if isinstance(crs_list, list):
+                for j, crs in enumerate(crs_list):
+                    _add_reference(res_references, f"providers[{i}].crs[{j}]", crs)
+            else:
+                _add_reference(res_references, f"providers[{i}].crs", crs_list)
+            _add_reference(
+                res_references,
+                f"providers[{i}].storage_crs",
+                provider.get("storage_crs"),
+            )
+
+        references[res_name] = res_references
+
+    return references
+
+
+def validate_crs_references(
+    references: dict[str, list[CrsReference]],
+) -> dict[str, list[CrsReference]]:
+    """Check each unique URI once (in parallel, see 'check_crs_urls'), set the results to all references."""
+
+    results = check_crs_urls(
+        reference.url
+        for res_references in references.values()
+        for reference in res_references
+    )
+    for res_references in references.values():
+        for reference in res_references:
+            reference.valid, reference.message = results[reference.url]
+
+    return references
+
+
+def validate_crs_references_async(
+    references: dict[str, list[CrsReference]],
+) -> Future:
+    """Validate the references in a background thread; the Future result is the validated references.
+    The thread is not taken from the pool, as it waits for the checks running in the pool.
+    """
+
+    future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(validate_crs_references(references))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="crs_validation", daemon=True).start()
+    return future
+
+
+def _add_reference(references: list[CrsReference], path: str, url):
+    if isinstance(url, str) and url.strip():
+        references.append(CrsReference(path=path, url=url.strip()))
@@ -1,13 +1,23 @@
 from datetime import datetime
+import json
 from typing import Any
 
 from .helper_functions import datetime_to_string
 
+# list items (dicts) are matched by these properties, depending on the list property name
+LIST_ITEM_KEYS = {
+    "providers": ("type", "name", "data"),
+    "links": ("href", "rel"),
+}
+
+# above this size (len(list1) * len(list2)), unkeyed lists are compared by position
+MAX_LIST_ALIGNMENT_SIZE = 250_000
+
 
 def diff_yaml_dict(obj1: dict, obj2: dict) -> dict:
-    """Returns all added, removed or changed elements between 2 dictionaries."""
+    """Returns all added, removed, changed or moved elements between 2 dictionaries."""
 
-    diff_data = {"added": {}, "removed": {}, "changed": {}}
+    diff_data = {"added": {}, "removed": {}, "changed": {}, "moved": {}}
     diff_obj(obj1, obj2, diff_data, "")
 
     # Exclude removed values that are None - not important
@@ -47,33 +57,36 @@ def diff_yaml_dict_remove_known_faulty_fields(
 
 def diff_obj(obj1: Any, obj2: Any, diff: dict, path: str = "") -> dict:
     """Returns all added, removed or changed elements between 2 objects.
-    Ignores diff in dict keys order. For lists, order is checked."""
+    Ignores diff in dict keys order. List items are matched by key (see LIST_ITEM_KEYS) or aligned
+    by the longest common subsequence, so that inserted, deleted or moved items don't change the following ones.
+    Equal subtrees (e.g. unchanged resources) are skipped without recursion,
+    differences are collected directly into 'diff'."""
 
     if isinstance(obj1, dict) and isinstance(obj2, dict):
-        all_keys = set(obj1.keys()) | set(obj2.keys())
-        for key in all_keys:
+        if _same_subtree(obj1, obj2):
+            return diff
+
+        for key in obj1.keys() | obj2.keys():
             new_path = f"{path}.{key}" if path else key
             if key not in obj1:
                 diff["added"][new_path] = obj2[key]
             elif key not in obj2:
                 diff["removed"][new_path] = obj1[key]
             else:
-                nested = diff_obj(obj1[key], obj2[key], diff, new_path)
-                for k in diff:
-                    diff[k].update(nested[k])
+                diff_obj(obj1[key], obj2[key], diff, new_path)
 
     elif isinstance(obj1, list) and isinstance(obj2, list):
-        max_len = max(len(obj1), len(obj2))
-        for i in range(max_len):
-            new_path = f"{path}[{i}]"
-            if i >= len(obj1):
-                diff["added"][new_path] = obj2[i]
-            elif i >= len(obj2):
-                diff["removed"][new_path] = obj1[i]
-            else:
-                nested = diff_obj(obj1[i], obj2[i], diff, new_path)
-                for k in diff:
-                    diff[k].update(nested[k])
+        if _same_subtree(obj1, obj2):
+            return diff
+
+        key_props = LIST_ITEM_KEYS.get(path.rsplit(".", 1)[-1])
+        matched_indices = (
+            _match_list_items_by_key(obj1, obj2, key_props) if key_props else None
+        )
+        if matched_indices is not None:
+            _diff_keyed_lists(obj1, obj2, matched_indices, diff, path)
+        else:
+            _diff_aligned_lists(obj1, obj2, diff, path)
 
     else:
         if obj1 != obj2:
@@ -98,3 +111,161 @@ def diff_obj(obj1: Any, obj2: Any, diff: dict, path: str = "") -> dict:
             diff["changed"][path] = {"old": obj1, "new": obj2}
 
     return diff
+
+
+def _same_subtree(obj1: dict | list, obj2: dict | list) -> bool:
+    """Check if 2 subtrees are equal: shared objects by identity, otherwise
+    with the builtin deep comparison (no Python-level recursion)."""
+    return obj1 is obj2 or obj1 == obj2
+
+
+def _diff_keyed_lists(
+    obj1: list,
+    obj2: list,
+    matched_indices: list[tuple[int, int]],
+    diff: dict,
+    path: str,
+):
+    """Diff lists with items matched by key: report unmatched items as removed/added,
+    matched items that changed their relative order as moved, and recurse into matched items.
+    """
+
+    diff.setdefault("moved", {})
+    matched1 = {i for i, _ in matched_indices}
+    matched2 = {j for _, j in matched_indices}
+    for i, item in enumerate(obj1):
+        if i not in matched1:
+            diff["removed"][f"{path}[{i}]"] = item
+    for j, item in enumerate(obj2):
+        if j not in matched2:
+            diff["added"][f"{path}[{j}]"] = item
+
+    # items staying in the longest common order are not moved (only shifted by inserts/deletes)
+    matched_indices.sort(key=lambda pair: pair[1])
+    in_order = _longest_increasing_subsequence([i for i, _ in matched_indices])
+    for n, (i, j) in enumerate(matched_indices):
+        if n not in in_order:
+            diff["moved"][f"{path}[{j}]"] = {"from": i, "to": j}
+        diff_obj(obj1[i], obj2[j], diff, f"{path}[{j}]")
+
+
+def _diff_aligned_lists(obj1: list, obj2: list, diff: dict, path: str):
+    """Diff lists aligned by the longest common subsequence of equal items.
+    Unequal items between the aligned ones are compared by position, the rest are added or removed.
+    """
+
+    if len(obj1) * len(obj2) > MAX_LIST_ALIGNMENT_SIZE:
+        anchors = []
+    else:
+        anchors = _longest_common_subsequence(obj1, obj2)
+
+    start1 = start2 = 0
+    for end1, end2 in anchors + [(len(obj1), len(obj2))]:
+        gap = min(end1 - start1, end2 - start2)
+        for k in range(gap):
+            diff_obj(obj1[start1 + k], obj2[start2 + k], diff, f"{path}[{start2 + k}]")
+        for i in range(start1 + gap, end1):
+            diff["removed"][f"{path}[{i}]"] = obj1[i]
+        for j in range(start2 + gap, end2):
+            diff["added"][f"{path}[{j}]"] = obj2[j]
+        start1, start2 = end1 + 1, end2 + 1
+
+
+def _match_list_items_by_key(
+    obj1: list, obj2: list, key_props: tuple[str, ...]
+) -> list[tuple[int, int]] | None:
+    """Pairs of (obj1 index, obj2 index) of items with equal key properties.
+    None if items are not dicts, or if keys are not unique in either list."""
+
+    keys1 = _list_item_keys(obj1, key_props)
+    keys2 = _list_item_keys(obj2, key_props)
+    if keys1 is None or keys2 is None:
+        return None
+
+    return [(i, keys2[key]) for key, i in keys1.items() if key in keys2]
+
+
+def _list_item_keys(items: list, key_props: tuple[str, ...]) -> dict[str, int] | None:
+    keys = {}
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            return None
+        key = json.dumps(
+            [item.get(prop) for prop in key_props], sort_keys=True, default=str
+        )
+        if key in keys:
+            return None
+        keys[key] = i
+    return keys
+
+
+def _longest_common_subsequence(obj1: list, obj2: list) -> list[tuple[int, int]]:
+    """Index pairs of the longest common subsequence of equal items."""
+
+    # common prefix and suffix don't need the dynamic programming table
+    prefix = 0
+    while prefix < min(len(obj1), len(obj2)) and obj1[prefix] == obj2[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < min(len(obj1), len(obj2)) - prefix
+        and obj1[-1 - suffix] == obj2[-1 - suffix]
+    ):
+        suffix += 1
+
+    middle1 = obj1[prefix : len(obj1) - suffix]
+    middle2 = obj2[prefix : len(obj2) - suffix]
+
+    # lengths[i][j]: LCS length of middle1[i:] and middle2[j:]
+    lengths = [[0] * (len(middle2) + 1) for _ in range(len(middle1) + 1)]
+    for i in range(len(middle1) - 1, -1, -1):
+        for j in range(len(middle2) - 1, -1, -1):
+            if middle1[i] == middle2[j]:
+                lengths[i][j] = lengths[i + 1][j + 1] + 1
+            else:
+                lengths[i][j] = max(lengths[i + 1][j], lengths[i][j + 1])
+
+    pairs = [(k, k) for k in range(prefix)]
+    i = j = 0
+    while i < len(middle1) and j < len(middle2):
+        if middle1[i] == middle2[j]:
+            pairs.append((prefix + i, prefix + j))
+            i += 1
+            j += 1
+        elif lengths[i + 1][j] >= lengths[i][j + 1]:
+            i += 1
+        else:
+            j += 1
+    pairs.extend(
+        (len(obj1) - suffix + k, len(obj2) - suffix + k) for k in range(suffix)
+    )
+    return pairs
+
+
+def _longest_increasing_subsequence(values: list[int]) -> set[int]:
+    """Positions (in 'values') of the longest strictly increasing subsequence."""
+
+    # tails[k]: position of the smallest tail value of an increasing subsequence of length k+1
+    tails = []
+    previous = [-1] * len(values)
+    for n, value in enumerate(values):
+        low, high = 0, len(tails)
+        while low < high:
+            middle = (low + high) // 2
+            if values[tails[middle]] < value:
+                low = middle + 1
+            else:
+                high = middle
+        if low > 0:
+            previous[n] = tails[low - 1]
+        if low == len(tails):
+            tails.append(n)
+        else:
+            tails[low] = n
+
+    positions = set()
+    n = tails[-1] if tails else -1
+    while n >= 0:
+        positions.add(n)
+        n = previous[n]
+    return positions
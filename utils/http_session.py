@@ -0,0 +1,28 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# connections kept open per host
+POOL_MAXSIZE = 10
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Shared requests.Session (admin API, URL checks), so that connections and TLS sessions
+    are reused between requests instead of being opened for every call."""
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+
+    return _session
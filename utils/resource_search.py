@@ -0,0 +1,221 @@
+from bisect import bisect_left
+import re
+from typing import Any, Iterable
+
+from .spatial_index import Bbox, BboxIndex
+
+# searchable resource properties; provider name, table and data are searched together as 'provider'
+SEARCH_FIELDS = ("name", "title", "description", "keywords", "provider")
+PROVIDER_SEARCH_PROPERTIES = ("name", "table", "data")
+
+# words, also split at underscores (e.g. in resource names)
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+_FIELD_TERM_PATTERN = re.compile(r"(\w+):(\S*)")
+
+
+def tokenize(value) -> set[str]:
+    """Lowercase words of all strings in the value (nested in dictionaries and lists, e.g. multilingual values)."""
+    tokens = set()
+    for text in _iter_strings(value):
+        tokens.update(_TOKEN_PATTERN.findall(text.lower()))
+    return tokens
+
+
+def get_search_tokens(name: str, resource_data: dict) -> dict[str, set[str]]:
+    """Tokens of the resource by search field."""
+    providers = resource_data.get("providers") or []
+    return {
+        "name": tokenize(name),
+        "title": tokenize(resource_data.get("title")),
+        "description": tokenize(resource_data.get("description")),
+        "keywords": tokenize(resource_data.get("keywords")),
+        "provider": tokenize(
+            [
+                provider.get(property)
+                for provider in providers
+                if isinstance(provider, dict)
+                for property in PROVIDER_SEARCH_PROPERTIES
+            ]
+        ),
+    }
+
+
+def get_bbox(resource_data: dict) -> Bbox | None:
+    """2D bbox (minx, miny, maxx, maxy) of the resource spatial extents, None if missing or invalid."""
+    extents = resource_data.get("extents")
+    spatial = extents.get("spatial") if isinstance(extents, dict) else None
+    bbox = spatial.get("bbox") if isinstance(spatial, dict) else None
+    try:
+        if len(bbox) == 4:
+            return tuple(float(v) for v in bbox)
+        if len(bbox) == 6:
+            return float(bbox[0]), float(bbox[1]), float(bbox[3]), float(bbox[4])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+class ResourceSearchIndex:
+    """Inverted index of resource properties (see SEARCH_FIELDS), for searching resources while typing.
+
+    Query terms are matched as word prefixes, case-insensitive, and all terms must match. Terms can be limited
+    to a field ('provider:PostgreSQL', 'title:lakes'), and 'bbox:minx,miny,maxx,maxy' matches resources
+    with intersecting spatial extents (see BboxIndex). The index is updated per resource when resources are edited.
+    """
+
+    def __init__(self):
+        self._clear()
+
+    def _clear(self):
+        # field: token: resource names
+        self._postings: dict[str, dict[str, set[str]]] = {f: {} for f in SEARCH_FIELDS}
+        # field: sorted tokens, for prefix search; rebuilt on the next search after a change
+        self._sorted_tokens: dict[str, list[str] | None] = {
+            f: None for f in SEARCH_FIELDS
+        }
+        # indexed tokens and bbox of each resource, to remove them on update
+        self._resource_tokens: dict[str, dict[str, set[str]]] = {}
+        self._bboxes: dict[str, Bbox | None] = {}
+        # R-tree of the bboxes; rebuilt on the next spatial search after a change
+        self._bbox_index: BboxIndex | None = None
+
+    def build(self, resources: Iterable[tuple[str, dict]]):
+        """Index all resources, given as (name, plain data dictionary)."""
+        self._clear()
+        for name, resource_data in resources:
+            self.update_resource(name, resource_data)
+
+    def __len__(self) -> int:
+        return len(self._resource_tokens)
+
+    def __contains__(self, name) -> bool:
+        return name in self._resource_tokens
+
+    def update_resource(self, name: str, resource_data: Any):
+        """Add or re-index the resource."""
+        self.remove_resource(name)
+        if not isinstance(resource_data, dict):
+            resource_data = {}
+
+        tokens = get_search_tokens(name, resource_data)
+        for field, field_tokens in tokens.items():
+            postings = self._postings[field]
+            for token in field_tokens:
+                if token not in postings:
+                    postings[token] = set()
+                    self._sorted_tokens[field] = None
+                postings[token].add(name)
+
+        self._resource_tokens[name] = tokens
+        self._bboxes[name] = get_bbox(resource_data)
+        self._bbox_index = None
+
+    def remove_resource(self, name: str):
+        tokens = self._resource_tokens.pop(name, None)
+        if tokens is None:
+            return
+        del self._bboxes[name]
+        self._bbox_index = None
+
+        for field, field_tokens in tokens.items():
+            postings = self._postings[field]
+            for token in field_tokens:
+                names = postings[token]
+                names.discard(name)
+                if not names:
+                    del postings[token]
+                    self._sorted_tokens[field] = None
+
+    def rename_resource(self, old_name: str, new_name: str, resource_data: Any):
+        self.remove_resource(old_name)
+        self.update_resource(new_name, resource_data)
+
+    def search(self, query: str) -> set[str] | None:
+        """Names of the resources matching all query terms; None for an empty query (no filter)."""
+        terms = query.split()
+        if not terms:
+            return None
+
+        result = None
+        for term in terms:
+            matches = self._match_term(term)
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+
+    def _match_term(self, term: str) -> set[str]:
+        field_match = _FIELD_TERM_PATTERN.fullmatch(term)
+        if field_match is not None:
+            field, value = field_match.group(1).lower(), field_match.group(2)
+            if field == "bbox":
+                return self._match_bbox(value)
+            if field in self._postings:
+                fields = (field,)
+                term = value
+            else:
+                # not a field name, e.g. a URL: search the whole term
+                fields = SEARCH_FIELDS
+        else:
+            fields = SEARCH_FIELDS
+
+        # every word of the term, e.g. of 'lakes-2024', is a prefix to match
+        words = _TOKEN_PATTERN.findall(term.lower())
+        if not words:
+            # field prefix only, e.g. 'provider:' while typing
+            return set(self._resource_tokens)
+
+        result = None
+        for word in words:
+            matches = set()
+            for field in fields:
+                matches.update(self._match_prefix(field, word))
+            result = matches if result is None else result & matches
+        return result
+
+    def _match_prefix(self, field: str, prefix: str) -> set[str]:
+        sorted_tokens = self._sorted_tokens[field]
+        if sorted_tokens is None:
+            sorted_tokens = self._sorted_tokens[field] = sorted(self._postings[field])
+
+        postings = self._postings[field]
+        matches = set()
+        i = bisect_left(sorted_tokens, prefix)
+        while i < len(sorted_tokens) and sorted_tokens[i].startswith(prefix):
+            matches.update(postings[sorted_tokens[i]])
+            i += 1
+        return matches
+
+    def _match_bbox(self, value: str) -> set[str]:
+        """Resources intersecting 'minx,miny,maxx,maxy'; no matches if the value is incomplete."""
+        try:
+            minx, miny, maxx, maxy = (float(v) for v in value.split(","))
+        except ValueError:
+            return set()
+        return self.find_intersecting((minx, miny, maxx, maxy))
+
+    def find_intersecting(self, bbox: Bbox) -> set[str]:
+        """Names of the resources with bbox intersecting the given bbox."""
+        if self._bbox_index is None:
+            self._bbox_index = BboxIndex(
+                (name, bbox) for name, bbox in self._bboxes.items() if bbox is not None
+            )
+        return set(self._bbox_index.intersecting(bbox))
+
+    def get_resource_bbox(self, name: str) -> Bbox | None:
+        return self._bboxes.get(name)
+
+    def get_bboxes(self) -> dict[str, Bbox]:
+        """Bboxes of all indexed resources that have a valid bbox."""
+        return {name: bbox for name, bbox in self._bboxes.items() if bbox is not None}
+
+
+def _iter_strings(value) -> Iterable[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _iter_strings(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _iter_strings(v)
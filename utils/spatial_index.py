@@ -0,0 +1,94 @@
+from math import ceil, sqrt
+from typing import Any, Iterable
+
+# (minx, miny, maxx, maxy), minx > maxx if the bbox crosses the antimeridian
+Bbox = tuple[float, float, float, float]
+
+# maximum number of entries or child nodes in a tree node
+NODE_CAPACITY = 16
+
+
+class BboxIndex:
+    """Static R-tree of bounding boxes, bulk-loaded with Sort-Tile-Recursive (STR) packing.
+    Bboxes crossing the antimeridian are indexed as 2 boxes (see 'split_antimeridian').
+    Rebuild the index to add or remove entries."""
+
+    def __init__(self, entries: Iterable[tuple[Any, Bbox]] = ()):
+        # entries: (bbox, None, key), nodes: (bbox, children, None)
+        entries = list(entries)
+        nodes = [
+            (part, None, key)
+            for key, bbox in entries
+            for part in split_antimeridian(tuple(bbox))
+        ]
+        self._size = len(entries)
+
+        # pack entries into leaf nodes, then each level into the level above, until a few root nodes remain
+        nodes = _pack(nodes)
+        while len(nodes) > NODE_CAPACITY:
+            nodes = _pack(nodes)
+        self._roots = nodes
+
+    def __len__(self) -> int:
+        return self._size
+
+    def intersecting(self, bbox: Bbox) -> list:
+        """Keys of the entries intersecting (or touching) the bbox, each key once."""
+        keys = {}
+        for minx, miny, maxx, maxy in split_antimeridian(tuple(bbox)):
+            stack = list(self._roots)
+            while stack:
+                node_bbox, children, key = stack.pop()
+                if (
+                    node_bbox[0] > maxx
+                    or node_bbox[2] < minx
+                    or node_bbox[1] > maxy
+                    or node_bbox[3] < miny
+                ):
+                    continue
+                if children is None:
+                    keys[key] = None
+                else:
+                    stack.extend(children)
+        return list(keys)
+
+
+def split_antimeridian(bbox: Bbox) -> list[Bbox]:
+    """Bbox crossing the antimeridian (minx > maxx, as allowed in OGC API extents) as 2 boxes,
+    east and west of it; other bboxes as they are."""
+    minx, miny, maxx, maxy = bbox
+    if minx <= maxx:
+        return [bbox]
+    return [(minx, miny, 180.0, maxy), (-180.0, miny, maxx, maxy)]
+
+
+def _pack(nodes: list) -> list:
+    return [(_union(group), group, None) for group in _str_groups(nodes)]
+
+
+def _str_groups(nodes: list) -> list[list]:
+    """Split the nodes into groups of NODE_CAPACITY: vertical slices by the center x, then by the center y."""
+    if not nodes:
+        return []
+
+    leaves_count = ceil(len(nodes) / NODE_CAPACITY)
+    slice_size = ceil(sqrt(leaves_count)) * NODE_CAPACITY
+
+    nodes = sorted(nodes, key=lambda node: node[0][0] + node[0][2])
+    groups = []
+    for i in range(0, len(nodes), slice_size):
+        vertical_slice = sorted(
+            nodes[i : i + slice_size], key=lambda node: node[0][1] + node[0][3]
+        )
+        for j in range(0, len(vertical_slice), NODE_CAPACITY):
+            groups.append(vertical_slice[j : j + NODE_CAPACITY])
+    return groups
+
+
+def _union(nodes: list) -> Bbox:
+    return (
+        min(node[0][0] for node in nodes),
+        min(node[0][1] for node in nodes),
+        max(node[0][2] for node in nodes),
+        max(node[0][3] for node in nodes),
+    )
@@ -0,0 +1,139 @@
+from datetime import datetime
+from typing import Any, Iterator
+
+import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+
+from .helper_functions import datetime_to_string
+from ..models.top_level.utils import InlineList
+
+# prefer the libyaml bindings (several times faster), fall back to the pure-Python implementation
+try:
+    from yaml.cyaml import CParser, CSafeDumper as _BaseSafeDumper
+    from yaml import CSafeLoader as SafeLoader
+
+    YAML_BACKEND = "libyaml"
+
+    class StreamingSafeLoader(CParser, Composer, SafeConstructor, Resolver):
+        """Safe loader reading libyaml events, with the Python composer (not exposed by CParser),
+        so that single nodes can be composed from the event stream."""
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+except ImportError:
+    from yaml import SafeLoader, SafeDumper as _BaseSafeDumper
+
+    YAML_BACKEND = "python"
+
+    StreamingSafeLoader = SafeLoader
+
+
+class ConfigDumper(_BaseSafeDumper):
+    """Safe dumper with representers for the config data types."""
+
+    pass
+
+
+# make sure InlineList is represented as a YAML sequence (e.g. for 'bbox')
+ConfigDumper.add_representer(
+    InlineList,
+    lambda dumper, data: dumper.represent_sequence(
+        "tag:yaml.org,2002:seq", data, flow_style=True
+    ),
+)
+
+
+# make sure datetime items are not saved as strings with quotes
+def represent_datetime_as_timestamp(dumper, data: datetime):
+    value = datetime_to_string(data)
+
+    # emit as YAML timestamp → plain scalar, no quotes
+    return dumper.represent_scalar("tag:yaml.org,2002:timestamp", value)
+
+
+ConfigDumper.add_representer(datetime, represent_datetime_as_timestamp)
+
+
+def load_yaml(stream) -> Any:
+    """Load YAML document from a string or file, using the active backend."""
+    return yaml.load(stream, Loader=SafeLoader)  # nosec: safe loader
+
+
+def dump_yaml(data, stream=None) -> str | None:
+    """Write the config data as YAML (or return a string if no stream), using the active backend."""
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=ConfigDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        indent=4,
+    )
+
+
+def iter_yaml_config_sections(
+    stream, loader_class=StreamingSafeLoader
+) -> Iterator[tuple[str, str | None, Any]]:
+    """Parse the YAML config document one top-level section at a time.
+
+    Yields (section_name, None, data) for the top-level sections (e.g. 'server', 'logging', 'metadata'),
+    and (section_name, resource_name, data) for every entry under 'resources', as soon as it is parsed.
+    Only the YAML nodes of the current entry are kept in memory.
+    """
+    loader = loader_class(stream)
+    try:
+        # StreamStartEvent
+        loader.get_event()
+        if loader.check_event(yaml.StreamEndEvent):
+            return
+
+        # DocumentStartEvent
+        loader.get_event()
+        if not loader.check_event(yaml.MappingStartEvent):
+            raise yaml.YAMLError(
+                "Expected a mapping with top-level config sections (server, logging, metadata, resources)"
+            )
+        loader.get_event()
+
+        while not loader.check_event(yaml.MappingEndEvent):
+            section_name = _construct_next_node(loader)
+
+            if section_name == "resources" and loader.check_event(
+                yaml.MappingStartEvent
+            ):
+                loader.get_event()
+                while not loader.check_event(yaml.MappingEndEvent):
+                    resource_name = _construct_next_node(loader)
+                    yield section_name, resource_name, _construct_next_node(loader)
+                loader.get_event()
+            else:
+                yield section_name, None, _construct_next_node(loader)
+
+    finally:
+        loader.dispose()
+
+
+def iter_dict_config_sections(
+    dict_content: dict,
+) -> Iterator[tuple[str, str | None, Any]]:
+    """Yield the sections of an already loaded config dictionary, same as 'iter_yaml_config_sections'."""
+    for section_name, data in dict_content.items():
+        if section_name == "resources" and isinstance(data, dict):
+            for resource_name, resource_data in data.items():
+                yield section_name, resource_name, resource_data
+        else:
+            yield section_name, None, data
+
+
+def _construct_next_node(loader) -> Any:
+    """Compose the next YAML node from the event stream and construct the Python object from it.
+    Constructed objects are not kept by the loader after the call."""
+    node = loader.compose_node(None, None)
+    return loader.construct_document(node)